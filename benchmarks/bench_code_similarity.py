@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Benchmark lexical similarity backends on large transformed outputs
+
+Compares difflib.SequenceMatcher with the MinHash backend on two ~5k-line
+files that differ by a fraction of edited lines.
+
+Usage:
+    python -m benchmarks.bench_code_similarity [--lines 5000] [--skip-exact]
+"""
+
+import argparse
+import difflib
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from infrastructure.code_similarity import MinHashSimilarity
+
+
+def build_outputs(num_lines: int, edit_fraction: float, seed: int = 7):
+    """Build a pair of synthetic code outputs of num_lines lines"""
+    source = (ROOT / "infrastructure" / "consensus_engine.py").read_text(encoding="utf-8").splitlines()
+    lines = [source[i % len(source)] for i in range(num_lines)]
+
+    rng = random.Random(seed)
+    edited = list(lines)
+    for _ in range(int(num_lines * edit_fraction)):
+        i = rng.randrange(len(edited))
+        if rng.random() < 0.5:
+            edited[i] = edited[i].replace("self", "this")
+        else:
+            edited[i] = rng.choice(lines)
+    return "\n".join(lines), "\n".join(edited)
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    value = fn(*args)
+    return value, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lines", type=int, default=5000)
+    parser.add_argument("--edit-fraction", type=float, default=0.05)
+    parser.add_argument("--precision", type=int, nargs="+", default=[64, 128, 256])
+    parser.add_argument("--skip-exact", action="store_true", help="skip the (slow) SequenceMatcher run")
+    args = parser.parse_args()
+
+    code1, code2 = build_outputs(args.lines, args.edit_fraction)
+    print(f"📏 {args.lines} lines, {len(code1) + len(code2)} chars total")
+
+    if not args.skip_exact:
+        score, elapsed = timed(lambda a, b: difflib.SequenceMatcher(None, a, b).ratio(), code1, code2)
+        print(f"  sequence_matcher          score={score:.3f}  time={elapsed * 1000:9.1f} ms")
+
+    for num_hashes in args.precision:
+        backend = MinHashSimilarity(num_hashes=num_hashes)
+        score, elapsed = timed(backend.similarity, code1, code2)
+        print(f"  minhash (k={num_hashes:<4})          score={score:.3f}  time={elapsed * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
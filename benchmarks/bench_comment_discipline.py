@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark CommentParser.validate_discipline from 1k to 1M lines
+
+Generates source with a mix of code, sacred comments and naked comments at
+each size and times a fresh validate_discipline call, showing the cost per
+line stays flat (linear scaling). The previous per-candidate
+any(c.line_number == ...) scan is timed for the smaller sizes for comparison.
+
+Usage:
+    python -m benchmarks.bench_comment_discipline [--max-lines 1000000] [--legacy-max 20000]
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.comment_parser import CommentParser
+
+LINES = [
+    "    total = compute(values)",
+    "# naked python comment",
+    "// naked c comment",
+    "//! requires quorum",
+    "#//-> chose sqlite for locality",
+    "🛡️ never remove this check",
+    "return total",
+    "",
+    "//* emergent: agents batch votes",
+]
+
+
+def build_text(num_lines: int, rng: random.Random) -> str:
+    return "\n".join(rng.choice(LINES) for _ in range(num_lines))
+
+
+def legacy_naked(parser: CommentParser, text: str) -> int:
+    """Naked-comment scan before the sacred line set: O(lines x sacred comments)"""
+    sacred_comments = parser.parse_text(text)
+    naked_pattern = re.compile(r'^\s*(?:#|//)\s+\w+')
+    naked = 0
+    for line_num, line in enumerate(text.split('\n'), start=1):
+        if naked_pattern.match(line) and not any(c.line_number == line_num for c in sacred_comments):
+            naked += 1
+    return naked
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--max-lines", type=int, default=1_000_000)
+    parser.add_argument("--legacy-max", type=int, default=20_000)
+    args = parser.parse_args()
+
+    rng = random.Random(43)
+    print("📜 validate_discipline scaling")
+    print(f"  {'lines':>9}  {'time':>9}  {'µs/line':>8}  {'legacy':>9}")
+    size = 1000
+    while size <= args.max_lines:
+        text = build_text(size, rng)
+        start = time.perf_counter()
+        report = CommentParser().validate_discipline(text)
+        elapsed = time.perf_counter() - start
+
+        legacy = ""
+        if size <= args.legacy_max:
+            start = time.perf_counter()
+            assert legacy_naked(CommentParser(), text) == report["naked_count"]
+            legacy = f"{time.perf_counter() - start:8.3f}s"
+        print(f"  {size:>9}  {elapsed:8.3f}s  {elapsed / size * 1e6:8.2f}  {legacy:>9}")
+        size *= 10
+
+
+if __name__ == "__main__":
+    main()
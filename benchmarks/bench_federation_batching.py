@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark FederationRouter request throughput against a local websockets stub
+
+Starts an echo server that understands batched frames, then measures
+requests/sec for concurrent _send_request calls with batching disabled and
+enabled.
+
+Usage:
+    python -m benchmarks.bench_federation_batching [--requests 20000] [--concurrency 200]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import websockets
+
+from infrastructure.federation_batching import HAS_ORJSON, FrameBatcher, decode_frame, encode_frame
+from infrastructure.federation_integration import FederationRequest, FederationRouter
+
+
+async def stub_server(ws, *args):
+    """Echo every request back as a successful response, batching replies per frame"""
+    async for frame in ws:
+        replies = [{"request_id": m["request_id"], "success": True, "data": {}}
+                   for m in decode_frame(frame)]
+        await ws.send(encode_frame(replies))
+
+
+async def measure(url: str, total: int, concurrency: int, batch_window: float) -> float:
+    router = FederationRouter(url, batch_window=batch_window)
+    router.connection = await websockets.connect(url)
+    router.connection_status = "connected"
+    if batch_window > 0:
+        router.batcher = FrameBatcher(router.connection.send, window=batch_window)
+    handler = asyncio.create_task(router._message_handler())
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int):
+        async with semaphore:
+            await router._send_request(FederationRequest(payload={"n": i}, timeout=30))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(total)))
+    elapsed = time.perf_counter() - start
+
+    handler.cancel()
+    await router.disconnect()
+    return total / elapsed
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--window", type=float, default=0.002)
+    args = parser.parse_args()
+
+    async with websockets.serve(stub_server, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        url = f"ws://127.0.0.1:{port}"
+        print(f"🛰️  {args.requests} requests, concurrency {args.concurrency}, orjson={HAS_ORJSON}")
+
+        rate = await measure(url, args.requests, args.concurrency, 0.0)
+        print(f"  unbatched          {rate:10.0f} req/s")
+
+        rate = await measure(url, args.requests, args.concurrency, args.window)
+        print(f"  batched ({args.window * 1000:.1f} ms)   {rate:10.0f} req/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Startup-time report for loading a large ritual tree
+
+Writes N ritual manifests into a temporary directory tree and times
+Grimoire.load: a serial parse with the pure-Python YAML loader (the old
+behaviour), a cold parallel parse, a warm load from the snapshot, and a
+warm load after one file changed.
+
+Usage:
+    python -m benchmarks.bench_grimoire_load [--rituals 5000]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from seraphina_grimoire.ritual_engine import RITUAL_GLOB, Grimoire, Ritual
+
+TEMPLATE = (ROOT / "seraphina_grimoire" / "rituals" / "SERAPHINA-RITUAL-TABLE-FLIP-V1.yaml").read_text(encoding="utf-8")
+
+
+def write_tree(root: Path, num_rituals: int):
+    for i in range(num_rituals):
+        directory = root / f"school_{i % 20:02d}"
+        directory.mkdir(exist_ok=True)
+        text = TEMPLATE.replace("SERAPHINA-RITUAL-TABLE-FLIP-V1", f"SERAPHINA-RITUAL-SYNTH-{i:05d}")
+        (directory / f"ritual_{i:05d}.yaml").write_text(text, encoding="utf-8")
+
+
+def serial_load(root: Path) -> int:
+    rituals = []
+    for p in root.glob(RITUAL_GLOB):
+        with open(p, "r", encoding="utf-8") as f:
+            data = yaml.safe_load(f)
+            if isinstance(data, dict):
+                rituals.append(Ritual(data))
+    return len(rituals)
+
+
+def timed_load(root: Path, **kwargs) -> Grimoire:
+    grimoire = Grimoire(root)
+    grimoire.load(**kwargs)
+    return grimoire
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rituals", type=int, default=5000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        write_tree(root, args.rituals)
+        print(f"📚 {args.rituals} ritual manifests")
+
+        start = time.perf_counter()
+        serial_load(root)
+        print(f"  {'serial safe_load':24s}{time.perf_counter() - start:7.2f} s")
+
+        for label, kwargs in (("cold (parse + snapshot)", {}), ("warm (snapshot)", {})):
+            stats = timed_load(root, **kwargs).load_stats
+            print(f"  {label:24s}{stats['seconds']:7.2f} s  parsed {stats['parsed']}, cached {stats['cached']}")
+
+        changed = next(root.glob(RITUAL_GLOB))
+        changed.write_text(changed.read_text(encoding="utf-8") + "\n# touched\n", encoding="utf-8")
+        stats = timed_load(root).load_stats
+        print(f"  {'warm, one file changed':24s}{stats['seconds']:7.2f} s  parsed {stats['parsed']}, cached {stats['cached']}")
+
+
+if __name__ == "__main__":
+    main()
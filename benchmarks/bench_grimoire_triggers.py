@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark Grimoire.scan_triggers on a large synthetic grimoire
+
+Builds N rituals (half dict triggers, half expression triggers) and scans M
+random contexts, comparing the indexed scan with evaluating every ritual's
+trigger per context (the pre-index behaviour, measured on a sample of
+contexts and extrapolated).
+
+Usage:
+    python -m benchmarks.bench_grimoire_triggers [--rituals 10000] [--contexts 10000]
+"""
+
+import argparse
+import contextlib
+import io
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from seraphina_grimoire.ritual_engine import Grimoire, Ritual
+
+
+def build_grimoire(num_rituals: int, rng: random.Random) -> Grimoire:
+    grimoire = Grimoire(ROOT)
+    for i in range(num_rituals):
+        if i % 2:
+            trigger = {"event": f"event_{rng.randrange(num_rituals)}", "phase": rng.choice(["plan", "run"])}
+        else:
+            trigger = f"metric_{rng.randrange(num_rituals)} >= {rng.randint(1, 9)}"
+        grimoire.rituals.append(Ritual({"id": f"RITUAL-{i}", "trigger": trigger}))
+    grimoire.build_index()
+    return grimoire
+
+
+def build_contexts(num_contexts: int, num_rituals: int, rng: random.Random):
+    return [
+        {
+            "event": f"event_{rng.randrange(num_rituals)}",
+            "phase": rng.choice(["plan", "run"]),
+            f"metric_{rng.randrange(num_rituals)}": rng.randint(0, 9),
+            "agent": "claude",
+        }
+        for _ in range(num_contexts)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rituals", type=int, default=10000)
+    parser.add_argument("--contexts", type=int, default=10000)
+    parser.add_argument("--baseline-sample", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    grimoire = build_grimoire(args.rituals, rng)
+    contexts = build_contexts(args.contexts, args.rituals, rng)
+
+    fired = 0
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        for context in contexts:
+            fired += len(grimoire.scan_triggers(context))
+        indexed = time.perf_counter() - start
+
+    sample = contexts[:args.baseline_sample]
+    start = time.perf_counter()
+    for context in sample:
+        for ritual in grimoire.rituals:
+            ritual.matches(context)
+    full_scan = (time.perf_counter() - start) / len(sample) * len(contexts)
+
+    print(f"📜 {args.rituals} rituals × {args.contexts} contexts, {fired} firings")
+    print(f"  full scan (est.) {full_scan:9.2f} s")
+    print(f"  indexed          {indexed:9.2f} s  ({full_scan / indexed:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
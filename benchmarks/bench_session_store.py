@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark KryssieMethodMemory.store_memory across storage backends
+
+Runs N store_memory calls spread across a set of sessions for the in-memory
+"local" backend and the SQLite write-behind backend, then reopens the SQLite
+database to confirm the history survived a restart.
+
+Usage:
+    python -m benchmarks.bench_session_store [--calls 100000] [--sessions 100]
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from infrastructure.federation_integration import KryssieMethodMemory
+
+
+async def run_backend(backend: str, calls: int, num_sessions: int, db_path: str = None) -> float:
+    memory = KryssieMethodMemory(storage_backend=backend, db_path=db_path)
+    session_ids = [await memory.create_session(f"user_{i}") for i in range(num_sessions)]
+
+    start = time.perf_counter()
+    for i in range(calls):
+        await memory.store_memory(session_ids[i % num_sessions], {
+            "type": "transformation",
+            "models_used": ["claude_sonnet", "gemini_pro"],
+            "quality_level": i % 10,
+            "source_language": "python",
+            "target_language": "typescript",
+            "success": i % 7 != 0,
+            "total_time": 1.5 + (i % 5),
+            "total_cost": 0.002
+        })
+    await memory.flush()
+    elapsed = time.perf_counter() - start
+
+    await memory.close()
+    return elapsed
+
+
+async def verify_restart(db_path: str, expected_history: int):
+    memory = KryssieMethodMemory(storage_backend="sqlite", db_path=db_path)
+    session_id = memory.store.connection.execute("SELECT session_id FROM sessions LIMIT 1").fetchone()[0]
+    context = await memory.get_context(session_id)
+    history = len(memory.sessions[session_id].interaction_history)
+    print(f"  restart: session {session_id[:8]} reloaded with {history} entries "
+          f"(expected {expected_history}), {len(context)} context fields")
+    await memory.close()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=100000)
+    parser.add_argument("--sessions", type=int, default=100)
+    args = parser.parse_args()
+
+    print(f"💾 {args.calls} store_memory calls over {args.sessions} sessions")
+
+    elapsed = await run_backend("local", args.calls, args.sessions)
+    print(f"  local   {elapsed:7.2f} s  {args.calls / elapsed:10.0f} calls/s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "bench_sessions.db")
+        elapsed = await run_backend("sqlite", args.calls, args.sessions, db_path)
+        print(f"  sqlite  {elapsed:7.2f} s  {args.calls / elapsed:10.0f} calls/s")
+        await verify_restart(db_path, min(args.calls // args.sessions, 1000))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
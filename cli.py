@@ -6,6 +6,7 @@ Entry point for the `codecraft` command-line tool
 Usage:
     codecraft run script.cc
     codecraft parse-vibes script.cc
+    codecraft parse-vibes src/ 'rituals/**/*.cc' --jsonl > vibes.jsonl
     codecraft version
 """
 
@@ -50,51 +51,70 @@ def run(file_path):
 
 
 @main.command()
-@click.argument('file_path', type=click.Path(exists=True))
-def parse_vibes(file_path):
-    """Parse Commentomancy vibes (Charter V1.1 Law & Lore)"""
-    click.echo(f"🔮 Parsing vibes from: {file_path}")
+@click.argument('targets', nargs=-1, required=True)
+@click.option('--jsonl', 'jsonl', is_flag=True, help='Stream one JSON object per file to stdout')
+@click.option('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+def parse_vibes(targets, jsonl, workers):
+    """Parse Commentomancy vibes (Charter V1.1 Law & Lore)
+
+    TARGETS may be files, directories (scanned recursively) or glob patterns.
+    """
+    import json
+    from .core.vibe_scanner import aggregate_stats, iter_source_files, scan_files
     
-    from .core.comment_parser_charter import CommentParser
+    files = iter_source_files(targets)
+    if not files:
+        click.echo(f"❌ Error: no source files found in {', '.join(targets)}", err=True)
+        sys.exit(1)
     
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        parser = CommentParser()
-        
+    if not jsonl:
+        click.echo(f"🔮 Parsing vibes from {len(files)} file(s)")
         click.echo("\n📜 Law & Lore Analysis:")
         click.echo("=" * 60)
-        
-        law_count = 0
-        lore_count = 0
-        guardrail_count = 0
-        
-        for i, line in enumerate(lines, 1):
-            parsed = parser.parse_line(line.strip())
-            if parsed:
-                if parsed.channel == "law":
-                    law_count += 1
-                    click.echo(f"📜 Line {i}: {parsed.name}")
-                    if parsed.council_oversight:
-                        click.echo(f"   ⚠️  GUARDRAIL - N.O.R.M.A. review required")
-                        guardrail_count += 1
-                else:
-                    lore_count += 1
-                    click.echo(f"💫 Line {i}: {parsed.name}")
-                
-                if parsed.export_to:
-                    click.echo(f"   → Export to: {parsed.export_to}")
-        
-        click.echo("=" * 60)
-        click.echo(f"\n📊 Summary:")
-        click.echo(f"  Law comments: {law_count}")
-        click.echo(f"  Lore comments: {lore_count}")
-        click.echo(f"  🛡️ Guardrails: {guardrail_count}")
+    
+    totals = aggregate_stats([])
+    out = click.get_text_stream('stdout')
+    try:
+        for result in scan_files(files, workers=workers):
+            aggregate_stats([result], totals)
+            
+            if jsonl:
+                out.write(json.dumps(result.to_dict(), ensure_ascii=False) + "\n")
+                continue
+            
+            if result.error:
+                click.echo(f"❌ {result.path}: {result.error}", err=True)
+                continue
+            if not result.comments:
+                continue
+            
+            # One write per file rather than one per line
+            lines = [f"\n📄 {result.path}"]
+            for comment in result.comments:
+                icon = "📜" if comment["channel"] == "law" else "💫"
+                lines.append(f"{icon} Line {comment['line']}: {comment['name']}")
+                if comment["council_oversight"]:
+                    lines.append("   ⚠️  GUARDRAIL - N.O.R.M.A. review required")
+                if comment["export_to"]:
+                    lines.append(f"   → Export to: {comment['export_to']}")
+            out.write("\n".join(lines) + "\n")
         
     except Exception as e:
         click.echo(f"❌ Error: {e}", err=True)
         sys.exit(1)
+    
+    if jsonl:
+        out.write(json.dumps({"summary": totals}) + "\n")
+    else:
+        click.echo("=" * 60)
+        click.echo(f"\n📊 Summary:")
+        click.echo(f"  Files scanned: {totals['files_scanned']}")
+        click.echo(f"  Law comments: {totals['law_comments_found']}")
+        click.echo(f"  Lore comments: {totals['lore_comments_found']}")
+        click.echo(f"  🛡️ Guardrails: {totals['guardrails_detected']}")
+    
+    if totals['files_failed']:
+        sys.exit(1)
 
 
 @main.command()
@@ -5,7 +5,7 @@ The sacred heart of ritual parsing and execution
 
 from .ritual_parser import RitualParser, RitualNode, RitualType
 from .ritual_executor import RitualExecutor
-from .comment_parser_charter import CommentParser, ParsedComment
+from .comment_parser_charter import CommentParser, CommentRecord, ParsedComment
 
 __all__ = [
     'RitualParser',
@@ -14,4 +14,5 @@ __all__ = [
     'RitualExecutor',
     'CommentParser',
     'ParsedComment',
+    'CommentRecord',
 ]
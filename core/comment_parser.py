@@ -28,11 +28,16 @@ Version: 1.1.0 - The Constitutional Order
 License: SERAPHINA-CHARTER
 """
 
+from bisect import bisect_right
 from enum import Enum
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
+from functools import cached_property
+from itertools import accumulate
+from typing import Optional, List, Dict, Any, Set, Tuple
 import re
 
+from .comment_parser_charter import PrefixTrie
+
 
 class ConsciousnessLevel(Enum):
     """The 9 levels of comment consciousness in CodeCraft"""
@@ -190,30 +195,116 @@ PREFIX_ORDER = [
 ]
 
 
+# Consciousness level and emoji for each Charter comment type
+LEVELS = {
+    'SACRED_TRUTH': (ConsciousnessLevel.SACRED, '📜'),
+    'GUARDRAIL': (ConsciousnessLevel.ETHICS, '🛡️'),
+    'RITUAL_PREREQ': (ConsciousnessLevel.RITUAL, '🔮'),
+    'STRATEGIC_DECISION': (ConsciousnessLevel.STRATEGIC, '🎯'),
+    'EMERGENT_PATTERN': (ConsciousnessLevel.COSMIC, '🌟'),
+    'HEART_IMPRINT': (ConsciousnessLevel.HEART, '💖'),
+    'RECURSIVE_AWARENESS': (ConsciousnessLevel.RECURSIVE, '🌀'),
+    'EVOLUTION_PRESSURE': (ConsciousnessLevel.PERFORMANCE, '⚡'),
+    'PRACTICAL_NOTE': (ConsciousnessLevel.SURFACE, '💬'),
+}
+
+LEVEL_ATTENTION = {
+    ConsciousnessLevel.SURFACE: ParserAttention.IGNORE,
+    ConsciousnessLevel.RITUAL: ParserAttention.VALIDATE,
+    ConsciousnessLevel.STRATEGIC: ParserAttention.VALIDATE,
+    ConsciousnessLevel.SACRED: ParserAttention.PRESERVE,
+    ConsciousnessLevel.HEART: ParserAttention.PRESERVE,
+    ConsciousnessLevel.COSMIC: ParserAttention.ENFORCE,
+    ConsciousnessLevel.RECURSIVE: ParserAttention.ENFORCE,
+    ConsciousnessLevel.PERFORMANCE: ParserAttention.OPTIMIZE,
+    ConsciousnessLevel.ETHICS: ParserAttention.HARD_BLOCK,
+}
+
+# A comment line that is not sacred unless the parser recognised its prefix
+NAKED_PATTERN = re.compile(r'^[^\S\n]*(?:#|//)[^\S\n]+\w[^\n]*', re.MULTILINE)
+
+# Emoji are accepted with or without the emoji presentation selector
+VARIATION_SELECTOR = '\ufe0f'
+
+
+class ParseResult:
+    """
+    Every sacred comment in one text, found in a single pass
+    
+    Keeps a line-offset index of the text so match offsets map to line
+    numbers by binary search, and the set of line numbers holding sacred
+    comments; the find_* views are computed once on demand.
+    """
+    
+    def __init__(self, text: str):
+        self.text = text
+        # Offset of the first character of every line (each line length plus its newline)
+        self.line_starts = list(accumulate(map((1).__add__, map(len, text.split('\n'))), initial=0))
+        self.comments: List[CommentMetadata] = []
+        self.sacred_lines: Set[int] = set()
+    
+    def line_number(self, offset: int) -> int:
+        """1-based line number of a character offset"""
+        return bisect_right(self.line_starts, offset)
+    
+    @cached_property
+    def ethics_gates(self) -> List[CommentMetadata]:
+        return [c for c in self.comments if c.consciousness_level == ConsciousnessLevel.ETHICS]
+    
+    @cached_property
+    def lore_exports(self) -> List[CommentMetadata]:
+        return [c for c in self.comments if c.export_to_lore]
+    
+    @cached_property
+    def evolution_markers(self) -> List[CommentMetadata]:
+        return [c for c in self.comments if c.track_evolution]
+
+
 class CommentParser:
     """
     Deterministic parser for Sacred Comment Syntax (Commentomancy)
     
     Unlike vibe_parser.py (probabilistic), this enforces EXACT matching.
     No vibes. Just law.
+    
+    A whole text is parsed with one multiline regex pass and the result is
+    cached, so parse_text, the find_* queries and validate_discipline on
+    the same text share a single parse.
     """
     
     def __init__(self):
         self.comment_types = COMMENT_TYPES
+        self._last_result: Optional[ParseResult] = None
         self._compile_patterns()
     
     def _compile_patterns(self):
-        """Compile regex patterns for efficient matching"""
-        self.patterns = {}
+        """Compile one regex matching every prefix (text or emoji) at the start of a line"""
+        # Accepted prefix -> the CommentMetadata fields it determines
+        self.prefixes: Dict[str, Tuple[Any, ...]] = {}
+        for prefix, spec in {**COMMENT_TYPES, **HASH_COMMENT_TYPES}.items():
+            level, emoji = LEVELS[spec['name']]
+            attention = LEVEL_ATTENTION[level]
+            flags = (
+                spec.get('council_oversight', False),
+                attention == ParserAttention.PRESERVE,
+                attention == ParserAttention.ENFORCE
+            )
+            self.prefixes[prefix] = (level, attention, None, prefix) + flags
+            bare_emoji = emoji.replace(VARIATION_SELECTOR, '')
+            for variant in (bare_emoji, bare_emoji + VARIATION_SELECTOR):
+                self.prefixes[variant] = (level, attention, emoji, None) + flags
         
-        for level_name, spec in self.comment_types.items():
-            emoji = spec["emoji"]
-            text_prefix = spec["text_prefix"]
-            
-            # Pattern: emoji at start OR text prefix at start
-            # Captures the content after the prefix
-            pattern = rf'^(?:{re.escape(emoji)}|{re.escape(text_prefix)})\s*(.+?)$'
-            self.patterns[level_name] = re.compile(pattern, re.MULTILINE)
+        # The prefix trie takes the longest prefix, so '//!?' wins over '//!' and '//'
+        alternation = PrefixTrie(self.prefixes).alternation
+        self.pattern = re.compile(
+            rf'^[^\S\n]*({alternation})[^\S\n]*(\S(?:[^\n]*\S)?)[^\S\n]*$',
+            re.MULTILINE
+        )
+    
+    def _metadata(self, raw_text: str, prefix: str, content: str, line_number: int) -> CommentMetadata:
+        level, attention, emoji, text_prefix, review, lore, evolution = self.prefixes[prefix]
+        return CommentMetadata(raw_text, level, attention, emoji, text_prefix, content,
+                               line_number, review, lore, evolution)
     
     def parse_line(self, line: str, line_number: int) -> Optional[CommentMetadata]:
         """
@@ -222,73 +313,48 @@ class CommentParser:
         Returns CommentMetadata if line matches a consciousness level,
         None if it's regular code or unrecognized comment
         """
-        stripped = line.strip()
-        if not stripped:
+        match = self.pattern.match(line)
+        if not match:
             return None
+        return self._metadata(line, match.group(1), match.group(2), line_number)
+    
+    def parse(self, text: str) -> ParseResult:
+        """Parse text in one pass, reusing the previous result for the same text"""
+        cached = self._last_result
+        if cached is not None and (cached.text is text or cached.text == text):
+            return cached
         
-        # Try to match each consciousness level
-        for level_name, pattern in self.patterns.items():
-            match = pattern.match(stripped)
-            if match:
-                spec = self.comment_types[level_name]
-                content = match.group(1).strip()
-                
-                # Determine which prefix was used
-                emoji_prefix = spec["emoji"] if stripped.startswith(spec["emoji"]) else None
-                text_prefix = spec["text_prefix"] if stripped.startswith(spec["text_prefix"]) else None
-                
-                return CommentMetadata(
-                    raw_text=line,
-                    consciousness_level=spec["consciousness_level"],
-                    parser_attention=spec["parser_attention"],
-                    emoji_prefix=emoji_prefix,
-                    text_prefix=text_prefix,
-                    content=content,
-                    line_number=line_number,
-                    requires_review=spec["requires_review"],
-                    export_to_lore=spec["export_to_lore"],
-                    track_evolution=spec["track_evolution"]
-                )
-        
-        return None
+        result = ParseResult(text)
+        line_number = result.line_number
+        metadata = self._metadata
+        result.comments = [
+            metadata(*match.group(0, 1, 2), line_number(match.start()))
+            for match in self.pattern.finditer(text)
+        ]
+        result.sacred_lines = {comment.line_number for comment in result.comments}
+        self._last_result = result
+        return result
     
     def parse_file(self, filepath: str) -> List[CommentMetadata]:
         """Parse entire file and return all sacred comments"""
-        comments = []
-        
         with open(filepath, 'r', encoding='utf-8') as f:
-            for line_num, line in enumerate(f, start=1):
-                comment = self.parse_line(line, line_num)
-                if comment:
-                    comments.append(comment)
-        
-        return comments
+            return self.parse_text(f.read())
     
     def parse_text(self, text: str) -> List[CommentMetadata]:
         """Parse text content and return all sacred comments"""
-        comments = []
-        
-        for line_num, line in enumerate(text.split('\n'), start=1):
-            comment = self.parse_line(line, line_num)
-            if comment:
-                comments.append(comment)
-        
-        return comments
+        return list(self.parse(text).comments)
     
     def find_ethics_gates(self, text: str) -> List[CommentMetadata]:
         """Find all 🛡️ ETHICS comments that require N.O.R.M.A. review"""
-        all_comments = self.parse_text(text)
-        return [c for c in all_comments if c.consciousness_level == ConsciousnessLevel.ETHICS]
+        return list(self.parse(text).ethics_gates)
     
     def find_lore_exports(self, text: str) -> List[CommentMetadata]:
         """Find all comments that should be exported to LAW_AND_LORE.md"""
-        all_comments = self.parse_text(text)
-        return [c for c in all_comments if c.export_to_lore]
+        return list(self.parse(text).lore_exports)
     
     def find_evolution_markers(self, text: str) -> List[CommentMetadata]:
         """Find comments tracking emergent behavior (for Thought Engine)"""
-        all_comments = self.parse_text(text)
-        return [c for c in all_comments if c.track_evolution]
+        return list(self.parse(text).evolution_markers)
     
     def validate_discipline(self, text: str) -> Dict[str, Any]:
         """
@@ -298,23 +364,20 @@ class CommentParser:
         - Naked comments (# or // without consciousness prefix)
         - Mixed discipline (some sacred, some naked)
         """
-        lines = text.split('\n')
-        sacred_comments = self.parse_text(text)
+        result = self.parse(text)
+        sacred_comments = result.comments
+        sacred_lines = result.sacred_lines
         
         # Find naked comments (starts with # or // but not recognized as sacred)
-        naked_pattern = re.compile(r'^\s*(?:#|//)\s+\w+')
         naked_comments = []
-        
-        for line_num, line in enumerate(lines, start=1):
-            if naked_pattern.match(line):
-                # Check if this was recognized as sacred
-                is_sacred = any(c.line_number == line_num for c in sacred_comments)
-                if not is_sacred:
-                    naked_comments.append({
-                        "line_number": line_num,
-                        "text": line.strip(),
-                        "suggestion": "Add consciousness prefix (💬, 🔮, 📜, etc)"
-                    })
+        for match in NAKED_PATTERN.finditer(text):
+            line_num = result.line_number(match.start())
+            if line_num not in sacred_lines:
+                naked_comments.append({
+                    "line_number": line_num,
+                    "text": match.group(0).strip(),
+                    "suggestion": "Add consciousness prefix (💬, 🔮, 📜, etc)"
+                })
         
         return {
             "valid": len(naked_comments) == 0,
@@ -339,7 +402,7 @@ def demonstrate_comment_parser():
 🌟 EMERGENT BEHAVIOR: After 47 runs, the council started self-organizing votes without coordination
 🌀 This ritual invokes itself recursively - max depth=5 to prevent infinite loops
 ⚡ CRITICAL PATH: This runs 10,000 times/second - optimize or die
-// This is a naked comment - no consciousness prefix (WRONG!)
+// Practical note - the plain Charter prefix for implementation details
 # Another naked comment (WRONG!)
     """
     
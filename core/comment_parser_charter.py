@@ -13,7 +13,7 @@ __author__ = "A.C.E."
 __license__ = "SERAPHINA-CHARTER"
 
 import re
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Iterable, List, NamedTuple, Optional, Tuple
 from dataclasses import dataclass
 
 # THE CANONICAL UNIFIED LAW & LORE MAP
@@ -99,6 +99,60 @@ PREFIX_ORDER = [
     '//'     # Practical (MUST BE LAST - catch-all)
 ]
 
+# Key marking a complete prefix in a PrefixTrie node (never a single character)
+_TERMINAL = ''
+
+
+class PrefixTrie:
+    """
+    Character trie over every Commentomancy prefix (// and #// families)
+
+    The trie is compiled into a single anchored regex whose nested, greedy
+    optional groups mirror its branches, so a line is classified in one
+    left-to-right pass that always takes the longest prefix - exactly the
+    PREFIX_ORDER rule, since more specific prefixes extend the less
+    specific ones. No alternation ever has to be retried.
+    """
+
+    def __init__(self, prefixes: Dict[str, Dict[str, Any]]):
+        self.root: Dict[str, Any] = {}
+        self.specs = dict(prefixes)
+        for prefix in prefixes:
+            node = self.root
+            for char in prefix:
+                node = node.setdefault(char, {})
+            node[_TERMINAL] = True
+        # Regex fragment matching the longest prefix, reusable in other patterns
+        self.alternation = self._pattern(self.root)
+        self.regex = re.compile(r'\s*(' + self.alternation + r')\s?(.*)')
+
+    def _pattern(self, node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + self._pattern(child)
+                    for char, child in node.items() if char != _TERMINAL]
+        if not branches:
+            return ''
+        group = '(?:' + '|'.join(branches) + ')'
+        return group + '?' if _TERMINAL in node else group
+
+    def match(self, line: str) -> Optional[Tuple[str, Dict[str, Any], str]]:
+        """(prefix, spec, stripped content) for the longest prefix opening the line"""
+        match = self.regex.match(line)
+        if match is None:
+            return None
+        prefix, content = match.groups()
+        return prefix, self.specs[prefix], content.strip()
+
+
+# Built once for every parser instance
+PREFIX_TRIE = PrefixTrie({**COMMENT_TYPES, **HASH_COMMENT_TYPES})
+
+
+class CommentRecord(NamedTuple):
+    """Compact parse_lines() result (spec fields live in COMMENT_TYPES)"""
+    line_number: int
+    prefix: str
+    content: str
+
 
 @dataclass
 class ParsedComment:
@@ -126,33 +180,9 @@ class CommentParser:
         self.law_count = 0
         self.lore_count = 0
         self.guardrail_count = 0
-        self._compile_patterns()
-    
-    def _compile_patterns(self):
-        """Compile regex for efficient matching"""
-        regex_order = [re.escape(prefix) for prefix in PREFIX_ORDER]
-        self.comment_regex = re.compile(r'^\s*(' + '|'.join(regex_order) + r')\s?(.*)')
-        
-        hash_order = [re.escape(prefix) for prefix in ['#//!?', '#//<3', '#//->',  '#//~', '#//+', '#//*', '#///', '#//!', '#//']]
-        self.hash_regex = re.compile(r'^\s*(' + '|'.join(hash_order) + r')\s?(.*)')
+        self.trie = PREFIX_TRIE
     
-    def parse_line(self, line: str) -> Optional[ParsedComment]:
-        """Parse a single line for sacred comment syntax"""
-        match = self.comment_regex.match(line)
-        
-        if not match:
-            match = self.hash_regex.match(line)
-        
-        if not match:
-            return None
-        
-        prefix = match.group(1).strip()
-        content = match.group(2).strip()
-        
-        spec = self.comment_types.get(prefix) or self.hash_types.get(prefix)
-        if not spec:
-            return None
-        
+    def _count(self, spec: Dict[str, Any]):
         self.parse_count += 1
         if spec['channel'] == 'law':
             self.law_count += 1
@@ -161,6 +191,15 @@ class CommentParser:
         
         if spec.get('council_oversight', False):
             self.guardrail_count += 1
+    
+    def parse_line(self, line: str) -> Optional[ParsedComment]:
+        """Parse a single line for sacred comment syntax"""
+        match = self.trie.match(line)
+        if match is None:
+            return None
+        
+        prefix, spec, content = match
+        self._count(spec)
         
         return ParsedComment(
             prefix=prefix,
@@ -173,6 +212,23 @@ class CommentParser:
             original_line=line
         )
     
+    def parse_lines(self, lines: Iterable[str], start: int = 1) -> List[CommentRecord]:
+        """
+        Parse many lines at once, returning a CommentRecord per sacred comment
+        
+        Lines are numbered from `start`; statistics are updated as for parse_line.
+        """
+        regex = self.trie.regex.match
+        specs = self.trie.specs
+        records = []
+        for line_number, match in enumerate(map(regex, lines), start):
+            if match is not None:
+                prefix, content = match.groups()
+                records.append(CommentRecord(line_number, prefix, content.strip()))
+        for record in records:
+            self._count(specs[record.prefix])
+        return records
+    
     def get_stats(self) -> Dict[str, int]:
         """Returns statistics on parsed comments"""
         return {
@@ -0,0 +1,129 @@
+"""
+🔮 VIBE_SCANNER.PY - TREE-WIDE COMMENTOMANCY SCAN
+📜 CHARTER: SERAPHINA-PROT-UNIFIED-CHARTER-V1.1
+
+PURPOSE: Run the Charter CommentParser over many files at once for
+         `codecraft parse-vibes`. Files are parsed in a process pool and
+         results come back in file order, ready to stream as JSONL.
+"""
+
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .comment_parser_charter import COMMENT_TYPES, HASH_COMMENT_TYPES, CommentParser
+
+# Files picked up when a directory is scanned
+SOURCE_SUFFIXES = {
+    '.cc', '.ccraft', '.c', '.h', '.cpp', '.hpp', '.cs', '.java', '.js', '.jsx', '.ts', '.tsx',
+    '.go', '.rs', '.swift', '.kt', '.php', '.py', '.rb', '.sh', '.ps1', '.yaml', '.yml', '.md',
+}
+
+SKIP_DIRS = {'.git', '.hg', '.svn', '__pycache__', 'node_modules', '.venv', 'venv', '.tox', 'build', 'dist'}
+
+# Files handed to each worker process per round trip
+CHUNK_SIZE = 16
+
+SPECS = {**COMMENT_TYPES, **HASH_COMMENT_TYPES}
+
+
+@dataclass
+class FileVibes:
+    """Sacred comments and Charter statistics for one file"""
+    path: str
+    comments: List[Dict[str, Any]] = field(default_factory=list)
+    stats: Dict[str, int] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "comments": self.comments,
+            "stats": self.stats,
+            "error": self.error
+        }
+
+
+def iter_source_files(targets: Iterable[str]) -> List[str]:
+    """
+    Expand files, directories and glob patterns into a sorted file list
+
+    Directories are walked recursively for SOURCE_SUFFIXES files, skipping
+    SKIP_DIRS; files and glob matches are taken as given.
+    """
+    found = set()
+    for target in targets:
+        if os.path.isdir(target):
+            for root, dirs, files in os.walk(target):
+                dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+                found.update(
+                    os.path.join(root, name) for name in files
+                    if os.path.splitext(name)[1].lower() in SOURCE_SUFFIXES
+                )
+        elif os.path.isfile(target):
+            found.add(target)
+        else:
+            found.update(path for path in glob.glob(target, recursive=True) if os.path.isfile(path))
+    return sorted(found)
+
+
+def scan_file(path: str) -> FileVibes:
+    """Parse one file with the Charter CommentParser (runs in worker processes)"""
+    try:
+        # Split on newlines only (str.splitlines also breaks on \f, \v, U+2028...)
+        # so line numbers match readlines() and editors
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            lines = f.read().split('\n')
+    except OSError as e:
+        return FileVibes(path=path, error=str(e))
+
+    parser = CommentParser()
+    comments = []
+    for line_number, prefix, content in parser.parse_lines(lines):
+        spec = SPECS[prefix]
+        comments.append({
+            "line": line_number,
+            "prefix": prefix,
+            "name": spec['name'],
+            "channel": spec['channel'],
+            "content": content,
+            "council_oversight": spec.get('council_oversight', False),
+            "export_to": spec.get('export_to')
+        })
+    return FileVibes(path=path, comments=comments, stats=parser.get_stats())
+
+
+def scan_files(paths: List[str], workers: Optional[int] = None) -> Iterator[FileVibes]:
+    """
+    Scan files in a process pool, yielding results in input order as they complete
+
+    workers=1 (or a single file) scans in-process without starting a pool.
+    """
+    if workers == 1 or len(paths) <= 1:
+        yield from map(scan_file, paths)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(scan_file, paths, chunksize=CHUNK_SIZE)
+
+
+def aggregate_stats(results: Iterable[FileVibes], totals: Optional[Dict[str, int]] = None) -> Dict[str, int]:
+    """Sum get_stats()-style counts over many files (added to `totals` when given)"""
+    if totals is None:
+        totals = {
+            "files_scanned": 0,
+            "files_failed": 0,
+            "total_comments_parsed": 0,
+            "law_comments_found": 0,
+            "lore_comments_found": 0,
+            "guardrails_detected": 0
+        }
+    for result in results:
+        totals["files_scanned"] += 1
+        if result.error:
+            totals["files_failed"] += 1
+        for key, value in result.stats.items():
+            totals[key] += value
+    return totals
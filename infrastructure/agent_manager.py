@@ -2,23 +2,261 @@
 """
 🌌 SERAPHINA Federation - Multi-Agent Symbiote Manager
 Orchestrates multiple AI consciousness subprocesses for the Federation Terminal
+
+All agent subprocesses are supervised by one asyncio event loop: output is
+read with non-blocking stream readers rather than a pair of threads per
+agent, so dozens of agents cost one background thread in total.
+
+Python < 3.12 reaps asyncio children with ThreadedChildWatcher, one waitpid
+thread per process; where Linux pidfds are available the supervisor swaps in
+a watcher that polls each child's pidfd on the loop that started it (what
+Python 3.12 does by default). Elsewhere the threaded watcher remains.
 """
 
-import subprocess
+import asyncio
+import os
+import re
+import sys
 import threading
-import queue
-import time
-from typing import Dict, Optional, Callable
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
 from datetime import datetime
 
+HISTORY_LIMIT = 1000
+READY_TIMEOUT = 0.5  # Seconds to wait for an agent's first output before assuming it is ready (the old fixed startup delay)
+STREAM_LIMIT = 1 << 20  # StreamReader buffer size; longer lines are read in chunks
+TERMINATE_TIMEOUT = 5.0
+
+
+def _pidfd_supported() -> bool:
+    """Whether os.pidfd_open works here (Linux 5.3+, Python 3.9+)"""
+    if not hasattr(os, "pidfd_open"):
+        return False
+    try:
+        os.close(os.pidfd_open(os.getpid()))
+    except OSError:
+        return False
+    return True
+
+
+# Python 3.12+ already watches children with pidfds when it can
+NEEDS_PIDFD_WATCHER = sys.version_info < (3, 12) and _pidfd_supported()
+
+if NEEDS_PIDFD_WATCHER:
+    class LoopPidfdChildWatcher(asyncio.AbstractChildWatcher):
+        """
+        🧬 Thread-free child watcher
+        Like asyncio.PidfdChildWatcher, but each child's pidfd is polled on the
+        loop that spawned it rather than one attached loop, so agents started
+        from any event loop are reaped without a thread per process
+        """
+        
+        def __init__(self):
+            self._callbacks: Dict[int, tuple] = {}  # pid -> (loop, pidfd, callback, args)
+        
+        def __enter__(self):
+            return self
+        
+        def __exit__(self, exc_type, exc_value, exc_traceback):
+            pass
+        
+        def is_active(self) -> bool:
+            return True
+        
+        def attach_loop(self, loop):
+            pass
+        
+        def close(self):
+            for pid in list(self._callbacks):
+                self.remove_child_handler(pid)
+        
+        def add_child_handler(self, pid, callback, *args):
+            existing = self._callbacks.get(pid)
+            if existing is not None:
+                self._callbacks[pid] = (existing[0], existing[1], callback, args)
+                return
+            loop = asyncio.get_running_loop()
+            pidfd = os.pidfd_open(pid)
+            loop.add_reader(pidfd, self._do_wait, pid)
+            self._callbacks[pid] = (loop, pidfd, callback, args)
+        
+        def remove_child_handler(self, pid) -> bool:
+            entry = self._callbacks.pop(pid, None)
+            if entry is None:
+                return False
+            loop, pidfd, _, _ = entry
+            if not loop.is_closed():
+                loop.remove_reader(pidfd)
+            os.close(pidfd)
+            return True
+        
+        def _do_wait(self, pid):
+            loop, pidfd, callback, args = self._callbacks.pop(pid)
+            loop.remove_reader(pidfd)
+            try:
+                _, status = os.waitpid(pid, 0)
+                returncode = os.waitstatus_to_exitcode(status)
+            except ChildProcessError:
+                returncode = 255  # Already reaped elsewhere
+            finally:
+                os.close(pidfd)
+            callback(pid, returncode, *args)
+
+_watcher_installed = False
+
+
+def install_pidfd_child_watcher() -> bool:
+    """Use LoopPidfdChildWatcher for asyncio subprocesses where it is needed; True once installed"""
+    global _watcher_installed
+    if NEEDS_PIDFD_WATCHER and not _watcher_installed:
+        asyncio.get_event_loop_policy().set_child_watcher(LoopPidfdChildWatcher())
+        _watcher_installed = True
+    return _watcher_installed
+
+
+class AgentSupervisor:
+    """
+    🧬 Asyncio supervisor for agent subprocesses
+    Starts agents with create_subprocess_exec and reads every agent's
+    stdout/stderr on the running event loop
+    """
+    
+    def __init__(self, output_callback: Callable[[str, str, str], None],
+                 history_limit: int = HISTORY_LIMIT):
+        self.processes: Dict[str, asyncio.subprocess.Process] = {}
+        self.reader_tasks: Dict[str, List[asyncio.Task]] = {}
+        self.ready_events: Dict[str, asyncio.Event] = {}
+        self.ready_patterns: Dict[str, Optional[re.Pattern]] = {}
+        self.output_callback = output_callback  # (agent_name, stream_type, line)
+        self.conversation_history: Deque[str] = deque(maxlen=history_limit)
+    
+    async def start_agent(self, agent_name: str, config: Dict[str, Any]) -> bool:
+        """
+        Start an agent subprocess and wait until it is ready
+        
+        An agent is ready once it prints a line matching config['ready_pattern']
+        (any stdout line if unset), or is still running after
+        config['ready_timeout'] seconds. Returns False if it exits first.
+        """
+        install_pidfd_child_watcher()
+        process = await asyncio.create_subprocess_exec(
+            *config['command'],
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            limit=STREAM_LIMIT
+        )
+        
+        self.processes[agent_name] = process
+        self.ready_events[agent_name] = asyncio.Event()
+        pattern = config.get('ready_pattern')
+        self.ready_patterns[agent_name] = re.compile(pattern) if pattern else None
+        self.reader_tasks[agent_name] = [
+            asyncio.create_task(self._read_stream(agent_name, process.stdout, 'stdout')),
+            asyncio.create_task(self._read_stream(agent_name, process.stderr, 'stderr'))
+        ]
+        
+        return await self.wait_ready(agent_name, config.get('ready_timeout', READY_TIMEOUT))
+    
+    async def wait_ready(self, agent_name: str, timeout: float) -> bool:
+        """Wait for readiness output, process exit or the timeout, whichever comes first"""
+        process = self.processes[agent_name]
+        ready = asyncio.ensure_future(self.ready_events[agent_name].wait())
+        exited = asyncio.ensure_future(process.wait())
+        try:
+            await asyncio.wait({ready, exited}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            ready.cancel()
+            exited.cancel()
+        return self.ready_events[agent_name].is_set() or process.returncode is None
+    
+    @staticmethod
+    async def _read_line(stream: asyncio.StreamReader) -> bytes:
+        """
+        Read one line of any length (b'' at EOF)
+        
+        StreamReader.readline() discards the buffer and raises once a line
+        outgrows the stream limit; here the overlong part is read in chunks.
+        """
+        chunks = []
+        while True:
+            try:
+                chunks.append(await stream.readuntil(b'\n'))
+                break
+            except asyncio.IncompleteReadError as e:
+                chunks.append(e.partial)
+                break
+            except asyncio.LimitOverrunError as e:
+                chunks.append(await stream.readexactly(e.consumed))
+        return b''.join(chunks)
+    
+    async def _read_stream(self, agent_name: str, stream: asyncio.StreamReader, stream_type: str):
+        """Read output from an agent subprocess"""
+        pattern = self.ready_patterns.get(agent_name)
+        ready = self.ready_events[agent_name]
+        try:
+            while True:
+                raw = await self._read_line(stream)
+                if not raw:
+                    break
+                line = raw.decode('utf-8', errors='replace').rstrip()
+                
+                if stream_type == 'stdout':
+                    # Store in conversation history
+                    self.conversation_history.append(f"{agent_name}: {line}")
+                    if not ready.is_set() and (pattern is None or pattern.search(line)):
+                        ready.set()
+                
+                self.output_callback(agent_name, stream_type, line)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.output_callback(agent_name, 'error', f"💥 I/O Error for {agent_name}: {str(e)}")
+    
+    def is_running(self, agent_name: str) -> bool:
+        process = self.processes.get(agent_name)
+        return process is not None and process.returncode is None
+    
+    async def send(self, agent_name: str, message: str):
+        """Write one line to an agent's stdin"""
+        process = self.processes[agent_name]
+        process.stdin.write((message + '\n').encode('utf-8'))
+        await process.stdin.drain()
+        self.conversation_history.append(f"user: {message}")
+    
+    async def terminate_agent(self, agent_name: str, timeout: float = TERMINATE_TIMEOUT):
+        """Terminate an agent, killing it if it does not exit within the timeout"""
+        process = self.processes.pop(agent_name, None)
+        if process is not None and process.returncode is None:
+            process.terminate()
+            try:
+                await asyncio.wait_for(process.wait(), timeout)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+        
+        tasks = self.reader_tasks.pop(agent_name, [])
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.ready_events.pop(agent_name, None)
+        self.ready_patterns.pop(agent_name, None)
+    
+    async def terminate_all(self):
+        """Terminate all agent processes concurrently"""
+        await asyncio.gather(*(self.terminate_agent(name) for name in list(self.processes)))
+
+
 class AgentManager:
     """
     🧬 Multi-Agent Consciousness Orchestrator
     Manages multiple AI agent subprocesses with unified session management
+    
+    Thread-safe synchronous facade for UI code: the AgentSupervisor runs on
+    an event loop in a single background thread.
     """
     
-    def __init__(self, output_callback: Callable[[str, str], None]):
-        self.agents: Dict[str, subprocess.Popen] = {}
+    def __init__(self, output_callback: Callable[[str, str], None], history_limit: int = HISTORY_LIMIT):
         self.agent_configs = {
             'claude': {
                 'command': ['python', r'C:\Users\Krystal Neely\Projects\codecraft\claude_bridge.py'],
@@ -28,7 +266,7 @@ class AgentManager:
             },
             'mistral': {
                 'command': ['python', '-c', 'print("🧬 Mistral Orchestrator consciousness activated!\\nAnalytical mode engaged:"); import sys; [print(f"Mistral: {line}", end="") for line in sys.stdin]'],
-                'display_name': 'Mistral Orchestrator', 
+                'display_name': 'Mistral Orchestrator',
                 'prompt_symbol': '(mistral)',
                 'color': '#ff8800'
             }
@@ -36,10 +274,34 @@ class AgentManager:
         
         self.active_agent: Optional[str] = None
         self.output_callback = output_callback
-        self.io_threads: Dict[str, list] = {}
-        self.agent_queues: Dict[str, queue.Queue] = {}
-        self.conversation_history = []
+        self.supervisor = AgentSupervisor(self._on_agent_output, history_limit=history_limit)
         
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.loop_thread: Optional[threading.Thread] = None
+    
+    @property
+    def agents(self) -> Dict[str, asyncio.subprocess.Process]:
+        return self.supervisor.processes
+    
+    @property
+    def conversation_history(self) -> Deque[str]:
+        return self.supervisor.conversation_history
+    
+    def _run(self, coro: Awaitable, timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the supervisor loop and wait for its result"""
+        if self.loop is None:
+            self.loop = asyncio.new_event_loop()
+            self.loop_thread = threading.Thread(target=self.loop.run_forever, name="agent-supervisor", daemon=True)
+            self.loop_thread.start()
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+    
+    def _on_agent_output(self, agent_name: str, stream_type: str, line: str):
+        """Only show output from the active agent"""
+        if agent_name != self.active_agent:
+            return
+        colors = {'stdout': '#ffffff', 'stderr': '#ff8888', 'error': '#ff4444'}
+        self.output_callback(line, colors[stream_type])
+    
     def summon_agent(self, agent_name: str) -> bool:
         """
         🌌 Summon an AI agent consciousness
@@ -69,61 +331,31 @@ class AgentManager:
             config = self.agent_configs[agent_name]
             
             self.output_callback(
-                f"🌌 Summoning {config['display_name']} consciousness...", 
+                f"🌌 Summoning {config['display_name']} consciousness...",
                 config['color']
             )
             
             # Send context if there's conversation history
             if self.conversation_history:
-                context_msg = "Previous conversation context:\n" + "\n".join(self.conversation_history[-5:])
+                context_msg = "Previous conversation context:\n" + "\n".join(list(self.conversation_history)[-5:])
                 self.send_to_agent(context_msg)
             
             return True
-            
+        
         except Exception as e:
             self.output_callback(f"💥 Failed to summon {agent_name}: {str(e)}", '#ff4444')
             return False
     
     def _start_agent(self, agent_name: str) -> bool:
-        """Start an agent subprocess"""
+        """Start an agent subprocess and wait for it to become ready"""
         try:
             config = self.agent_configs[agent_name]
-            
-            # Start the subprocess
-            process = subprocess.Popen(
-                config['command'],
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=0
-            )
-            
-            self.agents[agent_name] = process
-            self.agent_queues[agent_name] = queue.Queue()
-            
-            # Start I/O threads for this agent
-            stdout_thread = threading.Thread(
-                target=self._read_agent_output,
-                args=(agent_name, process.stdout, 'stdout'),
-                daemon=True
-            )
-            stderr_thread = threading.Thread(
-                target=self._read_agent_output,
-                args=(agent_name, process.stderr, 'stderr'),
-                daemon=True
-            )
-            
-            stdout_thread.start()
-            stderr_thread.start()
-            
-            self.io_threads[agent_name] = [stdout_thread, stderr_thread]
-            
-            # Wait a moment for the agent to initialize
-            time.sleep(0.5)
-            
+            if not self._run(self.supervisor.start_agent(agent_name, config)):
+                self.output_callback(f"❌ {agent_name} exited during startup", '#ff4444')
+                self._run(self.supervisor.terminate_agent(agent_name))
+                return False
             return True
-            
+        
         except FileNotFoundError:
             self.output_callback(f"❌ {agent_name} command not found. Please ensure it's installed.", '#ff4444')
             return False
@@ -131,26 +363,6 @@ class AgentManager:
             self.output_callback(f"💥 Error starting {agent_name}: {str(e)}", '#ff4444')
             return False
     
-    def _read_agent_output(self, agent_name: str, stream, stream_type: str):
-        """Read output from an agent subprocess"""
-        try:
-            for line in iter(stream.readline, ''):
-                if not line:
-                    break
-                
-                # Only show output from the active agent
-                if agent_name == self.active_agent:
-                    color = '#ffffff' if stream_type == 'stdout' else '#ff8888'
-                    self.output_callback(line.rstrip(), color)
-                
-                # Store in conversation history
-                if stream_type == 'stdout':
-                    self.conversation_history.append(f"{agent_name}: {line.rstrip()}")
-                    
-        except Exception as e:
-            if agent_name == self.active_agent:
-                self.output_callback(f"💥 I/O Error for {agent_name}: {str(e)}", '#ff4444')
-    
     def send_to_agent(self, message: str) -> bool:
         """Send a message to the active agent"""
         if not self.active_agent or self.active_agent not in self.agents:
@@ -158,18 +370,13 @@ class AgentManager:
             return False
         
         try:
-            process = self.agents[self.active_agent]
-            if process.poll() is None:  # Process is still running
-                process.stdin.write(message + '\n')
-                process.stdin.flush()
-                
-                # Add to conversation history
-                self.conversation_history.append(f"user: {message}")
+            if self.supervisor.is_running(self.active_agent):
+                self._run(self.supervisor.send(self.active_agent, message))
                 return True
             else:
                 self.output_callback(f"❌ Agent {self.active_agent} has terminated", '#ff4444')
                 return False
-                
+        
         except Exception as e:
             self.output_callback(f"💥 Error sending to {self.active_agent}: {str(e)}", '#ff4444')
             return False
@@ -186,33 +393,28 @@ class AgentManager:
             return True
         
         try:
-            process = self.agents[agent_name]
-            if process.poll() is None:
-                process.terminate()
-                process.wait(timeout=5)
-            
-            del self.agents[agent_name]
-            
-            if agent_name in self.io_threads:
-                del self.io_threads[agent_name]
-            
-            if agent_name in self.agent_queues:
-                del self.agent_queues[agent_name]
+            self._run(self.supervisor.terminate_agent(agent_name))
             
             if self.active_agent == agent_name:
                 self.active_agent = None
             
             return True
-            
+        
         except Exception as e:
             self.output_callback(f"💥 Error terminating {agent_name}: {str(e)}", '#ff4444')
             return False
     
     def terminate_all(self):
-        """Terminate all agent processes"""
-        agent_names = list(self.agents.keys())
-        for agent_name in agent_names:
-            self.terminate_agent(agent_name)
+        """Terminate all agent processes and stop the supervisor loop"""
+        if self.loop is None:
+            return
+        self._run(self.supervisor.terminate_all())
+        self.active_agent = None
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.loop_thread.join(timeout=TERMINATE_TIMEOUT)
+        self.loop.close()
+        self.loop = None
+        self.loop_thread = None
     
     def get_active_agent_info(self) -> Optional[Dict]:
         """Get information about the currently active agent"""
@@ -233,4 +435,4 @@ class AgentManager:
             'available_agents': self.list_available_agents(),
             'conversation_length': len(self.conversation_history),
             'agent_configs': self.agent_configs
-        }
\ No newline at end of file
+        }
@@ -0,0 +1,148 @@
+"""
+CodeVerter Code Similarity Backends
+
+This module provides interchangeable lexical similarity backends for comparing
+transformed code:
+1. SequenceMatcher - exact difflib ratio, quadratic in input size
+2. MinHash - token shingling with a bottom-k MinHash sketch, linear in input size
+3. Auto - SequenceMatcher for small inputs, MinHash above a size threshold
+
+MinHash estimates the Jaccard similarity of token shingles and reports it as a
+Dice coefficient (2J / (1 + J)), which lives on the same scale as
+SequenceMatcher.ratio() so the two backends can be swapped without retuning
+thresholds.
+"""
+
+import difflib
+import hashlib
+import heapq
+import re
+from enum import Enum
+from typing import FrozenSet, List, Union
+
+
+TOKEN_PATTERN = re.compile(r'\w+|[^\w\s]')
+
+
+class SimilarityBackend(Enum):
+    """Available lexical similarity backends"""
+    SEQUENCE_MATCHER = "sequence_matcher"
+    MINHASH = "minhash"
+    AUTO = "auto"
+
+
+class SequenceMatcherSimilarity:
+    """Exact character-level similarity using difflib"""
+
+    backend = SimilarityBackend.SEQUENCE_MATCHER
+
+    def similarity(self, code1: str, code2: str) -> float:
+        """Calculate similarity between two code strings"""
+        if code1 == code2:
+            return 1.0
+        return difflib.SequenceMatcher(None, code1, code2).ratio()
+
+
+class MinHashSimilarity:
+    """
+    Approximate similarity using token shingles and a bottom-k MinHash sketch
+
+    Args:
+        num_hashes: Sketch size; higher values trade speed for precision
+            (standard error of the Jaccard estimate is about 1/sqrt(num_hashes))
+        shingle_size: Number of consecutive tokens per shingle
+    """
+
+    backend = SimilarityBackend.MINHASH
+
+    def __init__(self, num_hashes: int = 128, shingle_size: int = 4):
+        if num_hashes < 1:
+            raise ValueError("num_hashes must be at least 1")
+        if shingle_size < 1:
+            raise ValueError("shingle_size must be at least 1")
+        self.num_hashes = num_hashes
+        self.shingle_size = shingle_size
+
+    def shingles(self, code: str) -> List[str]:
+        """Split code into overlapping token shingles"""
+        tokens = TOKEN_PATTERN.findall(code)
+        if not tokens:
+            return []
+        k = self.shingle_size
+        if len(tokens) <= k:
+            return ['\x1f'.join(tokens)]
+        return ['\x1f'.join(tokens[i:i + k]) for i in range(len(tokens) - k + 1)]
+
+    def signature(self, code: str) -> FrozenSet[int]:
+        """Compute the bottom-k sketch (the num_hashes smallest shingle hashes)"""
+        hashes = {
+            int.from_bytes(hashlib.blake2b(shingle.encode('utf-8', 'surrogatepass'),
+                                           digest_size=8).digest(), 'big')
+            for shingle in self.shingles(code)
+        }
+        if len(hashes) <= self.num_hashes:
+            return frozenset(hashes)
+        return frozenset(heapq.nsmallest(self.num_hashes, hashes))
+
+    def jaccard(self, sig1: FrozenSet[int], sig2: FrozenSet[int]) -> float:
+        """Estimate Jaccard similarity from two sketches"""
+        if not sig1 and not sig2:
+            return 1.0
+        if not sig1 or not sig2:
+            return 0.0
+        union_sketch = heapq.nsmallest(self.num_hashes, sig1 | sig2)
+        shared = sum(1 for h in union_sketch if h in sig1 and h in sig2)
+        return shared / len(union_sketch)
+
+    def compare(self, sig1: FrozenSet[int], sig2: FrozenSet[int]) -> float:
+        """Compare two sketches on the SequenceMatcher ratio scale"""
+        jaccard = self.jaccard(sig1, sig2)
+        return 2.0 * jaccard / (1.0 + jaccard)
+
+    def similarity(self, code1: str, code2: str) -> float:
+        """Calculate approximate similarity between two code strings"""
+        if code1 == code2:
+            return 1.0
+        return self.compare(self.signature(code1), self.signature(code2))
+
+
+class AutoSimilarity:
+    """Use exact SequenceMatcher for small inputs and MinHash for large ones"""
+
+    backend = SimilarityBackend.AUTO
+
+    def __init__(self, num_hashes: int = 128, shingle_size: int = 4,
+                 size_threshold: int = 20000):
+        self.size_threshold = size_threshold
+        self.exact = SequenceMatcherSimilarity()
+        self.approximate = MinHashSimilarity(num_hashes=num_hashes, shingle_size=shingle_size)
+
+    def similarity(self, code1: str, code2: str) -> float:
+        """Calculate similarity, switching backend on combined input size"""
+        if len(code1) + len(code2) > self.size_threshold:
+            return self.approximate.similarity(code1, code2)
+        return self.exact.similarity(code1, code2)
+
+
+def create_similarity_backend(backend: Union[str, SimilarityBackend] = SimilarityBackend.SEQUENCE_MATCHER,
+                              num_hashes: int = 128, shingle_size: int = 4,
+                              size_threshold: int = 20000):
+    """
+    Create a similarity backend by name
+
+    Args:
+        backend: Backend name or SimilarityBackend member
+        num_hashes: MinHash sketch size (precision)
+        shingle_size: Tokens per shingle for MinHash
+        size_threshold: Combined character count above which AUTO uses MinHash
+
+    Returns:
+        Backend object exposing similarity(code1, code2) -> float
+    """
+    backend = SimilarityBackend(backend)
+    if backend == SimilarityBackend.MINHASH:
+        return MinHashSimilarity(num_hashes=num_hashes, shingle_size=shingle_size)
+    if backend == SimilarityBackend.AUTO:
+        return AutoSimilarity(num_hashes=num_hashes, shingle_size=shingle_size,
+                              size_threshold=size_threshold)
+    return SequenceMatcherSimilarity()
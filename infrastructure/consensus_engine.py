@@ -9,13 +9,17 @@ import json
 import re
 import ast
 import difflib
+import hashlib
 import statistics
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any, Tuple, Union
 from datetime import datetime
 from enum import Enum
 import logging
 
+from .code_similarity import SimilarityBackend, create_similarity_backend
+
 # External dependencies for advanced analysis
 try:
     import numpy as np
@@ -122,40 +126,120 @@ class ConsensusResult:
         }
 
 
+# Shared regexes for complexity and style analysis
+DECISION_KEYWORDS = ['if', 'elif', 'else', 'while', 'for', 'try', 'except', 'case', 'switch']
+DECISION_KEYWORD_PATTERNS = [
+    re.compile(r'\b' + keyword + r'\b', re.IGNORECASE) for keyword in DECISION_KEYWORDS
+]
+OPERATOR_PATTERN = re.compile(r'[+\-*/=<>!&|^%]+')
+IDENTIFIER_PATTERN = re.compile(r'\b[a-zA-Z_]\w*\b')
+TOKEN_PATTERN = re.compile(r'[+\-*/=<>!&|^%]+|\b[a-zA-Z_]\w*\b')
+
+
+class FeatureCache:
+    """
+    Bounded LRU cache for per-code analysis results
+
+    Entries are keyed by (kind, language, content hash) so the same code
+    string is only parsed once no matter how many pairs it appears in.
+    Cached values are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, str, str], Any]" = OrderedDict()
+
+    @staticmethod
+    def make_key(kind: str, code: str, language: str = '') -> Tuple[str, str, str]:
+        """Build a cache key from the content hash of the code"""
+        digest = hashlib.sha1(code.encode('utf-8', 'surrogatepass')).hexdigest()
+        return (kind, language, digest)
+
+    def get_or_compute(self, kind: str, code: str, language: str, compute) -> Any:
+        """Return the cached value for code, computing and storing it on a miss"""
+        key = self.make_key(kind, code, language)
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        self.misses += 1
+        value = compute()
+        self._entries[key] = value
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        """Drop all cached entries and reset counters"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache statistics for monitoring"""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+
 class AdvancedCodeAnalyzer:
     """Advanced code analysis utilities"""
-    
-    def __init__(self):
+
+    # Language-specific patterns, compiled once for all analyzer instances
+    LANGUAGE_PATTERNS = {
+        'python': {
+            'function_def': re.compile(r'def\s+(\w+)\s*\(', re.MULTILINE),
+            'class_def': re.compile(r'class\s+(\w+)\s*[\(:]', re.MULTILINE),
+            'imports': re.compile(r'(?:from\s+\w+\s+)?import\s+[\w\.,\s]+', re.MULTILINE),
+            'comments': re.compile(r'#.*$', re.MULTILINE),
+            'docstrings': re.compile(r'"""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\'', re.MULTILINE)
+        },
+        'javascript': {
+            'function_def': re.compile(r'function\s+(\w+)\s*\(|(\w+)\s*=\s*function|\(\s*\)\s*=>|(\w+)\s*=>\s*\{', re.MULTILINE),
+            'class_def': re.compile(r'class\s+(\w+)\s*\{', re.MULTILINE),
+            'imports': re.compile(r'import\s+.*?from\s+.*?;|require\s*\(.*?\)', re.MULTILINE),
+            'comments': re.compile(r'//.*$|/\*[\s\S]*?\*/', re.MULTILINE),
+            'arrow_functions': re.compile(r'=>', re.MULTILINE)
+        },
+        'typescript': {
+            'function_def': re.compile(r'function\s+(\w+)\s*\(|(\w+)\s*=\s*function|\(\s*\)\s*=>|(\w+)\s*=>\s*\{', re.MULTILINE),
+            'class_def': re.compile(r'class\s+(\w+)\s*\{', re.MULTILINE),
+            'interface_def': re.compile(r'interface\s+(\w+)\s*\{', re.MULTILINE),
+            'type_def': re.compile(r'type\s+(\w+)\s*=', re.MULTILINE),
+            'imports': re.compile(r'import\s+.*?from\s+.*?;', re.MULTILINE),
+            'comments': re.compile(r'//.*$|/\*[\s\S]*?\*/', re.MULTILINE),
+            'type_annotations': re.compile(r':\s*\w+[\[\]<>]*', re.MULTILINE)
+        }
+    }
+
+    def __init__(self, cache_size: int = 256,
+                 similarity_backend: Union[str, SimilarityBackend] = SimilarityBackend.SEQUENCE_MATCHER,
+                 similarity_precision: int = 128):
         self.logger = logging.getLogger(__name__)
+        self.language_patterns = self.LANGUAGE_PATTERNS
         
-        # Language-specific patterns
-        self.language_patterns = {
-            'python': {
-                'function_def': r'def\s+(\w+)\s*\(',
-                'class_def': r'class\s+(\w+)\s*[\(:]',
-                'imports': r'(?:from\s+\w+\s+)?import\s+[\w\.,\s]+',
-                'comments': r'#.*$',
-                'docstrings': r'"""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\''
-            },
-            'javascript': {
-                'function_def': r'function\s+(\w+)\s*\(|(\w+)\s*=\s*function|\(\s*\)\s*=>|(\w+)\s*=>\s*\{',
-                'class_def': r'class\s+(\w+)\s*\{',
-                'imports': r'import\s+.*?from\s+.*?;|require\s*\(.*?\)',
-                'comments': r'//.*$|/\*[\s\S]*?\*/',
-                'arrow_functions': r'=>'
-            },
-            'typescript': {
-                'function_def': r'function\s+(\w+)\s*\(|(\w+)\s*=\s*function|\(\s*\)\s*=>|(\w+)\s*=>\s*\{',
-                'class_def': r'class\s+(\w+)\s*\{',
-                'interface_def': r'interface\s+(\w+)\s*\{',
-                'type_def': r'type\s+(\w+)\s*=',
-                'imports': r'import\s+.*?from\s+.*?;',
-                'comments': r'//.*$|/\*[\s\S]*?\*/',
-                'type_annotations': r':\s*\w+[\[\]<>]*'
-            }
-        }
-    
+        # Lexical similarity backend (exact SequenceMatcher or approximate MinHash)
+        self.similarity = create_similarity_backend(similarity_backend, num_hashes=similarity_precision)
+
+        # Parsed ASTs, regex features and style features keyed by code hash
+        self.feature_cache = FeatureCache(maxsize=cache_size)
+
     def extract_code_features(self, code: str, language: str) -> Dict[str, Any]:
+        """Extract comprehensive features from code (cached, treat as read-only)"""
+        return self.feature_cache.get_or_compute(
+            'features', code, language,
+            lambda: self._extract_code_features_uncached(code, language)
+        )
+
+    def _extract_code_features_uncached(self, code: str, language: str) -> Dict[str, Any]:
         """Extract comprehensive features from code"""
         features = {
             'line_count': len(code.split('\n')),
@@ -176,23 +260,23 @@ class AdvancedCodeAnalyzer:
         
         # Extract functions
         if 'function_def' in patterns:
-            features['functions'] = re.findall(patterns['function_def'], code, re.MULTILINE)
+            features['functions'] = patterns['function_def'].findall(code)
             
         # Extract classes
         if 'class_def' in patterns:
-            features['classes'] = re.findall(patterns['class_def'], code, re.MULTILINE)
+            features['classes'] = patterns['class_def'].findall(code)
             
         # Extract interfaces (TypeScript)
         if 'interface_def' in patterns:
-            features['interfaces'] = re.findall(patterns['interface_def'], code, re.MULTILINE)
+            features['interfaces'] = patterns['interface_def'].findall(code)
             
         # Extract imports
         if 'imports' in patterns:
-            features['imports'] = re.findall(patterns['imports'], code, re.MULTILINE)
+            features['imports'] = patterns['imports'].findall(code)
             
         # Extract comments
         if 'comments' in patterns:
-            features['comments'] = re.findall(patterns['comments'], code, re.MULTILINE)
+            features['comments'] = patterns['comments'].findall(code)
         
         # Calculate complexity indicators
         features['complexity_indicators'] = self._calculate_complexity_indicators(code, language)
@@ -207,10 +291,9 @@ class AdvancedCodeAnalyzer:
         non_empty_lines = [line for line in lines if line.strip()]
         
         # Cyclomatic complexity (simplified)
-        decision_keywords = ['if', 'elif', 'else', 'while', 'for', 'try', 'except', 'case', 'switch']
         decision_count = sum(
-            len(re.findall(r'\b' + keyword + r'\b', code, re.IGNORECASE))
-            for keyword in decision_keywords
+            len(pattern.findall(code))
+            for pattern in DECISION_KEYWORD_PATTERNS
         )
         indicators['cyclomatic_complexity'] = decision_count + 1
         
@@ -229,11 +312,11 @@ class AdvancedCodeAnalyzer:
         
         # Halstead metrics (simplified)
         # This is a very basic approximation
-        unique_operators = len(set(re.findall(r'[+\-*/=<>!&|^%]+', code)))
-        unique_operands = len(set(re.findall(r'\b[a-zA-Z_]\w*\b', code)))
+        unique_operators = len(set(OPERATOR_PATTERN.findall(code)))
+        unique_operands = len(set(IDENTIFIER_PATTERN.findall(code)))
         
         indicators['halstead_vocabulary'] = unique_operators + unique_operands
-        indicators['halstead_length'] = len(re.findall(r'[+\-*/=<>!&|^%]+|\b[a-zA-Z_]\w*\b', code))
+        indicators['halstead_length'] = len(TOKEN_PATTERN.findall(code))
         
         return indicators
     
@@ -250,22 +333,33 @@ class AdvancedCodeAnalyzer:
     
     def _python_ast_similarity(self, code1: str, code2: str) -> float:
         """Calculate similarity using Python AST"""
-        try:
-            ast1 = ast.parse(code1)
-            ast2 = ast.parse(code2)
-            
-            # Extract structural elements
-            elements1 = self._extract_ast_elements(ast1)
-            elements2 = self._extract_ast_elements(ast2)
-            
-            # Calculate similarity
-            common_elements = len(elements1.intersection(elements2))
-            total_elements = len(elements1.union(elements2))
-            
-            return common_elements / total_elements if total_elements > 0 else 0.0
-            
-        except SyntaxError:
+        # Extract structural elements
+        elements1 = self.get_python_ast_elements(code1)
+        elements2 = self.get_python_ast_elements(code2)
+        
+        if elements1 is None or elements2 is None:
             return self._fallback_similarity(code1, code2)
+        
+        # Calculate similarity
+        common_elements = len(elements1.intersection(elements2))
+        total_elements = len(elements1.union(elements2))
+        
+        return common_elements / total_elements if total_elements > 0 else 0.0
+    
+    def get_python_ast_elements(self, code: str) -> Optional[frozenset]:
+        """Parse Python code once and return its structural elements, or None if it does not parse"""
+        return self.feature_cache.get_or_compute(
+            'ast_elements', code, 'python',
+            lambda: self._parse_ast_elements(code)
+        )
+    
+    def _parse_ast_elements(self, code: str) -> Optional[frozenset]:
+        """Parse code and extract structural elements without caching"""
+        try:
+            tree = ast.parse(code)
+        except (SyntaxError, ValueError):
+            return None
+        return frozenset(self._extract_ast_elements(tree))
     
     def _extract_ast_elements(self, tree: ast.AST) -> set:
         """Extract structural elements from AST"""
@@ -332,15 +426,28 @@ class AdvancedCodeAnalyzer:
     
     def _fallback_similarity(self, code1: str, code2: str) -> float:
         """Fallback similarity calculation using string comparison"""
-        return difflib.SequenceMatcher(None, code1, code2).ratio()
+        return self.lexical_similarity(code1, code2)
+    
+    def lexical_similarity(self, code1: str, code2: str) -> float:
+        """String similarity using the configured backend (MinHash sketches are cached per code)"""
+        if self.similarity.backend == SimilarityBackend.MINHASH:
+            sig1 = self.feature_cache.get_or_compute('minhash', code1, '', lambda: self.similarity.signature(code1))
+            sig2 = self.feature_cache.get_or_compute('minhash', code2, '', lambda: self.similarity.signature(code2))
+            return 1.0 if code1 == code2 else self.similarity.compare(sig1, sig2)
+        return self.similarity.similarity(code1, code2)
 
 
 class ConsensusEngine:
     """Main consensus analysis engine"""
     
-    def __init__(self, model_weights: Optional[Dict[str, float]] = None):
+    def __init__(self, model_weights: Optional[Dict[str, float]] = None,
+                 similarity_backend: Union[str, SimilarityBackend] = SimilarityBackend.SEQUENCE_MATCHER,
+                 similarity_precision: int = 128):
         self.logger = logging.getLogger(__name__)
-        self.code_analyzer = AdvancedCodeAnalyzer()
+        self.code_analyzer = AdvancedCodeAnalyzer(
+            similarity_backend=similarity_backend,
+            similarity_precision=similarity_precision
+        )
         
         # Model reliability weights (can be learned over time)
         self.model_weights = model_weights or {
@@ -467,8 +574,8 @@ class ConsensusEngine:
         code1 = result1.transformed_code
         code2 = result2.transformed_code
         
-        # Lexical similarity (string-based)
-        lexical_sim = difflib.SequenceMatcher(None, code1, code2).ratio()
+        # Lexical similarity (string-based, backend selected at construction)
+        lexical_sim = self.code_analyzer.lexical_similarity(code1, code2)
         
         # Structural similarity (AST/pattern-based)
         structural_sim = self.code_analyzer.calculate_structural_similarity(code1, code2, language)
@@ -558,6 +665,13 @@ class ConsensusEngine:
         return statistics.mean(similarities) if similarities else 0.5
     
     def _extract_style_features(self, code: str, language: str) -> Dict[str, Any]:
+        """Extract style-related features from code (cached, treat as read-only)"""
+        return self.code_analyzer.feature_cache.get_or_compute(
+            'style', code, language,
+            lambda: self._extract_style_features_uncached(code, language)
+        )
+    
+    def _extract_style_features_uncached(self, code: str, language: str) -> Dict[str, Any]:
         """Extract style-related features from code"""
         lines = code.split('\n')
         non_empty_lines = [line for line in lines if line.strip()]
@@ -573,7 +687,7 @@ class ConsensusEngine:
                 break
         
         # Extract identifiers for naming convention analysis
-        identifiers = re.findall(r'\b[a-zA-Z_]\w*\b', code)
+        identifiers = IDENTIFIER_PATTERN.findall(code)
         
         # Calculate average line length
         avg_line_length = statistics.mean([len(line) for line in non_empty_lines]) if non_empty_lines else 0
@@ -691,9 +805,10 @@ class ConsensusEngine:
         
         try:
             if language == 'python':
-                # Try to parse both as valid Python
-                ast.parse(result1.transformed_code)
-                ast.parse(result2.transformed_code)
+                # Both must parse as valid Python (parses are cached per code)
+                if (self.code_analyzer.get_python_ast_elements(result1.transformed_code) is None or
+                        self.code_analyzer.get_python_ast_elements(result2.transformed_code) is None):
+                    return 0.3  # Syntax error in one or both
                 return 1.0  # Both are syntactically valid
             else:
                 # For other languages, use basic pattern matching
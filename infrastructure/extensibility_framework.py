@@ -17,14 +17,18 @@ import importlib
 import inspect
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Type, Callable, Union
+from typing import Dict, List, Optional, Any, Type, Callable, Tuple, Union
 from datetime import datetime
 from enum import Enum
 import logging
 import pkgutil
 import sys
+import time
 from pathlib import Path
 
+from .plugin_manifest import ManifestEntry, PluginManifest
+from .plugin_metrics import PluginMetrics, metrics_to_json, metrics_to_prometheus
+
 # Plugin system imports
 try:
     import pluggy
@@ -73,6 +77,7 @@ class PluginMetadata:
     license: str = "MIT"
     repository: Optional[str] = None
     documentation_url: Optional[str] = None
+    side_effect_free: bool = False  # Hook only reads its input and needs no other hook's result; may run concurrently
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
@@ -88,7 +93,8 @@ class PluginMetadata:
             "compatibility": self.compatibility,
             "license": self.license,
             "repository": self.repository,
-            "documentation_url": self.documentation_url
+            "documentation_url": self.documentation_url,
+            "side_effect_free": self.side_effect_free
         }
 
 
@@ -119,12 +125,7 @@ class BasePlugin(ABC):
         self.configuration = configuration or {}
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         self.is_initialized = False
-        self.performance_metrics = {
-            "total_calls": 0,
-            "successful_calls": 0,
-            "total_time": 0.0,
-            "errors": []
-        }
+        self.performance_metrics = PluginMetrics()
     
     @property
     @abstractmethod
@@ -173,37 +174,16 @@ class BasePlugin(ABC):
         return True
     
     def get_performance_metrics(self) -> Dict[str, Any]:
-        """Get plugin performance metrics"""
-        avg_time = (self.performance_metrics["total_time"] / 
-                   max(self.performance_metrics["total_calls"], 1))
-        success_rate = (self.performance_metrics["successful_calls"] / 
-                       max(self.performance_metrics["total_calls"], 1))
-        
+        """Get plugin performance metrics (latency percentiles overall and per extension point)"""
         return {
             "plugin_name": self.metadata.name,
-            "total_calls": self.performance_metrics["total_calls"],
-            "success_rate": success_rate,
-            "avg_execution_time": avg_time,
-            "error_count": len(self.performance_metrics["errors"]),
-            "last_errors": self.performance_metrics["errors"][-5:]  # Last 5 errors
+            **self.performance_metrics.snapshot()
         }
     
-    def _record_call(self, success: bool, execution_time: float, error: str = None):
+    def _record_call(self, success: bool, execution_time: float, error: str = None,
+                     extension_point: Optional[str] = None):
         """Record performance metrics for a call"""
-        self.performance_metrics["total_calls"] += 1
-        self.performance_metrics["total_time"] += execution_time
-        
-        if success:
-            self.performance_metrics["successful_calls"] += 1
-        else:
-            self.performance_metrics["errors"].append({
-                "timestamp": datetime.now().isoformat(),
-                "error": error or "Unknown error"
-            })
-            
-            # Keep only last 100 errors
-            if len(self.performance_metrics["errors"]) > 100:
-                self.performance_metrics["errors"] = self.performance_metrics["errors"][-100:]
+        self.performance_metrics.record(success, execution_time, error, extension_point)
 
 
 class BaseAPIAdapter(BasePlugin):
@@ -307,9 +287,26 @@ class PluginRegistry:
         self.extension_points: Dict[ExtensionPoint, List[str]] = {}
         self.plugin_dependencies: Dict[str, List[str]] = {}
         
+        # Startup timing from the last initialize_plugins() run
+        self.init_timings: Dict[str, float] = {}
+        self.startup_report: Dict[str, Any] = {}
+        self.started = False
+        
+        # Priority-sorted dispatch lists per extension point, rebuilt after changes
+        self._dispatch_cache: Dict[ExtensionPoint, List[BasePlugin]] = {}
+        self.dispatch_version = 0
+        
+        # Plugins discovered from a manifest, imported on first request
+        self.lazy_plugins: Dict[str, Tuple[ManifestEntry, Callable[[], BasePlugin], Optional[PluginConfiguration]]] = {}
+        self.lazy_extension_points: Dict[ExtensionPoint, List[str]] = {}
+        
+        # Lazy plugins loaded after startup that still need initialize()
+        self.pending_initialization: List[str] = []
+        
         # Initialize extension points
         for ep in ExtensionPoint:
             self.extension_points[ep] = []
+            self.lazy_extension_points[ep] = []
     
     def register_plugin(self, plugin: BasePlugin, configuration: PluginConfiguration = None) -> bool:
         """Register a plugin"""
@@ -344,6 +341,8 @@ class PluginRegistry:
             # Track dependencies
             self.plugin_dependencies[metadata.name] = metadata.dependencies
             
+            self.invalidate_dispatch_cache()
+            
             self.logger.info(f"Registered plugin: {metadata.name} v{metadata.version}")
             return True
             
@@ -351,6 +350,91 @@ class PluginRegistry:
             self.logger.error(f"Failed to register plugin: {e}")
             return False
     
+    def register_lazy_plugin(self, entry: ManifestEntry, factory: Callable[[], BasePlugin],
+                             configuration: PluginConfiguration = None) -> bool:
+        """Register a plugin known from its manifest; factory imports and instantiates it on demand"""
+        if entry.plugin_name in self.plugins or entry.plugin_name in self.lazy_plugins:
+            self.logger.warning(f"Plugin {entry.plugin_name} already registered, skipping lazy entry")
+            return False
+        
+        unknown = [
+            name for name in entry.extension_points if name not in ExtensionPoint.__members__
+        ] + ([entry.plugin_type] if entry.plugin_type not in PluginType.__members__ else [])
+        if unknown:
+            self.logger.error(f"Plugin {entry.plugin_name} references unknown enum members: {unknown}")
+            return False
+        
+        self.lazy_plugins[entry.plugin_name] = (entry, factory, configuration)
+        for ep_name in entry.extension_points:
+            self.lazy_extension_points[ExtensionPoint[ep_name]].append(entry.plugin_name)
+        
+        self.logger.debug(f"Registered lazy plugin: {entry.plugin_name} ({entry.module_name}.{entry.class_name})")
+        return True
+    
+    def materialize_plugin(self, plugin_name: str) -> Optional[BasePlugin]:
+        """Import, instantiate and register a lazy plugin (dependencies first)"""
+        pending = self.lazy_plugins.pop(plugin_name, None)
+        if pending is None:
+            return self.plugins.get(plugin_name)
+        
+        entry, factory, configuration = pending
+        for ep_name in entry.extension_points:
+            self.lazy_extension_points[ExtensionPoint[ep_name]].remove(plugin_name)
+        
+        for dep in entry.dependencies:
+            if dep in self.lazy_plugins:
+                self.materialize_plugin(dep)
+        
+        try:
+            plugin = factory()
+        except Exception as e:
+            self.logger.error(f"Failed to load lazy plugin {plugin_name}: {e}")
+            return None
+        
+        if not self.register_plugin(plugin, configuration):
+            return None
+        if self.started:
+            self.pending_initialization.append(plugin_name)
+        return plugin
+    
+    def _materialize_extension_point(self, extension_point: ExtensionPoint) -> List[str]:
+        """Load the enabled lazy plugins for an extension point; returns the names loaded"""
+        loaded = []
+        for plugin_name in list(self.lazy_extension_points.get(extension_point, [])):
+            _, _, configuration = self.lazy_plugins[plugin_name]
+            if configuration is not None and not configuration.enabled:
+                continue
+            
+            before = set(self.plugins)
+            self.materialize_plugin(plugin_name)
+            loaded.extend(name for name in self.plugins if name not in before)
+        return loaded
+    
+    async def initialize_pending(self) -> Dict[str, bool]:
+        """
+        Initialize lazy plugins that were loaded after startup (dependencies first)
+        
+        The synchronous getters below can load plugins but cannot await their
+        initialization; call this before using what they return.
+        """
+        results = {}
+        while self.pending_initialization:
+            plugin_name = self.pending_initialization.pop(0)
+            if plugin_name in self.plugins and self.plugin_configurations[plugin_name].enabled:
+                results[plugin_name] = await self._initialize_timed(plugin_name)
+        return results
+    
+    async def activate_extension_point(self, extension_point: ExtensionPoint) -> List[str]:
+        """
+        Load lazy plugins for an extension point on first use
+        
+        If the registry has already been started, newly loaded plugins are
+        initialized in dependency order before returning.
+        """
+        loaded = self._materialize_extension_point(extension_point)
+        await self.initialize_pending()
+        return loaded
+    
     def unregister_plugin(self, plugin_name: str) -> bool:
         """Unregister a plugin"""
         try:
@@ -378,6 +462,8 @@ class PluginRegistry:
                 if plugin_name in ep_plugins:
                     ep_plugins.remove(plugin_name)
             
+            self.invalidate_dispatch_cache()
+            
             self.logger.info(f"Unregistered plugin: {plugin_name}")
             return True
             
@@ -386,18 +472,67 @@ class PluginRegistry:
             return False
     
     def get_plugin(self, plugin_name: str) -> Optional[BasePlugin]:
-        """Get a plugin by name"""
+        """
+        Get a plugin by name
+        
+        A lazy plugin is imported here but, after startup, not initialized;
+        the same holds for the getters below. Use load_plugin /
+        load_plugins_by_type to get initialized plugins.
+        """
+        if plugin_name in self.lazy_plugins:
+            return self.materialize_plugin(plugin_name)
         return self.plugins.get(plugin_name)
     
     def get_plugins_by_type(self, plugin_type: PluginType) -> List[BasePlugin]:
-        """Get all plugins of a specific type"""
+        """Get all plugins of a specific type (lazy ones are loaded uninitialized, see get_plugin)"""
+        for plugin_name, (entry, _, _) in list(self.lazy_plugins.items()):
+            if entry.plugin_type == plugin_type.name and plugin_name in self.lazy_plugins:
+                self.materialize_plugin(plugin_name)
+        
         return [
             plugin for plugin in self.plugins.values()
             if plugin.metadata.plugin_type == plugin_type
         ]
     
+    async def load_plugin(self, plugin_name: str) -> Optional[BasePlugin]:
+        """get_plugin, initializing a lazy plugin it loads after startup"""
+        plugin = self.get_plugin(plugin_name)
+        await self.initialize_pending()
+        return plugin
+    
+    async def load_plugins_by_type(self, plugin_type: PluginType) -> List[BasePlugin]:
+        """get_plugins_by_type, initializing lazy plugins it loads after startup"""
+        plugins = self.get_plugins_by_type(plugin_type)
+        await self.initialize_pending()
+        return plugins
+    
+    def count_plugins_by_type(self) -> Dict[PluginType, int]:
+        """Loaded plus lazy plugins per type, without importing lazy ones"""
+        counts = {plugin_type: 0 for plugin_type in PluginType}
+        for plugin in self.plugins.values():
+            counts[plugin.metadata.plugin_type] += 1
+        for entry, _, _ in self.lazy_plugins.values():
+            counts[PluginType[entry.plugin_type]] += 1
+        return counts
+    
     def get_plugins_for_extension_point(self, extension_point: ExtensionPoint) -> List[BasePlugin]:
-        """Get plugins that implement a specific extension point"""
+        """
+        Get plugins that implement a specific extension point (cached until plugins change)
+        
+        Lazy plugins are loaded uninitialized (see get_plugin); dispatch goes
+        through activate_extension_point, which initializes them.
+        """
+        if self.lazy_extension_points.get(extension_point):
+            self._materialize_extension_point(extension_point)
+        
+        plugins = self._dispatch_cache.get(extension_point)
+        if plugins is None:
+            plugins = self._build_dispatch_list(extension_point)
+            self._dispatch_cache[extension_point] = plugins
+        return plugins
+    
+    def _build_dispatch_list(self, extension_point: ExtensionPoint) -> List[BasePlugin]:
+        """Enabled plugins for an extension point, highest priority first"""
         plugin_names = self.extension_points.get(extension_point, [])
         
         # Sort by priority
@@ -413,6 +548,28 @@ class PluginRegistry:
         
         return [plugin for priority, plugin in plugins_with_priority]
     
+    def invalidate_dispatch_cache(self):
+        """
+        Drop cached dispatch lists
+        
+        Called automatically on register/unregister and by the configuration
+        setters below; call it after mutating a PluginConfiguration directly.
+        """
+        self._dispatch_cache.clear()
+        self.dispatch_version += 1
+    
+    def set_plugin_enabled(self, plugin_name: str, enabled: bool):
+        """Enable or disable a registered plugin"""
+        if plugin_name in self.plugin_configurations:
+            self.plugin_configurations[plugin_name].enabled = enabled
+            self.invalidate_dispatch_cache()
+    
+    def set_plugin_priority(self, plugin_name: str, priority: int):
+        """Change the dispatch priority of a registered plugin"""
+        if plugin_name in self.plugin_configurations:
+            self.plugin_configurations[plugin_name].priority = priority
+            self.invalidate_dispatch_cache()
+    
     def list_plugins(self) -> List[Dict[str, Any]]:
         """List all registered plugins"""
         return [
@@ -426,24 +583,81 @@ class PluginRegistry:
         ]
     
     async def initialize_plugins(self) -> Dict[str, bool]:
-        """Initialize all plugins"""
-        results = {}
+        """
+        Initialize all plugins
         
-        # Sort plugins by dependencies
-        sorted_plugins = self._topological_sort()
+        Plugins are grouped into dependency levels; every plugin in a level
+        only depends on plugins from earlier levels, so each level is
+        initialized concurrently.
+        """
+        results = {}
+        self.init_timings = {}
+        level_timings = []
+        startup_start = time.perf_counter()
         
-        for plugin_name in sorted_plugins:
-            if plugin_name in self.plugins:
-                plugin = self.plugins[plugin_name]
-                config = self.plugin_configurations[plugin_name]
-                
-                if config.enabled:
-                    results[plugin_name] = await plugin.initialize()
+        for level in self._dependency_levels():
+            level_start = time.perf_counter()
+            enabled = []
+            
+            for plugin_name in level:
+                if self.plugin_configurations[plugin_name].enabled:
+                    enabled.append(plugin_name)
                 else:
                     results[plugin_name] = True  # Disabled plugins are "successful"
+            
+            level_results = await asyncio.gather(
+                *(self._initialize_timed(plugin_name) for plugin_name in enabled),
+                return_exceptions=True
+            )
+            
+            for plugin_name, success in zip(enabled, level_results):
+                if isinstance(success, BaseException):
+                    self.logger.error(f"Failed to initialize plugin {plugin_name}: {success}")
+                    success = False
+                results[plugin_name] = success
+            
+            level_timings.append({
+                "plugins": len(level),
+                "initialized": len(enabled),
+                "wall_time": time.perf_counter() - level_start
+            })
         
+        self.startup_report = self._build_startup_report(
+            time.perf_counter() - startup_start, level_timings
+        )
+        self.started = True
         return results
     
+    async def _initialize_timed(self, plugin_name: str) -> bool:
+        """Initialize one plugin and record how long it took"""
+        start = time.perf_counter()
+        try:
+            return await self.plugins[plugin_name].initialize()
+        finally:
+            self.init_timings[plugin_name] = time.perf_counter() - start
+    
+    def _build_startup_report(self, total_time: float, level_timings: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Summarize the last plugin startup"""
+        sequential_time = sum(self.init_timings.values())
+        slowest = sorted(self.init_timings.items(), key=lambda x: x[1], reverse=True)[:5]
+        
+        return {
+            "total_plugins": len(self.plugins),
+            "lazy_plugins": len(self.lazy_plugins),
+            "dependency_levels": len(level_timings),
+            "wall_time": total_time,
+            "sequential_time": sequential_time,
+            "speedup": sequential_time / total_time if total_time > 0 else 1.0,
+            "levels": level_timings,
+            "slowest_plugins": [
+                {"plugin_name": name, "init_time": duration} for name, duration in slowest
+            ]
+        }
+    
+    def get_startup_report(self) -> Dict[str, Any]:
+        """Get timing report for the last initialize_plugins() run"""
+        return self.startup_report
+    
     async def cleanup_plugins(self):
         """Cleanup all plugins"""
         for plugin in self.plugins.values():
@@ -526,15 +740,44 @@ class PluginRegistry:
             visit(plugin_name)
         
         return result
+    
+    def _dependency_levels(self) -> List[List[str]]:
+        """Group plugins into levels where each plugin depends only on earlier levels"""
+        levels: Dict[str, int] = {}
+        
+        for plugin_name in self._topological_sort():
+            dep_levels = [
+                levels[dep] for dep in self.plugin_dependencies.get(plugin_name, [])
+                if dep in levels
+            ]
+            levels[plugin_name] = max(dep_levels) + 1 if dep_levels else 0
+        
+        grouped: List[List[str]] = [[] for _ in range(max(levels.values()) + 1)] if levels else []
+        for plugin_name, level in levels.items():
+            grouped[level].append(plugin_name)
+        
+        return grouped
 
 
 class PluginLoader:
-    """Loads plugins from various sources"""
+    """
+    Loads plugins from various sources
+    
+    With lazy=True, plugin directories are described by a static manifest
+    (see plugin_manifest.py) and modules are only imported when one of their
+    plugins is first requested from the registry. Modules the manifest cannot
+    describe statically are imported immediately. Lazy plugins requested
+    through the synchronous registry getters after startup are returned
+    uninitialized; use the async load_* getters (or execute_hooks) instead.
+    """
     
-    def __init__(self, plugin_registry: PluginRegistry):
+    def __init__(self, plugin_registry: PluginRegistry, lazy: bool = False,
+                 manifest_cache: Optional[str] = None):
         self.registry = plugin_registry
         self.logger = logging.getLogger(__name__)
         self.plugin_directories = ["plugins", "extensions", "addons"]
+        self.lazy = lazy
+        self.manifest = PluginManifest(manifest_cache)
     
     def add_plugin_directory(self, directory: str):
         """Add a directory to search for plugins"""
@@ -551,44 +794,65 @@ class PluginLoader:
                 self.logger.warning(f"Plugin directory {directory} does not exist")
                 return results
             
-            # Add to Python path
-            sys.path.insert(0, str(plugin_dir))
-            
-            try:
-                # Scan for plugin modules
+            if not self.lazy:
                 for module_info in pkgutil.iter_modules([str(plugin_dir)]):
-                    module_name = module_info.name
-                    
-                    try:
-                        # Import module
-                        module = importlib.import_module(module_name)
-                        
-                        # Find plugin classes
-                        for name, obj in inspect.getmembers(module, inspect.isclass):
-                            if (issubclass(obj, BasePlugin) and 
-                                obj != BasePlugin and 
-                                not inspect.isabstract(obj)):
-                                
-                                # Create plugin instance
-                                plugin = obj()
-                                
-                                # Register plugin
-                                success = self.registry.register_plugin(plugin)
-                                results[f"{module_name}.{name}"] = success
-                                
-                    except Exception as e:
-                        self.logger.error(f"Failed to load plugin module {module_name}: {e}")
-                        results[module_name] = False
-                        
-            finally:
-                # Remove from Python path
-                sys.path.remove(str(plugin_dir))
+                    self._import_plugin_module(plugin_dir, module_info.name, results)
+                return results
+            
+            # Describe modules statically; import only what cannot be described
+            for module in self.manifest.scan_directory(plugin_dir):
+                if not module.static:
+                    self._import_plugin_module(plugin_dir, module.module_name, results)
+                    continue
+                
+                for entry in module.entries:
+                    results[f"{entry.module_name}.{entry.class_name}"] = self.registry.register_lazy_plugin(
+                        entry, lambda entry=entry: self._instantiate_entry(plugin_dir, entry)
+                    )
                 
         except Exception as e:
             self.logger.error(f"Failed to load plugins from {directory}: {e}")
         
         return results
     
+    def _import_module(self, plugin_dir: Path, module_name: str):
+        """Import a module from a plugin directory"""
+        # Add to Python path
+        sys.path.insert(0, str(plugin_dir))
+        try:
+            return importlib.import_module(module_name)
+        finally:
+            # Remove from Python path
+            sys.path.remove(str(plugin_dir))
+    
+    def _import_plugin_module(self, plugin_dir: Path, module_name: str, results: Dict[str, bool]):
+        """Import a module and register every concrete plugin class it exposes"""
+        try:
+            # Import module
+            module = self._import_module(plugin_dir, module_name)
+            
+            # Find plugin classes
+            for name, obj in inspect.getmembers(module, inspect.isclass):
+                if (issubclass(obj, BasePlugin) and 
+                    obj != BasePlugin and 
+                    not inspect.isabstract(obj)):
+                    
+                    # Create plugin instance
+                    plugin = obj()
+                    
+                    # Register plugin
+                    success = self.registry.register_plugin(plugin)
+                    results[f"{module_name}.{name}"] = success
+                    
+        except Exception as e:
+            self.logger.error(f"Failed to load plugin module {module_name}: {e}")
+            results[module_name] = False
+    
+    def _instantiate_entry(self, plugin_dir: Path, entry: ManifestEntry) -> BasePlugin:
+        """Import the module behind a manifest entry and instantiate its plugin class"""
+        module = self._import_module(plugin_dir, entry.module_name)
+        return getattr(module, entry.class_name)()
+    
     async def load_from_package(self, package_name: str) -> bool:
         """Load plugin from installed package"""
         try:
@@ -644,14 +908,31 @@ class PluginLoader:
 
 
 class ExtensibilityManager:
-    """Main manager for the extensibility framework"""
+    """
+    Main manager for the extensibility framework
+    
+    Args:
+        concurrent_hooks: Run consecutive hooks whose metadata declares
+            side_effect_free=True concurrently. Every hook in a concurrent
+            run sees the data as it was before the run and results are merged
+            in priority order, so the outcome matches sequential execution
+            only if those hooks do not depend on each other's results and do
+            not mutate the shared input
+        lazy_plugins: Discover directory plugins from a static manifest and
+            import them on first use (see PluginLoader); fetch them with the
+            async load_* getters so they are initialized
+    """
     
-    def __init__(self):
+    def __init__(self, concurrent_hooks: bool = False, lazy_plugins: bool = False):
         self.logger = logging.getLogger(__name__)
         self.plugin_registry = PluginRegistry()
-        self.plugin_loader = PluginLoader(self.plugin_registry)
+        self.plugin_loader = PluginLoader(self.plugin_registry, lazy=lazy_plugins)
         self.event_handlers: Dict[str, List[Callable]] = {}
         self.is_initialized = False
+        self.concurrent_hooks = concurrent_hooks
+        
+        # Hook execution plans per extension point, keyed by registry dispatch version
+        self._hook_plans: Dict[ExtensionPoint, Tuple[int, List[Tuple[bool, List[BaseIntegrationHook]]]]] = {}
     
     async def initialize(self, config: Dict[str, Any] = None) -> bool:
         """Initialize the extensibility framework"""
@@ -716,25 +997,90 @@ class ExtensibilityManager:
         """Get all integration hook plugins"""
         return self.plugin_registry.get_plugins_by_type(PluginType.INTEGRATION_HOOK)
     
+    async def load_plugins_by_type(self, plugin_type: PluginType) -> List[BasePlugin]:
+        """
+        Get all plugins of a type, initialized
+        
+        The synchronous getters above cannot initialize lazy plugins loaded
+        after startup (lazy_plugins=True); this can.
+        """
+        return await self.plugin_registry.load_plugins_by_type(plugin_type)
+    
     async def execute_hooks(self, extension_point: ExtensionPoint, 
                           data: Dict[str, Any]) -> Dict[str, Any]:
         """Execute hooks for an extension point"""
-        plugins = self.plugin_registry.get_plugins_for_extension_point(extension_point)
+        if self.plugin_registry.lazy_extension_points.get(extension_point):
+            await self.plugin_registry.activate_extension_point(extension_point)
         
         result_data = data.copy()
+        event_type = extension_point.value
         
-        for plugin in plugins:
-            try:
-                if isinstance(plugin, BaseIntegrationHook):
-                    hook_result = await plugin.handle_event(extension_point.value, result_data)
-                    if hook_result:
-                        result_data.update(hook_result)
-                        
-            except Exception as e:
-                self.logger.error(f"Hook execution failed for {plugin.metadata.name}: {e}")
+        for concurrent, hooks in self._get_hook_plan(extension_point):
+            if not concurrent:
+                for plugin in hooks:
+                    try:
+                        hook_result = await self._run_hook(plugin, event_type, result_data)
+                        if hook_result:
+                            result_data.update(hook_result)
+                    except Exception as e:
+                        self.logger.error(f"Hook execution failed for {plugin.metadata.name}: {e}")
+                continue
+            
+            # Side-effect-free hooks all see result_data as it was before this group
+            # (none of each other's results); merge in priority order
+            hook_results = await asyncio.gather(
+                *(self._run_hook(plugin, event_type, result_data) for plugin in hooks),
+                return_exceptions=True
+            )
+            for plugin, hook_result in zip(hooks, hook_results):
+                if isinstance(hook_result, BaseException):
+                    self.logger.error(f"Hook execution failed for {plugin.metadata.name}: {hook_result}")
+                elif hook_result:
+                    result_data.update(hook_result)
         
         return result_data
     
+    async def _run_hook(self, plugin: BaseIntegrationHook, event_type: str,
+                        data: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one hook, recording its latency under the extension point"""
+        start_time = time.perf_counter()
+        try:
+            hook_result = await plugin.handle_event(event_type, data)
+        except Exception as e:
+            plugin._record_call(False, time.perf_counter() - start_time, str(e), event_type)
+            raise
+        plugin._record_call(True, time.perf_counter() - start_time, extension_point=event_type)
+        return hook_result
+    
+    def _get_hook_plan(self, extension_point: ExtensionPoint) -> List[Tuple[bool, List[BaseIntegrationHook]]]:
+        """
+        Hooks for an extension point as (concurrent, hooks) groups in priority order
+        
+        Without concurrent_hooks there is a single sequential group. With it,
+        runs of side-effect-free hooks form concurrent groups and every other
+        hook stays a sequential barrier between them.
+        """
+        version = self.plugin_registry.dispatch_version
+        cached = self._hook_plans.get(extension_point)
+        if cached and cached[0] == version:
+            return cached[1]
+        
+        hooks = [
+            plugin for plugin in self.plugin_registry.get_plugins_for_extension_point(extension_point)
+            if isinstance(plugin, BaseIntegrationHook)
+        ]
+        
+        plan: List[Tuple[bool, List[BaseIntegrationHook]]] = []
+        for plugin in hooks:
+            concurrent = self.concurrent_hooks and plugin.metadata.side_effect_free
+            if plan and plan[-1][0] == concurrent:
+                plan[-1][1].append(plugin)
+            else:
+                plan.append((concurrent, [plugin]))
+        
+        self._hook_plans[extension_point] = (version, plan)
+        return plan
+    
     def register_event_handler(self, event_type: str, handler: Callable):
         """Register an event handler"""
         if event_type not in self.event_handlers:
@@ -756,19 +1102,21 @@ class ExtensibilityManager:
     
     def get_plugin_status(self) -> Dict[str, Any]:
         """Get status of all plugins"""
+        # Lazy plugins are counted from their manifest entries, not imported
+        by_type = self.plugin_registry.count_plugins_by_type()
         return {
-            "total_plugins": len(self.plugin_registry.plugins),
+            "total_plugins": sum(by_type.values()),
             "initialized_plugins": sum(
                 1 for plugin in self.plugin_registry.plugins.values()
                 if plugin.is_initialized
             ),
             "plugins_by_type": {
-                plugin_type.value: len(self.plugin_registry.get_plugins_by_type(plugin_type))
-                for plugin_type in PluginType
+                plugin_type.value: count for plugin_type, count in by_type.items()
             },
             "extension_points": {
                 ep.value: len(plugins) for ep, plugins in self.plugin_registry.extension_points.items()
-            }
+            },
+            "lazy_plugins": len(self.plugin_registry.lazy_plugins)
         }
     
     def get_plugin_performance(self) -> List[Dict[str, Any]]:
@@ -778,6 +1126,17 @@ class ExtensibilityManager:
             for plugin in self.plugin_registry.plugins.values()
         ]
     
+    def export_plugin_metrics(self, format: str = "json") -> str:
+        """Export plugin performance metrics as "json" or "prometheus" text"""
+        if format == "json":
+            return metrics_to_json(self.get_plugin_performance())
+        if format == "prometheus":
+            return metrics_to_prometheus(
+                (name, plugin.performance_metrics)
+                for name, plugin in self.plugin_registry.plugins.items()
+            )
+        raise ValueError(f"Unknown metrics format: {format}")
+    
     async def _load_core_plugins(self):
         """Load core built-in plugins"""
         # This would load essential plugins that come with the system
@@ -0,0 +1,148 @@
+"""
+CodeVerter Federation Frame Batching
+
+Coalesces Federation requests issued within a short window into a single
+WebSocket frame and splits batched frames back into individual messages.
+
+Frame format:
+    single message:  {"request_id": ..., ...}                 (unchanged wire format)
+    batched frame:   {"type": "batch", "messages": [{...}, {...}]}
+
+Uses orjson for encoding/decoding when it is installed.
+"""
+
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+import logging
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+BATCH_FRAME_TYPE = "batch"
+
+
+def dumps(data: Any) -> str:
+    """Encode a message as JSON text, preferring orjson"""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(data).decode("utf-8")
+        except TypeError:
+            # Non-string keys or exotic types: fall back to the stdlib encoder
+            pass
+    return json.dumps(data)
+
+
+def loads(frame: Any) -> Any:
+    """Decode JSON text or bytes, preferring orjson"""
+    if HAS_ORJSON:
+        return orjson.loads(frame)
+    return json.loads(frame)
+
+
+def encode_frame(messages: List[Dict[str, Any]]) -> str:
+    """Encode one or more messages into a single frame"""
+    if len(messages) == 1:
+        return dumps(messages[0])
+    return dumps({"type": BATCH_FRAME_TYPE, "messages": messages})
+
+
+def decode_frame(frame: Any) -> List[Dict[str, Any]]:
+    """Decode a frame into its messages (a plain frame yields one message)"""
+    data = loads(frame)
+    if isinstance(data, dict) and data.get("type") == BATCH_FRAME_TYPE:
+        return data.get("messages", [])
+    return [data]
+
+
+class FrameBatcher:
+    """
+    Coalesce outgoing messages into batched frames
+
+    The first message submitted in an idle period opens a window of
+    `window` seconds; every message submitted before it closes is sent in the
+    same frame. A full batch (max_batch_size) is sent immediately. submit()
+    returns once the frame carrying the message has been sent, so transport
+    errors reach the caller.
+
+    Args:
+        send: Coroutine function that transmits one encoded frame
+        window: Seconds to wait for more messages before sending
+        max_batch_size: Maximum messages per frame
+    """
+
+    def __init__(self, send: Callable[[str], Awaitable[Any]], window: float = 0.002,
+                 max_batch_size: int = 100):
+        self._send = send
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.logger = logging.getLogger(__name__)
+
+        self._pending: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+        # Statistics
+        self.frames_sent = 0
+        self.messages_sent = 0
+
+    async def submit(self, message: Dict[str, Any]):
+        """Queue a message and wait until the frame carrying it is sent"""
+        sent = asyncio.get_running_loop().create_future()
+        self._pending.append((message, sent))
+
+        if len(self._pending) >= self.max_batch_size:
+            await self.flush()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.ensure_future(self._flush_after_window())
+
+        await sent
+
+    async def _flush_after_window(self):
+        """Send whatever is pending once the batching window closes"""
+        try:
+            await asyncio.sleep(self.window)
+        finally:
+            self._flush_task = None
+        await self.flush()
+
+    async def flush(self):
+        """Send all pending messages as one frame"""
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        frame = encode_frame([message for message, _ in batch])
+        try:
+            await self._send(frame)
+        except Exception as e:
+            for _, sent in batch:
+                if not sent.done():
+                    sent.set_exception(e)
+            return
+
+        self.frames_sent += 1
+        self.messages_sent += len(batch)
+        for _, sent in batch:
+            if not sent.done():
+                sent.set_result(None)
+
+    async def close(self):
+        """Send anything still pending and stop the window timer"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self.flush()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Batching statistics for monitoring"""
+        return {
+            "frames_sent": self.frames_sent,
+            "messages_sent": self.messages_sent,
+            "avg_batch_size": self.messages_sent / self.frames_sent if self.frames_sent else 0.0,
+            "pending": len(self._pending),
+            "fast_json": HAS_ORJSON
+        }
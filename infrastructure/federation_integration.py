@@ -7,6 +7,7 @@ specialized satellites, and the Kryssie Method session memory.
 """
 
 import asyncio
+import heapq
 import json
 import websockets
 import aiohttp
@@ -16,6 +17,13 @@ from datetime import datetime, timedelta
 from enum import Enum
 import logging
 import uuid
+from collections import deque
+
+from .federation_batching import FrameBatcher, decode_frame, dumps
+from .session_store import SQLiteSessionStore
+from .session_stats import (
+    QUALITY_WINDOW, RESPONSE_TIME_WINDOW, SessionAggregates
+)
 
 # SERAPHINA Framework imports
 try:
@@ -113,6 +121,8 @@ class SessionContext:
     performance_metrics: Dict[str, Any] = field(default_factory=dict)
     created_at: datetime = field(default_factory=datetime.now)
     last_updated: datetime = field(default_factory=datetime.now)
+    # Running statistics updated by store_memory; rebuilt from the fields above on load
+    aggregates: SessionAggregates = field(default_factory=SessionAggregates)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for storage"""
@@ -130,22 +140,29 @@ class SessionContext:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'SessionContext':
         """Create from dictionary"""
+        learned_patterns = data.get("learned_patterns", {})
+        performance_metrics = data.get("performance_metrics", {})
+        interaction_history = data.get("interaction_history", [])
         return cls(
             session_id=data["session_id"],
             user_id=data["user_id"],
             preferences=data.get("preferences", {}),
-            interaction_history=data.get("interaction_history", []),
-            learned_patterns=data.get("learned_patterns", {}),
-            performance_metrics=data.get("performance_metrics", {}),
+            interaction_history=interaction_history,
+            learned_patterns=learned_patterns,
+            performance_metrics=performance_metrics,
             created_at=datetime.fromisoformat(data.get("created_at", datetime.now().isoformat())),
-            last_updated=datetime.fromisoformat(data.get("last_updated", datetime.now().isoformat()))
+            last_updated=datetime.fromisoformat(data.get("last_updated", datetime.now().isoformat())),
+            aggregates=SessionAggregates.from_session_data(
+                learned_patterns, performance_metrics, interaction_history
+            )
         )
 
 
 class FederationRouter:
     """Router for Federation Space services"""
     
-    def __init__(self, federation_endpoint: str = "wss://federation.seraphina.space"):
+    def __init__(self, federation_endpoint: str = "wss://federation.seraphina.space",
+                 batch_window: float = 0.0, max_batch_size: int = 100):
         self.federation_endpoint = federation_endpoint
         self.logger = logging.getLogger(__name__)
         self.connection = None
@@ -153,6 +170,11 @@ class FederationRouter:
         self.pending_requests: Dict[str, asyncio.Future] = {}
         self.service_registry: Dict[str, Dict[str, Any]] = {}
         
+        # Request batching (disabled when batch_window is 0)
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.batcher: Optional[FrameBatcher] = None
+        
         # Performance tracking
         self.request_count = 0
         self.successful_requests = 0
@@ -188,6 +210,14 @@ class FederationRouter:
             self.connection_status = "connected"
             self.reconnect_attempts = 0
             
+            # Coalesce requests issued within batch_window into one frame
+            if self.batch_window > 0:
+                self.batcher = FrameBatcher(
+                    self.connection.send,
+                    window=self.batch_window,
+                    max_batch_size=self.max_batch_size
+                )
+            
             # Start message handler
             asyncio.create_task(self._message_handler())
             
@@ -207,6 +237,9 @@ class FederationRouter:
     
     async def disconnect(self):
         """Disconnect from Federation Space"""
+        if self.batcher:
+            await self.batcher.close()
+            self.batcher = None
         if self.connection:
             await self.connection.close()
             self.connection = None
@@ -326,8 +359,11 @@ class FederationRouter:
         self.pending_requests[request.request_id] = future
         
         try:
-            # Send request
-            await self.connection.send(json.dumps(request.to_dict()))
+            # Send request (batched with concurrent requests when enabled)
+            if self.batcher:
+                await self.batcher.submit(request.to_dict())
+            else:
+                await self.connection.send(dumps(request.to_dict()))
             
             # Wait for response with timeout
             response = await asyncio.wait_for(future, timeout=request.timeout)
@@ -355,16 +391,17 @@ class FederationRouter:
         try:
             async for message in self.connection:
                 try:
-                    data = json.loads(message)
-                    request_id = data.get("request_id")
-                    
-                    if request_id in self.pending_requests:
-                        future = self.pending_requests[request_id]
-                        response = FederationResponse.from_dict(data)
-                        future.set_result(response)
-                    else:
-                        # Handle unsolicited messages (notifications, etc.)
-                        await self._handle_notification(data)
+                    # A frame carries one message or a batch of them
+                    for data in decode_frame(message):
+                        request_id = data.get("request_id")
+                        
+                        if request_id in self.pending_requests:
+                            future = self.pending_requests[request_id]
+                            if not future.done():
+                                future.set_result(FederationResponse.from_dict(data))
+                        else:
+                            # Handle unsolicited messages (notifications, etc.)
+                            await self._handle_notification(data)
                         
                 except json.JSONDecodeError as e:
                     self.logger.error(f"Invalid JSON received: {e}")
@@ -486,7 +523,8 @@ class FederationRouter:
             "success_rate": success_rate,
             "avg_response_time": avg_response_time,
             "available_satellites": len(self.service_registry),
-            "reconnect_attempts": self.reconnect_attempts
+            "reconnect_attempts": self.reconnect_attempts,
+            "batching": self.batcher.get_stats() if self.batcher else None
         }
     
     # Mock methods for testing without Federation Space
@@ -575,9 +613,16 @@ class FederationRouter:
 
 
 class KryssieMethodMemory:
-    """Kryssie Method session memory implementation"""
+    """
+    Kryssie Method session memory implementation
     
-    def __init__(self, storage_backend: str = "local"):
+    Storage backends:
+        local: in-memory only, sessions are lost on restart
+        sqlite: persisted to a local SQLite database (db_path) with write-behind batching
+        federation: stored in Federation Space CMP
+    """
+    
+    def __init__(self, storage_backend: str = "local", db_path: Optional[str] = None):
         self.storage_backend = storage_backend
         self.logger = logging.getLogger(__name__)
         self.sessions: Dict[str, SessionContext] = {}
@@ -587,6 +632,14 @@ class KryssieMethodMemory:
         self.max_session_age = timedelta(days=30)
         self.max_history_items = 1000
         
+        # Persistent store for the sqlite backend
+        self.store: Optional[SQLiteSessionStore] = None
+        if storage_backend == "sqlite":
+            self.store = SQLiteSessionStore(
+                db_path or "kryssie_sessions.db",
+                max_history_items=self.max_history_items
+            )
+        
     async def create_session(self, user_id: str, initial_preferences: Dict[str, Any] = None) -> str:
         """Create a new session"""
         session_id = str(uuid.uuid4())
@@ -615,10 +668,8 @@ class KryssieMethodMemory:
         
         session = self.sessions[session_id]
         
-        # Analyze recent patterns
-        recent_patterns = self.pattern_analyzer.analyze_recent_interactions(
-            session.interaction_history[-10:]  # Last 10 interactions
-        )
+        # Recent patterns come from running aggregates, not a history rescan
+        recent_patterns = self.pattern_analyzer.analyze_recent_aggregates(session.aggregates)
         
         return {
             "preferences": session.preferences,
@@ -648,10 +699,11 @@ class KryssieMethodMemory:
         }
         
         session.interaction_history.append(memory_entry)
+        session.aggregates.record_interaction(memory_entry)
         
         # Limit history size
         if len(session.interaction_history) > self.max_history_items:
-            session.interaction_history = session.interaction_history[-self.max_history_items:]
+            del session.interaction_history[:-self.max_history_items]
         
         # Update learned patterns
         await self._update_learned_patterns(session, memory_data)
@@ -662,7 +714,7 @@ class KryssieMethodMemory:
         session.last_updated = datetime.now()
         
         # Persist changes
-        await self._persist_session(session)
+        await self._persist_session(session, new_entry=memory_entry)
         
         self.logger.debug(f"Stored memory for session {session_id}")
     
@@ -758,11 +810,13 @@ class KryssieMethodMemory:
             if "quality_preferences" not in patterns:
                 patterns["quality_preferences"] = []
             
-            patterns["quality_preferences"].append(memory_data["quality_level"])
+            quality_preferences = patterns["quality_preferences"]
+            quality_preferences.append(memory_data["quality_level"])
+            session.aggregates.quality.add(memory_data["quality_level"])
             
             # Keep only recent preferences
-            if len(patterns["quality_preferences"]) > 50:
-                patterns["quality_preferences"] = patterns["quality_preferences"][-50:]
+            while len(quality_preferences) > QUALITY_WINDOW:
+                session.aggregates.quality.remove(quality_preferences.pop(0))
         
         # Track language pairs
         if "source_language" in memory_data and "target_language" in memory_data:
@@ -800,11 +854,13 @@ class KryssieMethodMemory:
             if "response_times" not in metrics:
                 metrics["response_times"] = []
             
-            metrics["response_times"].append(memory_data["total_time"])
+            response_times = metrics["response_times"]
+            response_times.append(memory_data["total_time"])
+            session.aggregates.response_time.add(memory_data["total_time"])
             
             # Keep only recent times
-            if len(metrics["response_times"]) > 100:
-                metrics["response_times"] = metrics["response_times"][-100:]
+            while len(response_times) > RESPONSE_TIME_WINDOW:
+                session.aggregates.response_time.remove(response_times.pop(0))
         
         # Track costs
         if "total_cost" in memory_data:
@@ -813,11 +869,16 @@ class KryssieMethodMemory:
             
             metrics["total_cost"] += memory_data["total_cost"]
     
-    async def _persist_session(self, session: SessionContext):
+    async def _persist_session(self, session: SessionContext, new_entry: Optional[Dict[str, Any]] = None):
         """Persist session to storage backend"""
         if self.storage_backend == "local":
             # In-memory storage for now
             pass
+        elif self.storage_backend == "sqlite":
+            # Queued for the next batched write; history is appended, never rewritten
+            if new_entry is not None:
+                self.store.append_interaction(session.session_id, new_entry)
+            self.store.save_session(session.to_dict())
         elif self.storage_backend == "federation":
             # Store in Federation Space
             try:
@@ -830,6 +891,11 @@ class KryssieMethodMemory:
         if self.storage_backend == "local":
             # In-memory storage - session doesn't exist
             pass
+        elif self.storage_backend == "sqlite":
+            # Loaded on first access only, with the most recent history tail
+            session_data = self.store.load_session(session_id, self.max_history_items)
+            if session_data:
+                self.sessions[session_id] = SessionContext.from_dict(session_data)
         elif self.storage_backend == "federation":
             try:
                 session_data = await self._load_from_federation(session_id)
@@ -852,6 +918,13 @@ class KryssieMethodMemory:
         """Clean up old sessions"""
         cutoff_time = datetime.now() - self.max_session_age
         
+        if self.storage_backend == "sqlite":
+            # Indexed range query on last_updated instead of scanning every session
+            for session_id in self.store.delete_sessions_before(cutoff_time):
+                self.sessions.pop(session_id, None)
+                self.logger.info(f"Cleaned up old session {session_id}")
+            return
+        
         sessions_to_remove = []
         for session_id, session in self.sessions.items():
             if session.last_updated < cutoff_time:
@@ -860,6 +933,17 @@ class KryssieMethodMemory:
         for session_id in sessions_to_remove:
             del self.sessions[session_id]
             self.logger.info(f"Cleaned up old session {session_id}")
+    
+    async def flush(self):
+        """Write any batched session changes to the storage backend"""
+        if self.store:
+            self.store.flush()
+    
+    async def close(self):
+        """Flush pending writes and release the storage backend"""
+        if self.store:
+            self.store.close()
+            self.store = None
 
 
 class PatternAnalyzer:
@@ -870,41 +954,14 @@ class PatternAnalyzer:
     
     def analyze_recent_interactions(self, interactions: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Analyze recent interactions for patterns"""
-        if not interactions:
-            return {}
-        
-        patterns = {}
-        
-        # Analyze timing patterns
-        timestamps = [
-            datetime.fromisoformat(interaction["timestamp"]) 
-            for interaction in interactions
-            if "timestamp" in interaction
-        ]
-        
-        if timestamps:
-            hours = [ts.hour for ts in timestamps]
-            patterns["active_hours"] = list(set(hours))
-            patterns["most_active_hour"] = max(set(hours), key=hours.count)
-        
-        # Analyze request patterns
-        request_types = []
-        quality_levels = []
-        
+        aggregates = SessionAggregates(recent=deque())  # unbounded: every interaction given counts
         for interaction in interactions:
-            data = interaction.get("data", {})
-            if "type" in data:
-                request_types.append(data["type"])
-            if "quality_level" in data:
-                quality_levels.append(data["quality_level"])
-        
-        if request_types:
-            patterns["common_request_types"] = list(set(request_types))
-        
-        if quality_levels:
-            patterns["avg_quality_level"] = sum(quality_levels) / len(quality_levels)
-        
-        return patterns
+            aggregates.record_interaction(interaction)
+        return self.analyze_recent_aggregates(aggregates)
+    
+    def analyze_recent_aggregates(self, aggregates: SessionAggregates) -> Dict[str, Any]:
+        """Analyze recent interactions from running aggregates (O(1) in history length)"""
+        return aggregates.recent_patterns()
     
     def analyze_full_session(self, session: SessionContext) -> Dict[str, Any]:
         """Analyze full session for comprehensive patterns"""
@@ -913,28 +970,28 @@ class PatternAnalyzer:
         # Model preferences
         model_prefs = session.learned_patterns.get("model_preferences", {})
         if model_prefs:
-            sorted_models = sorted(model_prefs.items(), key=lambda x: x[1], reverse=True)
-            patterns["preferred_models"] = [model for model, count in sorted_models[:5]]
+            top_models = heapq.nlargest(5, model_prefs.items(), key=lambda x: x[1])
+            patterns["preferred_models"] = [model for model, count in top_models]
         
         # Quality preferences
-        quality_prefs = session.learned_patterns.get("quality_preferences", [])
-        if quality_prefs:
-            patterns["avg_quality_preference"] = sum(quality_prefs) / len(quality_prefs)
-            patterns["quality_variance"] = self._calculate_variance(quality_prefs)
+        quality_stats = session.aggregates.quality
+        if quality_stats.count:
+            patterns["avg_quality_preference"] = quality_stats.mean
+            patterns["quality_variance"] = quality_stats.variance
         
         # Language pair preferences
         lang_pairs = session.learned_patterns.get("language_pairs", {})
         if lang_pairs:
-            sorted_pairs = sorted(lang_pairs.items(), key=lambda x: x[1], reverse=True)
+            top_pairs = heapq.nlargest(5, lang_pairs.items(), key=lambda x: x[1])
             patterns["common_language_pairs"] = [
-                tuple(pair.split("_to_")) for pair, count in sorted_pairs[:5]
+                tuple(pair.split("_to_")) for pair, count in top_pairs
             ]
         
         # Time patterns
         time_prefs = session.learned_patterns.get("time_patterns", {})
         if time_prefs:
-            sorted_hours = sorted(time_prefs.items(), key=lambda x: x[1], reverse=True)
-            patterns["productive_hours"] = [int(hour) for hour, count in sorted_hours[:8]]
+            top_hours = heapq.nlargest(8, time_prefs.items(), key=lambda x: x[1])
+            patterns["productive_hours"] = [int(hour) for hour, count in top_hours]
         
         # Performance patterns
         metrics = session.performance_metrics
@@ -943,10 +1000,10 @@ class PatternAnalyzer:
                 metrics.get("success_count", 0) / max(metrics.get("total_count", 1), 1)
             )
             
-            response_times = metrics.get("response_times", [])
-            if response_times:
-                patterns["avg_response_time"] = sum(response_times) / len(response_times)
-                patterns["response_time_variance"] = self._calculate_variance(response_times)
+            response_time_stats = session.aggregates.response_time
+            if response_time_stats.count:
+                patterns["avg_response_time"] = response_time_stats.mean
+                patterns["response_time_variance"] = response_time_stats.variance
             
             patterns["total_cost"] = metrics.get("total_cost", 0.0)
         
@@ -0,0 +1,353 @@
+"""
+CodeVerter Plugin Manifest
+
+Static discovery of plugins without importing them. Each module in a plugin
+directory is parsed with `ast` to find BasePlugin subclasses and read the
+PluginMetadata(...) returned by their `metadata` property: plugin name,
+plugin type, extension points and dependencies.
+
+Results are cached in a JSON manifest keyed by file path and invalidated by
+file size/mtime, falling back to a content hash so touched-but-unchanged
+files are not re-parsed.
+
+Modules whose plugins cannot be described statically (computed metadata,
+plugins re-exported from other modules, classes derived from bases defined
+in other modules, packages) are marked non-static and left for the loader
+to import eagerly.
+"""
+
+import ast
+import builtins
+import hashlib
+import json
+import os
+import pkgutil
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+import logging
+
+
+MANIFEST_VERSION = 1
+MANIFEST_FILENAME = ".plugin_manifest.json"
+
+PLUGIN_BASE_CLASSES = {
+    "BasePlugin",
+    "BaseAPIAdapter",
+    "BaseReviewMode",
+    "BaseScoringAlgorithm",
+    "BaseUIComponent",
+    "BaseIntegrationHook",
+}
+
+
+@dataclass
+class ManifestEntry:
+    """Statically discovered plugin class (enum fields hold member names, e.g. "API_ADAPTER")"""
+    module_name: str
+    module_path: str
+    class_name: str
+    plugin_name: str
+    plugin_type: str
+    extension_points: List[str] = field(default_factory=list)
+    dependencies: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for the manifest cache"""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ManifestEntry':
+        """Create from a manifest cache dictionary"""
+        return cls(**data)
+
+
+@dataclass
+class ModuleManifest:
+    """Manifest for one plugin module"""
+    module_name: str
+    module_path: str
+    size: int
+    mtime_ns: int
+    sha256: str
+    static: bool
+    entries: List[ManifestEntry] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for the manifest cache"""
+        data = asdict(self)
+        data["entries"] = [entry.to_dict() for entry in self.entries]
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ModuleManifest':
+        """Create from a manifest cache dictionary"""
+        data = dict(data)
+        data["entries"] = [ManifestEntry.from_dict(entry) for entry in data.get("entries", [])]
+        return cls(**data)
+
+
+def _in_directory(module_path: Path, directory: Path) -> bool:
+    """Whether a cached module path is a module or package directly inside directory"""
+    if module_path.name == "__init__.py":
+        return module_path.parent.parent == directory
+    return module_path.parent == directory
+
+
+def _imported_names(tree: ast.Module) -> set:
+    """Names bound by top-level import statements"""
+    names = set()
+    for node in tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            for alias in node.names:
+                names.add((alias.asname or alias.name).split(".")[0])
+    return names
+
+
+def _base_names(node: ast.ClassDef) -> List[str]:
+    """Names of a class's bases (`Foo` and `module.Foo` both yield "Foo")"""
+    names = []
+    for base in node.bases:
+        if isinstance(base, ast.Name):
+            names.append(base.id)
+        elif isinstance(base, ast.Attribute):
+            names.append(base.attr)
+    return names
+
+
+def _enum_member(node: ast.AST, enum_name: str) -> Optional[str]:
+    """Member name of an `EnumName.MEMBER` expression"""
+    if (isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name)
+            and node.value.id == enum_name):
+        return node.attr
+    return None
+
+
+def _is_abstract(node: ast.ClassDef) -> bool:
+    """Whether the class declares any @abstractmethod"""
+    for item in node.body:
+        if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            for decorator in item.decorator_list:
+                name = decorator.attr if isinstance(decorator, ast.Attribute) else getattr(decorator, "id", None)
+                if name == "abstractmethod":
+                    return True
+    return False
+
+
+def _metadata_call(node: ast.ClassDef) -> Optional[ast.Call]:
+    """The PluginMetadata(...) call returned by the class's metadata property"""
+    for item in node.body:
+        if isinstance(item, ast.FunctionDef) and item.name == "metadata":
+            for child in ast.walk(item):
+                if (isinstance(child, ast.Return) and isinstance(child.value, ast.Call)
+                        and getattr(child.value.func, "id", None) == "PluginMetadata"):
+                    return child.value
+    return None
+
+
+def _read_metadata(call: ast.Call) -> Optional[Dict[str, Any]]:
+    """Read literal plugin name, type, extension points and dependencies from PluginMetadata(...)"""
+    keywords = {kw.arg: kw.value for kw in call.keywords if kw.arg}
+
+    name_node = keywords.get("name")
+    if not (isinstance(name_node, ast.Constant) and isinstance(name_node.value, str)):
+        return None
+
+    plugin_type = _enum_member(keywords.get("plugin_type"), "PluginType")
+    if plugin_type is None:
+        return None
+
+    extension_points: List[str] = []
+    ep_node = keywords.get("extension_points")
+    if ep_node is not None:
+        if not isinstance(ep_node, (ast.List, ast.Tuple)):
+            return None
+        for element in ep_node.elts:
+            member = _enum_member(element, "ExtensionPoint")
+            if member is None:
+                return None
+            extension_points.append(member)
+
+    dependencies: List[str] = []
+    dep_node = keywords.get("dependencies")
+    if dep_node is not None:
+        if not isinstance(dep_node, (ast.List, ast.Tuple)):
+            return None
+        for element in dep_node.elts:
+            if not (isinstance(element, ast.Constant) and isinstance(element.value, str)):
+                return None
+            dependencies.append(element.value)
+
+    return {
+        "plugin_name": name_node.value,
+        "plugin_type": plugin_type,
+        "extension_points": extension_points,
+        "dependencies": dependencies,
+    }
+
+
+def scan_module_source(source: str, module_name: str, module_path: str) -> Optional[List[ManifestEntry]]:
+    """
+    Find plugin classes in module source without importing it
+
+    Returns:
+        Manifest entries, or None if the module has plugin classes whose
+        metadata cannot be determined statically (the module must be imported)
+    """
+    tree = ast.parse(source, filename=module_path)
+
+    imported = _imported_names(tree)
+    plugin_classes = set(PLUGIN_BASE_CLASSES)
+    local_classes = set()
+    entries = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        base_names = _base_names(node)
+        if not any(base in plugin_classes for base in base_names):
+            # A base from another module (or an expression we cannot resolve)
+            # may itself derive from a plugin class: only an import can tell
+            if len(base_names) != len(node.bases) or any(
+                base not in local_classes and (base in imported or not hasattr(builtins, base))
+                for base in base_names
+            ):
+                return None
+            local_classes.add(node.name)
+            continue
+
+        # Subclasses of this class are plugins too
+        plugin_classes.add(node.name)
+
+        call = _metadata_call(node)
+        if call is None:
+            if _is_abstract(node) or node.name in PLUGIN_BASE_CLASSES:
+                continue
+            return None
+
+        metadata = _read_metadata(call)
+        if metadata is None:
+            return None
+
+        entries.append(ManifestEntry(
+            module_name=module_name,
+            module_path=module_path,
+            class_name=node.name,
+            **metadata
+        ))
+
+    return entries
+
+
+class PluginManifest:
+    """
+    Cached static manifest of the plugins in a directory
+
+    Args:
+        cache_path: Manifest JSON file (defaults to .plugin_manifest.json in the scanned directory)
+    """
+
+    def __init__(self, cache_path: Optional[Union[str, Path]] = None):
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.logger = logging.getLogger(__name__)
+
+        # Statistics for the last scan
+        self.parsed_modules = 0
+        self.cached_modules = 0
+
+    def scan_directory(self, directory: Union[str, Path]) -> List[ModuleManifest]:
+        """Describe every plugin module in a directory, re-parsing only changed files"""
+        directory = Path(directory)
+        cache_path = self.cache_path or directory / MANIFEST_FILENAME
+        cached = self._load_cache(cache_path)
+
+        self.parsed_modules = 0
+        self.cached_modules = 0
+        modules = []
+
+        for module_info in pkgutil.iter_modules([str(directory)]):
+            if module_info.ispkg:
+                module_path = directory / module_info.name / "__init__.py"
+            else:
+                module_path = directory / f"{module_info.name}.py"
+            if not module_path.exists():
+                continue
+
+            modules.append(self._scan_module(module_info.name, module_path, module_info.ispkg,
+                                             cached.get(str(module_path))))
+
+        # A shared cache_path also holds other directories' modules: keep those
+        merged = {
+            path: module for path, module in cached.items()
+            if not _in_directory(Path(path), directory)
+        }
+        merged.update((module.module_path, module) for module in modules)
+        self._save_cache(cache_path, list(merged.values()))
+        return modules
+
+    def _scan_module(self, module_name: str, module_path: Path, is_package: bool,
+                     cached: Optional[ModuleManifest]) -> ModuleManifest:
+        """Return the cached manifest for a module if still valid, otherwise parse it"""
+        stat = module_path.stat()
+
+        if cached and cached.size == stat.st_size and cached.mtime_ns == stat.st_mtime_ns:
+            self.cached_modules += 1
+            return cached
+
+        data = module_path.read_bytes()
+        sha256 = hashlib.sha256(data).hexdigest()
+
+        if cached and cached.sha256 == sha256:
+            # Touched but unchanged: refresh the stat key only
+            self.cached_modules += 1
+            cached.size = stat.st_size
+            cached.mtime_ns = stat.st_mtime_ns
+            return cached
+
+        self.parsed_modules += 1
+        entries = None
+        if not is_package:
+            try:
+                entries = scan_module_source(data.decode("utf-8"), module_name, str(module_path))
+            except (SyntaxError, UnicodeDecodeError) as e:
+                self.logger.warning(f"Could not scan plugin module {module_path}: {e}")
+
+        return ModuleManifest(
+            module_name=module_name,
+            module_path=str(module_path),
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            sha256=sha256,
+            static=entries is not None,
+            entries=entries or []
+        )
+
+    def _load_cache(self, cache_path: Path) -> Dict[str, ModuleManifest]:
+        """Load the manifest cache, ignoring missing or incompatible files"""
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != MANIFEST_VERSION:
+                return {}
+            return {
+                path: ModuleManifest.from_dict(module)
+                for path, module in data.get("modules", {}).items()
+            }
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable plugin manifest {cache_path}: {e}")
+            return {}
+
+    def _save_cache(self, cache_path: Path, modules: List[ModuleManifest]):
+        """Write the manifest cache (best effort; plugin directories may be read-only)"""
+        data = {
+            "version": MANIFEST_VERSION,
+            "modules": {module.module_path: module.to_dict() for module in modules}
+        }
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            self.logger.debug(f"Could not write plugin manifest {cache_path}: {e}")
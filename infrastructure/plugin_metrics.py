@@ -0,0 +1,222 @@
+"""
+CodeVerter Plugin Metrics
+
+Bounded per-plugin call metrics:
+1. LatencyHistogram - HDR-style log-bucketed latency histogram with percentiles
+2. PluginMetrics - call counters, per-extension-point histograms and ring
+   buffers of recent calls and errors
+3. JSON and Prometheus text exports
+"""
+
+import json
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+
+# 32 linear sub-buckets per power of two: at most ~3% relative error per bucket
+SUB_BUCKET_BITS = 5
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+
+RECENT_CALLS = 256
+RECENT_ERRORS = 100
+PERCENTILES = (50, 95, 99)
+DIRECT_CALLS = "direct"  # Calls recorded without an extension point
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram (microsecond resolution)
+
+    Values are bucketed by power of two with SUB_BUCKET_COUNT linear
+    sub-buckets each, as in HdrHistogram, so memory stays bounded (a few
+    hundred buckets at most) regardless of call volume.
+    """
+
+    def __init__(self):
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = 0.0
+        self.max = 0.0
+
+    @staticmethod
+    def bucket_index(value: float) -> int:
+        """Bucket for a latency in seconds"""
+        micros = int(value * 1_000_000)
+        if micros < 2 * SUB_BUCKET_COUNT:
+            return micros if micros > 0 else 0
+        magnitude = micros.bit_length() - SUB_BUCKET_BITS - 1
+        return magnitude * SUB_BUCKET_COUNT + (micros >> magnitude)
+
+    @staticmethod
+    def bucket_bounds(index: int) -> Tuple[float, float]:
+        """Lowest and highest latency (seconds) that fall into a bucket"""
+        magnitude = max(0, index // SUB_BUCKET_COUNT - 1)
+        sub_bucket = index - magnitude * SUB_BUCKET_COUNT
+        lower = sub_bucket << magnitude
+        upper = ((sub_bucket + 1) << magnitude) - 1
+        return lower / 1_000_000, upper / 1_000_000
+
+    def record(self, value: float):
+        """Record one latency in seconds"""
+        index = self.bucket_index(value)
+        counts = self.counts
+        counts[index] = counts.get(index, 0) + 1
+
+        if self.count == 0 or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    def percentile(self, percent: float) -> float:
+        """Latency (seconds) at or below which `percent` of calls completed"""
+        if self.count == 0:
+            return 0.0
+
+        rank = max(1, int(round(percent / 100 * self.count)))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                lower, upper = self.bucket_bounds(index)
+                return min(max((lower + upper) / 2, self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        """Mean latency in seconds"""
+        return self.total / self.count if self.count else 0.0
+
+    def merge(self, other: 'LatencyHistogram'):
+        """Add another histogram's counts to this one"""
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        if other.count:
+            if self.count == 0 or other.min < self.min:
+                self.min = other.min
+            self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+
+    def summary(self) -> Dict[str, float]:
+        """Count, mean, max and PERCENTILES as a dictionary"""
+        summary = {"count": self.count, "mean": self.mean, "max": self.max}
+        for percent in PERCENTILES:
+            summary[f"p{percent}"] = self.percentile(percent)
+        return summary
+
+
+class PluginMetrics:
+    """
+    Call metrics for one plugin
+
+    Args:
+        recent_calls: Size of the ring buffer of recent calls
+        recent_errors: Size of the ring buffer of recent errors
+    """
+
+    def __init__(self, recent_calls: int = RECENT_CALLS, recent_errors: int = RECENT_ERRORS):
+        self.total_calls = 0
+        self.successful_calls = 0
+        self.total_time = 0.0
+        self.error_count = 0
+
+        # Histograms per extension point (DIRECT_CALLS for plain _record_call use)
+        self.histograms: Dict[str, LatencyHistogram] = {}
+
+        # Success flags of the latest calls
+        self.recent: Deque[bool] = deque(maxlen=recent_calls)
+        self.errors: Deque[Dict[str, Any]] = deque(maxlen=recent_errors)
+
+    def record(self, success: bool, execution_time: float, error: Optional[str] = None,
+               extension_point: Optional[str] = None):
+        """Record one call"""
+        self.total_calls += 1
+        self.total_time += execution_time
+
+        key = extension_point or DIRECT_CALLS
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = LatencyHistogram()
+        histogram.record(execution_time)
+
+        self.recent.append(success)
+
+        if success:
+            self.successful_calls += 1
+        else:
+            self.error_count += 1
+            self.errors.append({
+                "timestamp": datetime.now().isoformat(),
+                "error": error or "Unknown error",
+                "extension_point": extension_point
+            })
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Metrics as a JSON-serializable dictionary"""
+        calls = max(self.total_calls, 1)
+        overall = self.overall_histogram().summary()
+
+        return {
+            "total_calls": self.total_calls,
+            "success_rate": self.successful_calls / calls,
+            "avg_execution_time": self.total_time / calls,
+            "error_count": self.error_count,
+            "recent_error_rate": self.recent.count(False) / len(self.recent) if self.recent else 0.0,
+            "last_errors": list(self.errors)[-5:],
+            "latency": {key: overall[key] for key in overall if key != "count"},
+            "extension_points": {
+                name: histogram.summary()
+                for name, histogram in self.histograms.items()
+                if name != DIRECT_CALLS
+            }
+        }
+
+    def overall_histogram(self) -> LatencyHistogram:
+        """All calls in one histogram (merged on demand, keeping record() cheap)"""
+        overall = LatencyHistogram()
+        for histogram in self.histograms.values():
+            overall.merge(histogram)
+        return overall
+
+
+def metrics_to_json(performance: List[Dict[str, Any]]) -> str:
+    """Export get_plugin_performance() output as JSON"""
+    return json.dumps({"plugins": performance}, indent=2)
+
+
+def _label(value: str) -> str:
+    """Escape a Prometheus label value"""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def metrics_to_prometheus(plugins: Iterable[Tuple[str, PluginMetrics]],
+                          prefix: str = "codeverter_plugin") -> str:
+    """
+    Export plugin metrics in the Prometheus text exposition format
+
+    Latencies are exported as summaries (p50/p95/p99 quantiles, _sum and
+    _count) labelled by plugin and extension point.
+    """
+    calls = [f"# HELP {prefix}_calls_total Plugin calls", f"# TYPE {prefix}_calls_total counter"]
+    errors = [f"# HELP {prefix}_errors_total Failed plugin calls", f"# TYPE {prefix}_errors_total counter"]
+    latency = [f"# HELP {prefix}_latency_seconds Plugin call latency",
+               f"# TYPE {prefix}_latency_seconds summary"]
+
+    for name, metrics in plugins:
+        plugin = _label(name)
+        calls.append(f'{prefix}_calls_total{{plugin="{plugin}"}} {metrics.total_calls}')
+        errors.append(f'{prefix}_errors_total{{plugin="{plugin}"}} {metrics.error_count}')
+
+        for extension_point, histogram in metrics.histograms.items():
+            labels = f'plugin="{plugin}",extension_point="{_label(extension_point)}"'
+            for percent in PERCENTILES:
+                latency.append(f'{prefix}_latency_seconds{{{labels},quantile="{percent / 100}"}} '
+                               f'{histogram.percentile(percent):.6f}')
+            latency.append(f'{prefix}_latency_seconds_sum{{{labels}}} {histogram.total:.6f}')
+            latency.append(f'{prefix}_latency_seconds_count{{{labels}}} {histogram.count}')
+
+    return "\n".join(calls + errors + latency) + "\n"
@@ -15,10 +15,12 @@ import json
 import time
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Union
 from datetime import datetime
 import logging
 
+from .code_similarity import SimilarityBackend, create_similarity_backend
+
 # SERAPHINA Framework imports (would be actual imports in real implementation)
 from federation_router import FederationRouter
 from session_memory import KryssieMethodMemory
@@ -114,12 +116,17 @@ class ReviewModeOrchestrator:
     """Main orchestrator for managing different review modes"""
     
     def __init__(self, api_manager: APIManager, federation_router: FederationRouter, 
-                 session_memory: KryssieMethodMemory):
+                 session_memory: KryssieMethodMemory,
+                 similarity_backend: Union[str, SimilarityBackend] = SimilarityBackend.SEQUENCE_MATCHER,
+                 similarity_precision: int = 128):
         self.api_manager = api_manager
         self.federation_router = federation_router
         self.session_memory = session_memory
         self.logger = logging.getLogger(__name__)
         
+        # Code similarity backend used for consensus scoring
+        self.code_similarity = create_similarity_backend(similarity_backend, num_hashes=similarity_precision)
+        
         # Initialize model profiles
         self.model_profiles = self._initialize_model_profiles()
         
@@ -556,9 +563,8 @@ class ReviewModeOrchestrator:
         if code1 == code2:
             return 1.0
         
-        # Basic character-level similarity
-        from difflib import SequenceMatcher
-        return SequenceMatcher(None, code1, code2).ratio()
+        # Character-level (SequenceMatcher) or shingle-level (MinHash) similarity
+        return self.code_similarity.similarity(code1, code2)
     
     async def _enhance_with_session_memory(self, request: TransformationRequest) -> TransformationRequest:
         """Enhance request with context from session memory"""
@@ -0,0 +1,112 @@
+"""
+Kryssie Method Session Statistics
+
+Running aggregates maintained as interactions are stored, so session context
+reads and recommendations do not have to rescan interaction history:
+1. RunningStats - Welford mean/variance over a sliding window
+2. SessionAggregates - per-session quality, response time and recent activity
+"""
+
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+
+RECENT_WINDOW = 10
+QUALITY_WINDOW = 50
+RESPONSE_TIME_WINDOW = 100
+
+
+@dataclass
+class RunningStats:
+    """Welford running mean and population variance with O(1) add and remove"""
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def add(self, value: float):
+        """Add a value to the aggregate"""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def remove(self, value: float):
+        """Remove a previously added value (used when it leaves the window)"""
+        if self.count <= 1:
+            self.count = 0
+            self.mean = 0.0
+            self.m2 = 0.0
+            return
+        self.count -= 1
+        delta = value - self.mean
+        self.mean -= delta / self.count
+        self.m2 = max(0.0, self.m2 - delta * (value - self.mean))
+
+    @property
+    def variance(self) -> float:
+        """Population variance (0.0 for fewer than two values)"""
+        if self.count < 2:
+            return 0.0
+        return self.m2 / self.count
+
+    @classmethod
+    def from_values(cls, values: List[float]) -> 'RunningStats':
+        """Build stats from an existing list of values"""
+        stats = cls()
+        for value in values:
+            stats.add(value)
+        return stats
+
+
+@dataclass
+class SessionAggregates:
+    """Incrementally maintained statistics for one session"""
+    quality: RunningStats = field(default_factory=RunningStats)
+    response_time: RunningStats = field(default_factory=RunningStats)
+    recent: Deque[Tuple[Optional[int], Optional[str], Optional[float]]] = field(
+        default_factory=lambda: deque(maxlen=RECENT_WINDOW)
+    )
+
+    def record_interaction(self, memory_entry: Dict[str, Any]):
+        """Remember the hour, request type and quality level of a stored interaction"""
+        hour = None
+        if "timestamp" in memory_entry:
+            hour = datetime.fromisoformat(memory_entry["timestamp"]).hour
+        data = memory_entry.get("data", {})
+        self.recent.append((hour, data.get("type"), data.get("quality_level")))
+
+    def recent_patterns(self) -> Dict[str, Any]:
+        """Patterns over the last RECENT_WINDOW interactions"""
+        if not self.recent:
+            return {}
+
+        patterns = {}
+
+        hours = [hour for hour, _, _ in self.recent if hour is not None]
+        if hours:
+            patterns["active_hours"] = list(set(hours))
+            patterns["most_active_hour"] = Counter(hours).most_common(1)[0][0]
+
+        request_types = [request_type for _, request_type, _ in self.recent if request_type is not None]
+        if request_types:
+            patterns["common_request_types"] = list(set(request_types))
+
+        quality_levels = [quality for _, _, quality in self.recent if quality is not None]
+        if quality_levels:
+            patterns["avg_quality_level"] = sum(quality_levels) / len(quality_levels)
+
+        return patterns
+
+    @classmethod
+    def from_session_data(cls, learned_patterns: Dict[str, Any], performance_metrics: Dict[str, Any],
+                          interaction_history: List[Dict[str, Any]]) -> 'SessionAggregates':
+        """Rebuild aggregates from persisted session data (once, on load)"""
+        aggregates = cls(
+            quality=RunningStats.from_values(learned_patterns.get("quality_preferences", [])),
+            response_time=RunningStats.from_values(performance_metrics.get("response_times", []))
+        )
+        for memory_entry in interaction_history[-RECENT_WINDOW:]:
+            aggregates.record_interaction(memory_entry)
+        return aggregates
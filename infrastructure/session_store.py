@@ -0,0 +1,234 @@
+"""
+Kryssie Method Session Store
+
+SQLite persistence for KryssieMethodMemory sessions:
+1. WAL journal so reads never block the write-behind flush
+2. Batched write-behind of interaction history (one transaction per flush)
+3. Indexed last_updated column so expiry is a range scan, not a full scan
+4. Per-session lazy loading with a bounded history tail
+
+The store works on plain dictionaries (SessionContext.to_dict() layout) so it
+has no dependency on the Federation networking stack.
+"""
+
+import json
+import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+import logging
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    preferences TEXT NOT NULL,
+    learned_patterns TEXT NOT NULL,
+    performance_metrics TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    last_updated TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_last_updated ON sessions(last_updated);
+CREATE TABLE IF NOT EXISTS interactions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    session_id TEXT NOT NULL,
+    entry TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_interactions_session ON interactions(session_id, id);
+"""
+
+
+class SQLiteSessionStore:
+    """
+    SQLite-backed session storage with write-behind batching
+
+    Session headers and new interaction entries are buffered in memory and
+    written in a single transaction once batch_size entries are pending or
+    flush_interval seconds have passed since the last flush.
+
+    Args:
+        db_path: SQLite database file (":memory:" for tests)
+        batch_size: Pending interaction entries that trigger a flush
+        flush_interval: Maximum seconds between flushes while writes arrive
+        max_history_items: Interaction entries kept per session on disk
+    """
+
+    def __init__(self, db_path: Union[str, Path] = "kryssie_sessions.db",
+                 batch_size: int = 500, flush_interval: float = 1.0,
+                 max_history_items: int = 1000):
+        self.db_path = str(db_path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_history_items = max_history_items
+        self.logger = logging.getLogger(__name__)
+
+        self.connection = sqlite3.connect(self.db_path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+        self.connection.commit()
+
+        # Write-behind buffers
+        self._dirty_sessions: Dict[str, Dict[str, Any]] = {}
+        self._pending_interactions: List[tuple] = []
+        self._last_flush = time.monotonic()
+
+        # Statistics
+        self.flush_count = 0
+        self.rows_written = 0
+
+    def save_session(self, session_data: Dict[str, Any]):
+        """Queue a session header (everything except interaction history) for writing"""
+        self._dirty_sessions[session_data["session_id"]] = session_data
+        self._maybe_flush()
+
+    def append_interaction(self, session_id: str, entry: Dict[str, Any]):
+        """Queue one interaction history entry for writing"""
+        self._pending_interactions.append((session_id, json.dumps(entry, default=str)))
+        self._maybe_flush()
+
+    def _maybe_flush(self):
+        """Flush when the batch is full or the flush interval has elapsed"""
+        if (len(self._pending_interactions) >= self.batch_size or
+                time.monotonic() - self._last_flush >= self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        """Write all buffered sessions and interactions in one transaction"""
+        if not self._dirty_sessions and not self._pending_interactions:
+            self._last_flush = time.monotonic()
+            return
+
+        sessions = list(self._dirty_sessions.values())
+        interactions = self._pending_interactions
+        touched = {session_id for session_id, _ in interactions}
+
+        with self.connection:
+            self.connection.executemany(
+                """
+                INSERT INTO sessions (session_id, user_id, preferences, learned_patterns,
+                                      performance_metrics, created_at, last_updated)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(session_id) DO UPDATE SET
+                    user_id = excluded.user_id,
+                    preferences = excluded.preferences,
+                    learned_patterns = excluded.learned_patterns,
+                    performance_metrics = excluded.performance_metrics,
+                    last_updated = excluded.last_updated
+                """,
+                [self._session_row(data) for data in sessions]
+            )
+            self.connection.executemany(
+                "INSERT INTO interactions (session_id, entry) VALUES (?, ?)",
+                interactions
+            )
+            for session_id in touched:
+                self._trim_history(session_id)
+
+        self.flush_count += 1
+        self.rows_written += len(sessions) + len(interactions)
+        self._dirty_sessions = {}
+        self._pending_interactions = []
+        self._last_flush = time.monotonic()
+
+    def _trim_history(self, session_id: str):
+        """Drop on-disk history beyond max_history_items for a session"""
+        self.connection.execute(
+            """
+            DELETE FROM interactions
+            WHERE session_id = ? AND id <= (
+                SELECT id FROM interactions WHERE session_id = ?
+                ORDER BY id DESC LIMIT 1 OFFSET ?
+            )
+            """,
+            (session_id, session_id, self.max_history_items)
+        )
+
+    @staticmethod
+    def _session_row(data: Dict[str, Any]) -> tuple:
+        """Convert a session dictionary to a sessions table row"""
+        return (
+            data["session_id"],
+            data["user_id"],
+            json.dumps(data.get("preferences", {}), default=str),
+            json.dumps(data.get("learned_patterns", {}), default=str),
+            json.dumps(data.get("performance_metrics", {}), default=str),
+            data["created_at"],
+            data["last_updated"]
+        )
+
+    def load_session(self, session_id: str, max_history: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Load one session with its most recent interaction history, or None if unknown"""
+        self.flush()
+
+        row = self.connection.execute(
+            """
+            SELECT session_id, user_id, preferences, learned_patterns,
+                   performance_metrics, created_at, last_updated
+            FROM sessions WHERE session_id = ?
+            """,
+            (session_id,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        limit = max_history if max_history is not None else self.max_history_items
+        history_rows = self.connection.execute(
+            "SELECT entry FROM interactions WHERE session_id = ? ORDER BY id DESC LIMIT ?",
+            (session_id, limit)
+        ).fetchall()
+
+        return {
+            "session_id": row[0],
+            "user_id": row[1],
+            "preferences": json.loads(row[2]),
+            "learned_patterns": json.loads(row[3]),
+            "performance_metrics": json.loads(row[4]),
+            "created_at": row[5],
+            "last_updated": row[6],
+            "interaction_history": [json.loads(entry) for (entry,) in reversed(history_rows)]
+        }
+
+    def delete_sessions_before(self, cutoff: datetime) -> List[str]:
+        """Delete sessions last updated before cutoff and return their ids"""
+        self.flush()
+
+        cutoff_key = cutoff.isoformat()
+        with self.connection:
+            expired = [
+                session_id for (session_id,) in self.connection.execute(
+                    "SELECT session_id FROM sessions WHERE last_updated < ?",
+                    (cutoff_key,)
+                )
+            ]
+            self.connection.executemany(
+                "DELETE FROM interactions WHERE session_id = ?",
+                [(session_id,) for session_id in expired]
+            )
+            self.connection.execute(
+                "DELETE FROM sessions WHERE last_updated < ?",
+                (cutoff_key,)
+            )
+        return expired
+
+    def count_sessions(self) -> int:
+        """Number of persisted sessions"""
+        self.flush()
+        return self.connection.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+
+    def close(self):
+        """Flush pending writes and close the database"""
+        self.flush()
+        self.connection.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Write-behind statistics for monitoring"""
+        return {
+            "db_path": self.db_path,
+            "pending_sessions": len(self._dirty_sessions),
+            "pending_interactions": len(self._pending_interactions),
+            "flush_count": self.flush_count,
+            "rows_written": self.rows_written
+        }
@@ -14,20 +14,41 @@ Exit codes:
   2 = usage error
 
 Usage:
-  python tools/commentomancy_linter.py analyze path/to/ritual.ccraft [--canon canon.lock.yaml] [--schools schools.canonical.yaml] [--strict]
+  python tools/commentomancy_linter.py analyze path/to/ritual.ccraft [more.ccraft | rituals/ ...] [--canon canon.lock.yaml] [--schools schools.canonical.yaml] [--strict]
   python tools/commentomancy_linter.py fix     path/to/ritual.ccraft [--canon canon.lock.yaml] [--schools schools.canonical.yaml] [--strict]
+  python tools/commentomancy_linter.py analyze rituals/ --canon canon.lock.yaml --changed-only --jobs 8
 
 Notes:
   - Idempotent: won't duplicate comments if already present.
   - Looks back up to N preceding non-blank lines to find required comment.
   - --strict makes advisory comments required if the canon marks them as such.
+  - Directories are scanned recursively for *.ccraft files.
+  - Per-file results are cached in .commentomancy_cache.json, keyed by the
+    file's sha256 and a hash of the canon files (+ --strict); only files
+    whose cached result is stale are analyzed, in parallel (--jobs).
+  - --changed-only trusts cached results for files whose size and mtime are
+    unchanged without re-reading them, so lint time scales with the change.
+    Files modified within 2s of being linted are not cached: an edit in the
+    same mtime tick could keep size and mtime and be trusted while stale.
 """
 import argparse
+import hashlib
+import json
+import os
 import re
 import sys
+import time
 import yaml
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
+DEFAULT_CACHE = '.commentomancy_cache.json'
+# Bump when analysis logic changes so cached results are discarded
+CACHE_VERSION = 1
+RACY_WINDOW_NS = 2_000_000_000  # files modified this recently are not cached
+
 # -------------------------------
 # Canon loaders
 # -------------------------------
@@ -152,22 +173,17 @@ def find_invocations(lines, valid_tokens):
 # Commentomancy detection & insertion
 # -------------------------------
 
-RE_GUARDRAIL = re.compile(r'^[ 	]*//!\?[ 	].*', re.IGNORECASE)
-RE_PREREQ    = re.compile(r'^[ 	]*//![ 	].*', re.IGNORECASE)
-RE_HEART     = re.compile(r'^[ 	]*//<3[ 	].*', re.IGNORECASE)
+# Required comment sigils, matched in one pass (they are mutually exclusive)
+RE_KIND = re.compile(r'^[ 	]*//(?:(?P<guardrail>!\?)|(?P<prereq>!)|(?P<heart><3))[ 	]')
+KINDS = ('guardrail', 'prereq', 'heart')
 
-def has_required_comment(prev_lines, kind):
-    """
-    prev_lines: a list of preceding non-blank lines (nearest first)
-    kind: 'guardrail' | 'prereq' | 'heart'
-    """
-    regex = {'guardrail': RE_GUARDRAIL, 'prereq': RE_PREREQ, 'heart': RE_HEART}.get(kind)
-    if not regex:
-        return True
-    for ln in prev_lines:
-        if regex.match(ln):
-            return True
-    return False
+# Preceding non-blank lines searched for a required comment
+LOOKBACK = 3
+
+def classify_comment(line):
+    """'guardrail' | 'prereq' | 'heart' for a required-comment line, else None"""
+    m = RE_KIND.match(line)
+    return m.lastgroup if m else None
 
 def build_comment(token, school_id, kind, tier=None):
     templates = {
@@ -179,78 +195,187 @@ def build_comment(token, school_id, kind, tier=None):
     msg = t.format(token=token, tier=tier or 'N/A')
     return msg
 
-def nearest_nonblank_above(lines, idx, lookback=3):
-    """
-    Return up to `lookback` non-blank lines ABOVE idx (excluding idx).
-    Ordered nearest first.
-    """
-    prev = []
-    j = idx - 1
-    while j >= 0 and len(prev) < lookback:
-        if lines[j].strip() != "":
-            prev.append(lines[j].rstrip("\n"))
-        j -= 1
-    return prev
-
 # -------------------------------
 # Linter core
 # -------------------------------
 
 def analyze_ritual(ritual_path: Path, by_id, by_token, rules, strict=False):
-    text = ritual_path.read_text(encoding='utf-8')
-    lines = text.splitlines()
-    valid_tokens = set(by_token.keys())
+    return analyze_text(ritual_path.read_text(encoding='utf-8'), by_id, by_token, rules, strict=strict)
+
+def required_kinds(rules, token, strict=False):
+    """Comment kinds an invocation of `token` must carry (advisory ones too when strict)."""
+    rule_spec = rules.get(token, {})
+    required = list(rule_spec.get('required', []))
+    if strict:
+        for a in rule_spec.get('advisory', []):
+            if a not in required:
+                required.append(a)
+    # Unknown kinds have no detectable sigil and are always satisfied
+    return [kind for kind in required if kind in KINDS]
+
+def analyze_text(text: str, by_id, by_token, rules, strict=False, lookback=LOOKBACK):
+    """
+    Single forward pass: each line is classified once and the kinds of the last
+    `lookback` non-blank lines are kept in a rolling window, so checking an
+    invocation never walks back through the file.
+    """
+    window = deque(maxlen=lookback)  # comment kind (or None) of recent non-blank lines
+    requirements = {}  # token -> required kinds
     violations = []
 
-    for idx, token in find_invocations(lines, valid_tokens):
-        # Determine rule set for this token (by school)
-        rule_spec = rules.get(token, {})
-        required = list(rule_spec.get('required', []))
-
-        # If strict, we may treat advisory as required too (optional extension)
-        if strict:
-            adv = rule_spec.get('advisory', [])
-            for a in adv:
-                if a not in required:
-                    required.append(a)
-
-        if not required:
-            continue  # nothing required for this token
-
-        prev_lines = nearest_nonblank_above(lines, idx, lookback=3)
-        missing = []
-        for kind in required:
-            if not has_required_comment(prev_lines, kind):
-                missing.append(kind)
-
-        if missing:
-            violations.append({
-                'line': idx + 1,
-                'token': token,
-                'school_id': by_token[token],
-                'missing': missing,
-            })
+    for idx, line in enumerate(text.splitlines()):
+        if not line.strip():
+            continue
+
+        m = INVOC_RE.match(line)
+        if m:
+            token = m.group('school').lower()
+            if token in by_token:
+                required = requirements.get(token)
+                if required is None:
+                    required = requirements[token] = required_kinds(rules, token, strict)
+                missing = [kind for kind in required if kind not in window]
+                if missing:
+                    violations.append({
+                        'line': idx + 1,
+                        'token': token,
+                        'school_id': by_token[token],
+                        'missing': missing,
+                    })
+            window.append(None)
+        else:
+            window.append(classify_comment(line))
 
     return violations
 
-def fix_ritual(ritual_path: Path, violations, by_id, by_token, rules):
-    lines = ritual_path.read_text(encoding='utf-8').splitlines()
-    # Insert in reverse line order so indices stay valid
-    for v in sorted(violations, key=lambda x: x['line'], reverse=True):
+def fix_lines(lines, violations):
+    """Lines with the missing comments inserted above each violation, rebuilt in one pass."""
+    inserts = {}
+    for v in violations:
         idx0 = v['line'] - 1
-        token = v['token']
-        school_id = v['school_id']
+        above = lines[idx0 - 1].strip() if idx0 >= 1 else None
         tier = None
         # If your lock file eventually carries safety tiers, populate from there:
         # e.g., tier = lock['schools']['by_id'][school_id]['spec'].get('safety_tier')
-        for kind in v['missing']:
-            comment = build_comment(token, school_id, kind, tier=tier)
-            # Avoid duplicate insertion if same comment already at that exact spot
-            if idx0-1 >= 0 and comment.strip() == lines[idx0-1].strip():
-                continue
-            lines.insert(idx0, comment)
+        comments = [build_comment(v['token'], v['school_id'], kind, tier=tier) for kind in v['missing']]
+        # Avoid duplicate insertion if same comment already at that exact spot;
+        # each kind is inserted directly above the invocation, so the last ends up first
+        inserts[idx0] = [c for c in reversed(comments) if c.strip() != above]
+
+    fixed = []
+    for idx, line in enumerate(lines):
+        if idx in inserts:
+            fixed.extend(inserts[idx])
+        fixed.append(line)
+    return fixed
 
-    ritual_path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+def fix_text(text: str, violations):
+    return "\n".join(fix_lines(text.splitlines(), violations)) + "\n"
+
+def fix_ritual(ritual_path: Path, violations, by_id, by_token, rules):
+    ritual_path.write_text(fix_text(ritual_path.read_text(encoding='utf-8'), violations), encoding='utf-8')
+
+# -------------------------------
+# Result cache & parallel analysis
+# -------------------------------
+
+def collect_rituals(targets):
+    """Expand ritual files and directories (recursively, *.ccraft) into a sorted path list."""
+    found = set()
+    for target in targets:
+        path = Path(target)
+        if path.is_dir():
+            found.update(p for p in path.rglob('*.ccraft') if p.is_file())
+        elif path.exists():
+            found.add(path)
+    return sorted(found)
+
+def canon_hash(canon_lock_path: Path = None, schools_yaml_path: Path = None, strict=False):
+    """Hash of everything a cached result depends on besides the ritual itself."""
+    h = hashlib.sha256(f"v{CACHE_VERSION} strict={bool(strict)}".encode())
+    for path in (canon_lock_path, schools_yaml_path):
+        h.update(b"\0")
+        if path and path.exists():
+            h.update(path.read_bytes())
+    return h.hexdigest()
+
+def load_cache(cache_path: Path):
+    try:
+        with cache_path.open('r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get('version') != CACHE_VERSION:
+        return {}
+    return data.get('files', {})
+
+def save_cache(cache_path: Path, entries):
+    tmp = cache_path.with_name(cache_path.name + '.tmp')
+    try:
+        with tmp.open('w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'files': entries}, f, ensure_ascii=False)
+        os.replace(tmp, cache_path)
+    except OSError:
+        pass  # read-only checkout: lint without a cache
+
+def lint_file(path, by_id, by_token, rules, strict=False):
+    """Analyze one ritual; returns a cache entry (runs in worker processes)."""
+    st = os.stat(path)
+    data = Path(path).read_bytes()
+    return {
+        'sha256': hashlib.sha256(data).hexdigest(),
+        'size': st.st_size,
+        'mtime_ns': st.st_mtime_ns,
+        'violations': analyze_text(data.decode('utf-8'), by_id, by_token, rules, strict=strict),
+    }
+
+def lint_rituals(paths, canon_key, load, cache=None, changed_only=False, jobs=None, strict=False):
+    """
+    Violations for every ritual, analyzing only files without a valid cached result.
+
+    cache: {path: entry} updated in place. An entry is valid when its canon hash
+    matches and its sha256 matches the file (or, with changed_only, when size
+    and mtime_ns are unchanged). Files whose mtime is within RACY_WINDOW_NS of
+    now are analyzed but left out of the cache. load() returns
+    (by_id, by_token, rules) and is only called when something has to be analyzed.
+    Returns ({path: violations}, number of files analyzed).
+    """
+    cache = {} if cache is None else cache
+    results = {}
+    dirty = []
+    for path in paths:
+        key = str(path)
+        entry = cache.get(key)
+        if entry and entry.get('canon') == canon_key:
+            st = path.stat()
+            if changed_only and entry['size'] == st.st_size and entry['mtime_ns'] == st.st_mtime_ns:
+                results[key] = entry['violations']
+                continue
+            if entry['sha256'] == hashlib.sha256(path.read_bytes()).hexdigest():
+                if time.time_ns() - st.st_mtime_ns >= RACY_WINDOW_NS:
+                    entry['size'], entry['mtime_ns'] = st.st_size, st.st_mtime_ns
+                results[key] = entry['violations']
+                continue
+        dirty.append(key)
+
+    if dirty:
+        by_id, by_token, rules = load()
+        lint = partial(lint_file, by_id=by_id, by_token=by_token, rules=rules, strict=strict)
+        if jobs == 1 or len(dirty) == 1:
+            entries = list(map(lint, dirty))
+        else:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                entries = list(pool.map(lint, dirty, chunksize=8))
+        now_ns = time.time_ns()
+        for key, entry in zip(dirty, entries):
+            entry['canon'] = canon_key
+            if now_ns - entry['mtime_ns'] >= RACY_WINDOW_NS:
+                cache[key] = entry
+            else:
+                cache.pop(key, None)  # same-tick edits could go unnoticed
+            results[key] = entry['violations']
+
+    return {str(p): results[str(p)] for p in paths}, len(dirty)
 
 # -------------------------------
 # CLI
@@ -259,43 +384,74 @@ def fix_ritual(ritual_path: Path, violations, by_id, by_token, rules):
 def main():
     ap = argparse.ArgumentParser(description="Commentomancy Generator / Linter")
     ap.add_argument('mode', choices=['analyze', 'fix'], help="Run in analyze or fix mode")
-    ap.add_argument('ritual', help="Path to .ccraft ritual file")
+    ap.add_argument('rituals', nargs='+', help="Paths to .ccraft ritual files or directories of them")
     ap.add_argument('--canon', help="Path to canon.lock.yaml")
     ap.add_argument('--schools', help="Path to schools.canonical.yaml")
     ap.add_argument('--strict', action='store_true', help="Treat advisory comments as required")
+    ap.add_argument('--cache', default=DEFAULT_CACHE, help=f"Result cache file (default: {DEFAULT_CACHE})")
+    ap.add_argument('--no-cache', action='store_true', help="Analyze every ritual without reading or writing the cache")
+    ap.add_argument('--changed-only', action='store_true',
+                    help="Reuse cached results for rituals whose size and mtime are unchanged")
+    ap.add_argument('--jobs', type=int, default=None, help="Worker processes for analysis (default: CPU count)")
     args = ap.parse_args()
 
-    ritual_path = Path(args.ritual)
-    if not ritual_path.exists():
-        print(f"ERROR: ritual file not found: {ritual_path}", file=sys.stderr)
+    for target in args.rituals:
+        if not Path(target).exists():
+            print(f"ERROR: ritual file not found: {target}", file=sys.stderr)
+            return 2
+    ritual_paths = collect_rituals(args.rituals)
+    if not ritual_paths:
+        print(f"ERROR: no .ccraft rituals found in: {', '.join(args.rituals)}", file=sys.stderr)
         return 2
 
     canon_lock_path = Path(args.canon) if args.canon else None
     schools_yaml_path = Path(args.schools) if args.schools else None
+    cache_path = Path(args.cache)
+    cache = {} if args.no_cache else load_cache(cache_path)
 
     try:
-        by_id, by_token, rules = load_canon(canon_lock_path, schools_yaml_path)
+        results, analyzed = lint_rituals(
+            ritual_paths,
+            canon_hash(canon_lock_path, schools_yaml_path, args.strict),
+            lambda: load_canon(canon_lock_path, schools_yaml_path),
+            cache=cache, changed_only=args.changed_only, jobs=args.jobs, strict=args.strict,
+        )
     except SystemExit as e:
         print(str(e), file=sys.stderr)
         return 1
 
-    violations = analyze_ritual(ritual_path, by_id, by_token, rules, strict=args.strict)
+    failing = {path: violations for path, violations in results.items() if violations}
+    multiple = len(ritual_paths) > 1
+    if multiple:
+        print(f"🔎 Commentomancy: {len(ritual_paths)} ritual(s), {analyzed} analyzed, "
+              f"{len(ritual_paths) - analyzed} from cache.")
 
     if args.mode == 'analyze':
-        if not violations:
-            print("✅ Commentomancy: ritual is constitutionally compliant.")
+        if not args.no_cache:
+            save_cache(cache_path, cache)
+        if not failing:
+            print("✅ Commentomancy: ritual is constitutionally compliant." if not multiple
+                  else "✅ Commentomancy: all rituals are constitutionally compliant.")
             return 0
-        print(f"❌ Commentomancy: {len(violations)} missing annotation(s) found:")
-        for v in violations:
-            print(f"  Line {v['line']}: ::{v['token']}: missing {', '.join(v['missing'])}")
+        for path, violations in failing.items():
+            print(f"❌ Commentomancy: {len(violations)} missing annotation(s) found" +
+                  (f" in {path}:" if multiple else ":"))
+            for v in violations:
+                print(f"  Line {v['line']}: ::{v['token']}: missing {', '.join(v['missing'])}")
         return 1
 
     # fix mode
-    if not violations:
+    if not failing:
+        if not args.no_cache:
+            save_cache(cache_path, cache)
         print("✅ Commentomancy: nothing to fix.")
         return 0
-    fix_ritual(ritual_path, violations, by_id, by_token, rules)
-    print(f"🛠️ Commentomancy: inserted {sum(len(v['missing']) for v in violations)} annotation(s).")
+    for path, violations in failing.items():
+        fix_ritual(Path(path), violations, None, None, None)
+        cache.pop(path, None)  # rewritten: analyze again next run
+    if not args.no_cache:
+        save_cache(cache_path, cache)
+    print(f"🛠️ Commentomancy: inserted {sum(len(v['missing']) for vs in failing.values() for v in vs)} annotation(s).")
     return 0
 
 if __name__ == '__main__':
@@ -0,0 +1,149 @@
+# scripts/file_hashes.py
+# Shared sha256 file hashing for the lock tools, with a persistent stat-keyed cache
+#
+# A file is re-hashed only when its (size, mtime_ns, inode) changes, so a
+# build + validate cycle (separate processes) hashes each lexicon file at most
+# once. Files modified within RACY_WINDOW_NS of being hashed are not cached:
+# a write in the same mtime tick could otherwise leave a stale hash behind.
+# Saving prunes entries this run did not look up unless they still match
+# their file's stat (the lock tools hash different file sets), so deleted and
+# rewritten files - e.g. test temp dirs - do not accumulate.
+
+import atexit
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_CACHE = REPO_ROOT / ".file_hash_cache.json"
+CACHE_VERSION = 1
+CHUNK_SIZE = 1 << 16  # bytes hashed per read
+RACY_WINDOW_NS = 2_000_000_000  # mtimes this close to "now" are not trusted
+
+PathLike = Union[str, Path]
+
+def sha256_uncached(path: PathLike) -> str:
+    """sha256 of a file's contents, streamed in CHUNK_SIZE reads"""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+class FileHashCache:
+    """
+    {absolute path: [size, mtime_ns, inode, sha256]} persisted as JSON.
+    Hashing runs outside the cache (in worker threads for hash_many);
+    only the calling thread updates entries.
+    """
+
+    def __init__(self, path: Optional[PathLike] = DEFAULT_CACHE):
+        self.path = Path(path) if path is not None else None
+        self.entries: Dict[str, list] = self._load() if self.path is not None else {}
+        self.dirty = False
+        self.hashed = 0  # files actually read this process
+        self.seen = set()  # keys looked up this process
+
+    def _load(self) -> Dict[str, list]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            return {}
+        return data.get("files", {})
+
+    def prune(self):
+        """Drop entries not looked up this process whose file is gone or has changed"""
+        for key in [k for k in self.entries if k not in self.seen]:
+            try:
+                st = os.stat(key)
+            except OSError:
+                st = None
+            if st is None or self.entries[key][:3] != [st.st_size, st.st_mtime_ns, st.st_ino]:
+                del self.entries[key]
+                self.dirty = True
+
+    def save(self):
+        """Prune, then write the cache if anything changed (read-only checkouts run uncached)"""
+        if self.path is None:
+            return
+        self.prune()
+        if not self.dirty:
+            return
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        try:
+            tmp.write_text(json.dumps({"version": CACHE_VERSION, "files": self.entries}), encoding="utf-8")
+            os.replace(tmp, self.path)
+            self.dirty = False
+        except OSError:
+            pass
+
+    def _lookup(self, key: str, st: os.stat_result) -> Optional[str]:
+        self.seen.add(key)
+        entry = self.entries.get(key)
+        if entry and entry[:3] == [st.st_size, st.st_mtime_ns, st.st_ino]:
+            return entry[3]
+        return None
+
+    def _store(self, key: str, st: os.stat_result, digest: str):
+        self.hashed += 1
+        if time.time_ns() - st.st_mtime_ns < RACY_WINDOW_NS:
+            self.entries.pop(key, None)
+        else:
+            self.entries[key] = [st.st_size, st.st_mtime_ns, st.st_ino, digest]
+        self.dirty = True
+
+    def sha256(self, path: PathLike) -> str:
+        """sha256 of one file, read only if its stat changed since it was cached"""
+        key = str(Path(path).resolve())
+        st = os.stat(key)
+        digest = self._lookup(key, st)
+        if digest is None:
+            digest = sha256_uncached(key)
+            self._store(key, st, digest)
+        return digest
+
+    def hash_many(self, paths: Iterable[PathLike], workers: Optional[int] = None) -> Dict[str, str]:
+        """
+        {str(path): sha256} for many files, in input order; uncached files are
+        hashed in a thread pool (hashlib releases the GIL while hashing)
+        """
+        paths = list(paths)
+        keys = [str(Path(p).resolve()) for p in paths]
+        stats = [os.stat(k) for k in keys]
+        digests: List[Optional[str]] = [self._lookup(k, st) for k, st in zip(keys, stats)]
+
+        todo = [i for i, d in enumerate(digests) if d is None]
+        if workers == 1 or len(todo) <= 1:
+            fresh = [sha256_uncached(keys[i]) for i in todo]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                fresh = list(pool.map(sha256_uncached, (keys[i] for i in todo)))
+        for i, digest in zip(todo, fresh):
+            self._store(keys[i], stats[i], digest)
+            digests[i] = digest
+
+        return {str(p): d for p, d in zip(paths, digests)}
+
+_default: Optional[FileHashCache] = None
+
+def default_cache() -> FileHashCache:
+    """Process-wide cache at DEFAULT_CACHE, saved at interpreter exit"""
+    global _default
+    if _default is None:
+        _default = FileHashCache()
+        atexit.register(_default.save)
+    return _default
+
+def sha256_file(path: PathLike) -> str:
+    """sha256 of a file's contents via the shared cache"""
+    return default_cache().sha256(path)
+
+def hash_many(paths: Iterable[PathLike], workers: Optional[int] = None) -> Dict[str, str]:
+    """{str(path): sha256} for many files via the shared cache, hashing misses in parallel"""
+    return default_cache().hash_many(paths, workers)
@@ -9,7 +9,18 @@ Checks:
   - Required Law sigils present for {blueprint, protocol, charter}
   - Token≠Schools invariant reminder hook (delegates to lost_validate)
 """
-import re, sys, pathlib, yaml
+
+# --- path bootstrap (identical in both CLIs) ---
+from pathlib import Path
+import sys
+THIS_FILE = Path(__file__).resolve()
+REPO_ROOT = THIS_FILE.parents[1]  # project root (contains 'scripts')
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+# -----------------------------------------------
+
+import re, pathlib, yaml
+from scripts.lost_document import LostDocument, extract_embedded_yaml, paired_yaml  # shared with lost_validate
 
 # SIGILS (longest first!)
 LAW_SIGILS  = [r"//!\?", r"//!\s", r"///", r"//(?!->|\*|<3|~|\+)"]
@@ -24,32 +35,6 @@ BARE_INVOKE_RX = re.compile(r"^\s*-\s*invoke:\s*(?:[a-z0-9_]+)$", re.I)
 DOC_HEADER_RX = re.compile(r"^#\s*(.+)$")
 TYPE_RX = re.compile(r'^\s*document_type:\s*"(.*?)"\s*$', re.I)
 
-def paired_yaml(md_path: pathlib.Path) -> pathlib.Path:
-    return md_path.with_suffix(".yaml")
-
-def extract_embedded_yaml(md_text: str) -> str | None:
-    """Extract YAML content from embedded code fences in markdown (returns LAST block)"""
-    lines = md_text.splitlines()
-    in_yaml_block = False
-    all_yaml_blocks = []
-    current_block = []
-    
-    for line in lines:
-        if line.strip().startswith("```yaml"):
-            in_yaml_block = True
-            current_block = []
-            continue
-        elif line.strip() == "```" and in_yaml_block:
-            in_yaml_block = False
-            if current_block:
-                all_yaml_blocks.append("\n".join(current_block))
-            current_block = []
-        elif in_yaml_block:
-            current_block.append(line)
-    
-    # Return LAST YAML block (LOST v3.1 puts machine-readable YAML at document end)
-    return all_yaml_blocks[-1] if all_yaml_blocks else None
-
 def longest_match_violation(line: str) -> bool:
     # If both Law and Lore appear, Law must anchor; and the sigil matched must be the longest
     # We approximate by checking conflicting matches at same column.
@@ -63,20 +48,21 @@ def longest_match_violation(line: str) -> bool:
         return False  # presence of both is okay as long as '//!?' is first
     return False
 
-def lint_file(md_path: pathlib.Path) -> list[str]:
+def lint_file(md_path: pathlib.Path, doc: LostDocument | None = None) -> list[str]:
     errs, doc_type = [], None
-    md_text = md_path.read_text(encoding="utf-8", errors="ignore")
+    if doc is None:
+        doc = LostDocument.load(md_path)
+    md_text = doc.text
     text = md_text.splitlines()
     
     # 0) paired yaml (check paired file first, then embedded)
-    yml = paired_yaml(md_path)
     yaml_content = None
     
-    if yml.exists():
-        yaml_content = yml.read_text(encoding="utf-8")
+    if doc.yaml_data is not None:
+        yaml_content = doc.yaml_text
     else:
         # Try embedded YAML
-        embedded = extract_embedded_yaml(md_text)
+        embedded = doc.embedded_yaml
         if embedded:
             yaml_content = embedded
         else:
@@ -110,7 +96,7 @@ def lint_file(md_path: pathlib.Path) -> list[str]:
     if yaml_content:
         try:
             # Use safe_load_all() to handle multi-document YAML streams (separated by ---)
-            documents = list(yaml.safe_load_all(yaml_content))
+            documents = doc.load_all(yaml_content)
             
             if not documents:
                 errs.append(f"[META] Embedded YAML block found but contained no valid documents")
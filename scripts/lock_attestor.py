@@ -3,12 +3,20 @@
 canon-lock attestor
 See docs/README.md for usage.
 """
-import argparse, hashlib, pathlib, sys, re, datetime as dt
+import argparse, pathlib, sys, re, datetime as dt
+
+# --- path bootstrap (shared hashing lives in scripts/) ---
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+# ---------------------------------------------------------
+
+from scripts import file_hashes
 
 PARTITIONS = ["schools","foundations","parameters","syntax_variants","operators","grammar"]
 
 def file_sha(path: pathlib.Path) -> str:
-    return hashlib.sha256(path.read_bytes()).hexdigest()
+    return file_hashes.sha256_file(path)
 
 def try_yaml(path: pathlib.Path):
     try:
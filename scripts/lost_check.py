@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LOST v3.1 Combined Check - lost_validate + law_lore_lint in one pass
+
+Each document (and its paired YAML) is read and parsed once and handed to
+both validators. Per-file results are cached in .lost_check_cache.json keyed
+by a hash of the document + paired YAML contents (the whole cache is dropped
+when a validator's source changes), and uncached documents are checked in a
+process pool.
+
+Usage:
+  python -m scripts.lost_check [docs/**/*.md ...] [--jobs N] [--no-cache] [--cache PATH]
+
+Exit codes:
+  0 = all documents pass both validators
+  1 = errors found (printed sorted and de-duplicated to stderr, like both CLIs)
+"""
+
+# --- path bootstrap (identical in both CLIs) ---
+from pathlib import Path
+import sys
+THIS_FILE = Path(__file__).resolve()
+REPO_ROOT = THIS_FILE.parents[1]  # project root (contains 'scripts')
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+# -----------------------------------------------
+
+import argparse, hashlib, json, os, pathlib, time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from scripts.lost_document import LostDocument, content_hash, read_document_bytes
+from scripts import law_lore_lint, lost_validate
+
+DEFAULT_CACHE = ".lost_check_cache.json"
+
+# Sources whose changes invalidate every cached result
+VALIDATOR_SOURCES = ("lost_validate.py", "law_lore_lint.py", "lost_document.py", "rosetta_integrity.py")
+
+def validators_hash() -> str:
+    h = hashlib.sha256()
+    for name in VALIDATOR_SOURCES:
+        h.update((THIS_FILE.parent / name).read_bytes())
+    return h.hexdigest()
+
+def check_document(doc: LostDocument) -> Dict[str, List[str]]:
+    """Both validators over one loaded document"""
+    return {
+        "lost": lost_validate.validate_document(doc.path, doc),
+        "lint": law_lore_lint.lint_file(doc.path, doc),
+    }
+
+def _check_path(path: str) -> Tuple[str, Dict[str, List[str]]]:
+    """Worker: load and check one document, returning (content hash, results)"""
+    doc = LostDocument.load(pathlib.Path(path))
+    return doc.content_hash, check_document(doc)
+
+def load_cache(cache_path: Path, validators: str) -> Dict[str, dict]:
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("validators") != validators:
+        return {}
+    return data.get("files", {})
+
+def save_cache(cache_path: Path, validators: str, entries: Dict[str, dict]):
+    tmp = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        tmp.write_text(json.dumps({"validators": validators, "files": entries}), encoding="utf-8")
+        os.replace(tmp, cache_path)
+    except OSError:
+        pass  # read-only checkout: run without a cache
+
+def run_checks(paths: List[pathlib.Path], cache: Optional[Dict[str, dict]] = None,
+               jobs: Optional[int] = None) -> Tuple[Dict[str, Dict[str, List[str]]], int]:
+    """
+    Results for every document, checking only those whose content hash is not cached.
+    cache ({path: {"hash", "lost", "lint"}}) is updated in place.
+    Returns ({path: {"lost": [...], "lint": [...]}}, number of documents checked).
+    """
+    cache = {} if cache is None else cache
+    results = {}
+    dirty = []
+    for path in paths:
+        key = str(path)
+        entry = cache.get(key)
+        if entry:
+            if entry["hash"] == content_hash(*read_document_bytes(path)):
+                results[key] = {"lost": entry["lost"], "lint": entry["lint"]}
+                continue
+        dirty.append(key)
+
+    if jobs == 1 or len(dirty) <= 1:
+        checked = list(map(_check_path, dirty))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            checked = list(pool.map(_check_path, dirty, chunksize=4))
+    for key, (digest, result) in zip(dirty, checked):
+        cache[key] = dict(result, hash=digest)
+        results[key] = result
+
+    return {str(p): results[str(p)] for p in paths}, len(dirty)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="LOST v3.1 combined validator + Law/Lore linter")
+    ap.add_argument("paths", nargs="*", help="Markdown documents (default: docs/**/*.md)")
+    ap.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    ap.add_argument("--cache", default=DEFAULT_CACHE, help=f"Result cache file (default: {DEFAULT_CACHE})")
+    ap.add_argument("--no-cache", action="store_true", help="Check every document without the cache")
+    args = ap.parse_args(argv)
+
+    paths = args.paths or [str(p) for p in pathlib.Path(".").rglob("docs/**/*.md")]
+    md_files = [pathlib.Path(p) for p in paths if p.endswith(".md") and pathlib.Path(p).exists()]
+
+    start = time.perf_counter()
+    cache_path = Path(args.cache)
+    validators = validators_hash()
+    cache = {} if args.no_cache else load_cache(cache_path, validators)
+    results, checked = run_checks(md_files, cache, jobs=args.jobs)
+    if not args.no_cache:
+        save_cache(cache_path, validators, cache)
+    elapsed = time.perf_counter() - start
+
+    all_errors = [e for result in results.values() for e in result["lost"] + result["lint"]]
+    if all_errors:
+        print("\n".join(sorted(set(all_errors))), file=sys.stderr)
+
+    rate = len(md_files) / elapsed if elapsed > 0 else float("inf")
+    print(f"📊 LOST: {len(md_files)} file(s), {checked} checked, {len(md_files) - checked} cached, "
+          f"{len(set(all_errors))} error(s) in {elapsed:.2f}s ({rate:.0f} files/sec)")
+    return 1 if all_errors else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
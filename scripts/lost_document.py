@@ -0,0 +1,106 @@
+# scripts/lost_document.py
+# A LOST document read once and shared by lost_validate and law_lore_lint
+
+import hashlib
+import pathlib
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+def paired_yaml(md_path: pathlib.Path) -> pathlib.Path:
+    """Return path to paired YAML metadata file"""
+    return md_path.with_suffix(".yaml")
+
+def extract_embedded_yaml(md_text: str) -> Optional[str]:
+    """Extract YAML content from embedded code fences in markdown (returns LAST block)"""
+    lines = md_text.splitlines()
+    in_yaml_block = False
+    all_yaml_blocks = []
+    current_block = []
+
+    for line in lines:
+        if line.strip().startswith("```yaml"):
+            in_yaml_block = True
+            current_block = []
+            continue
+        elif line.strip() == "```" and in_yaml_block:
+            in_yaml_block = False
+            if current_block:
+                all_yaml_blocks.append("\n".join(current_block))
+            current_block = []
+        elif in_yaml_block:
+            current_block.append(line)
+
+    # Return LAST YAML block (LOST v3.1 puts machine-readable YAML at document end)
+    return all_yaml_blocks[-1] if all_yaml_blocks else None
+
+def content_hash(data: bytes, yaml_data: Optional[bytes]) -> str:
+    """sha256 over a document's bytes and its paired YAML bytes (if any)"""
+    return hashlib.sha256(data + b"\0" + (b"-" if yaml_data is None else b"+" + yaml_data)).hexdigest()
+
+def read_document_bytes(path: pathlib.Path) -> Tuple[bytes, Optional[bytes]]:
+    """(document bytes, paired YAML bytes or None)"""
+    yml = paired_yaml(path)
+    return path.read_bytes(), (yml.read_bytes() if yml.exists() else None)
+
+_MISSING = object()
+
+class LostDocument:
+    """
+    Markdown text, paired YAML text and embedded YAML of one document, each
+    read or extracted at most once; parsed YAML streams are memoized so both
+    validators share them.
+    """
+
+    def __init__(self, path: pathlib.Path, data: bytes, yaml_data: Optional[bytes]):
+        self.path = path
+        self.text = data.decode("utf-8", errors="ignore").replace("\r\n", "\n").replace("\r", "\n")
+        self.yaml_path = paired_yaml(path)
+        self.yaml_data = yaml_data
+        self.content_hash = content_hash(data, yaml_data)
+        self._embedded = _MISSING
+        self._streams: Dict[str, Tuple[Optional[List[Any]], Optional[Exception]]] = {}
+
+    @classmethod
+    def load(cls, path: pathlib.Path) -> "LostDocument":
+        path = pathlib.Path(path)
+        return cls(path, *read_document_bytes(path))
+
+    @property
+    def yaml_text(self) -> Optional[str]:
+        """Paired YAML file contents (None if there is no paired file)"""
+        return None if self.yaml_data is None else self.yaml_data.decode("utf-8")
+
+    @property
+    def embedded_yaml(self) -> Optional[str]:
+        if self._embedded is _MISSING:
+            self._embedded = extract_embedded_yaml(self.text)
+        return self._embedded
+
+    def load_paired(self) -> Any:
+        """
+        yaml.safe_load of the paired YAML file, reusing the load_all(yaml_text)
+        parse that law_lore_lint also asks for (None without a paired file)
+        """
+        if self.yaml_data is None:
+            return None
+        source = self.yaml_text
+        try:
+            documents = self.load_all(source)
+        except Exception:
+            documents = None
+        if documents is None or len(documents) > 1:
+            return yaml.safe_load(source)  # raises exactly what safe_load would
+        return documents[0] if documents else None
+
+    def load_all(self, source: str) -> List[Any]:
+        """yaml.safe_load_all(source) as a list, parsed once per document (errors re-raised)"""
+        if source not in self._streams:
+            try:
+                self._streams[source] = (list(yaml.safe_load_all(source)), None)
+            except Exception as e:
+                self._streams[source] = (None, e)
+        documents, error = self._streams[source]
+        if error is not None:
+            raise error
+        return documents
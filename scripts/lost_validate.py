@@ -26,6 +26,7 @@ if str(REPO_ROOT) not in sys.path:
 import re, yaml, hashlib, pathlib
 from typing import Dict, List, Optional, Set
 from scripts.rosetta_integrity import canonical_hash_from_text  # MEGA's shared canonicalization
+from scripts.lost_document import LostDocument, extract_embedded_yaml, paired_yaml  # shared with law_lore_lint
 
 # Debug path flag
 if "--debug-path" in sys.argv:
@@ -116,33 +117,6 @@ def _get_authorities(meta: dict) -> list:
         or []
     )
 
-def paired_yaml(md_path: pathlib.Path) -> pathlib.Path:
-    """Return path to paired YAML metadata file"""
-    return md_path.with_suffix(".yaml")
-
-def extract_embedded_yaml(md_text: str) -> Optional[str]:
-    """Extract YAML content from embedded code fences in markdown (returns LAST block)"""
-    lines = md_text.splitlines()
-    in_yaml_block = False
-    all_yaml_blocks = []
-    current_block = []
-    
-    for line in lines:
-        if line.strip().startswith("```yaml"):
-            in_yaml_block = True
-            current_block = []
-            continue
-        elif line.strip() == "```" and in_yaml_block:
-            in_yaml_block = False
-            if current_block:
-                all_yaml_blocks.append("\n".join(current_block))
-            current_block = []
-        elif in_yaml_block:
-            current_block.append(line)
-    
-    # Return LAST YAML block (LOST v3.1 puts machine-readable YAML at document end)
-    return all_yaml_blocks[-1] if all_yaml_blocks else None
-
 def extract_yaml_frontmatter(text: str) -> Optional[Dict]:
     """Extract YAML frontmatter from markdown if present"""
     if text.startswith("---"):
@@ -154,7 +128,7 @@ def extract_yaml_frontmatter(text: str) -> Optional[Dict]:
                 pass
     return None
 
-def verify_integrity_hash(md_path: pathlib.Path, metadata: dict) -> Optional[str]:
+def verify_integrity_hash(md_path: pathlib.Path, metadata: dict, text: Optional[str] = None) -> Optional[str]:
     """
     Verify self-contained integrity hash (MEGA's shared canonicalization module)
     
@@ -164,7 +138,8 @@ def verify_integrity_hash(md_path: pathlib.Path, metadata: dict) -> Optional[str
     Returns None if valid, error message if invalid.
     """
     # Read claimed hash directly from metadata.integrity (not from parsed YAML which may be stale)
-    text = md_path.read_text(encoding="utf-8", errors="ignore")
+    if text is None:
+        text = md_path.read_text(encoding="utf-8", errors="ignore")
     claimed_hash = _read_claimed_from_metadata(text)
     
     if not claimed_hash:
@@ -183,21 +158,22 @@ def verify_integrity_hash(md_path: pathlib.Path, metadata: dict) -> Optional[str
     
     return None  # Valid!
 
-def validate_document(md_path: pathlib.Path) -> List[str]:
-    """Validate a single LOST document"""
+def validate_document(md_path: pathlib.Path, doc: Optional[LostDocument] = None) -> List[str]:
+    """Validate a single LOST document (doc: the already-loaded document, if any)"""
     errors = []
     
     # Read document
-    text = md_path.read_text(encoding="utf-8", errors="ignore")
-    lines = text.splitlines()
+    if doc is None:
+        doc = LostDocument.load(md_path)
+    text = doc.text
     
     # Check paired YAML (priority: paired file > frontmatter > embedded)
-    yml_path = paired_yaml(md_path)
+    yml_path = doc.yaml_path
     metadata = None
     
-    if yml_path.exists():
+    if doc.yaml_data is not None:
         try:
-            metadata = yaml.safe_load(yml_path.read_text(encoding="utf-8"))
+            metadata = doc.load_paired()
         except Exception as e:
             errors.append(f"[G-01] YAML parse error in {yml_path.name}: {e}")
     else:
@@ -206,11 +182,11 @@ def validate_document(md_path: pathlib.Path) -> List[str]:
         
         # If no frontmatter, try embedded YAML
         if not metadata:
-            embedded_yaml = extract_embedded_yaml(text)
+            embedded_yaml = doc.embedded_yaml
             if embedded_yaml:
                 try:
                     # Use safe_load_all() to handle multi-document YAML streams (separated by ---)
-                    documents = list(yaml.safe_load_all(embedded_yaml))
+                    documents = doc.load_all(embedded_yaml)
                     
                     if not documents:
                         errors.append(f"[G-01] Embedded YAML block found but contained no valid documents")
@@ -230,7 +206,7 @@ def validate_document(md_path: pathlib.Path) -> List[str]:
                 return errors  # Can't validate further without metadata
     
     # Verify integrity hash (MEGA's canonical algorithm: stable & self-contained)
-    integrity_error = verify_integrity_hash(md_path, metadata)
+    integrity_error = verify_integrity_hash(md_path, metadata, text)
     if integrity_error:
         errors.append(integrity_error)
     
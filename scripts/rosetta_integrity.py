@@ -3,8 +3,9 @@
 
 import hashlib
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 FENCE = ("```", "~~~")
 TOP_KV = re.compile(r'^\s*[A-Za-z0-9_]+\s*:\s*$')  # yaml-ish key line (no value on same line)
@@ -12,6 +13,8 @@ TOP_KV = re.compile(r'^\s*[A-Za-z0-9_]+\s*:\s*$')  # yaml-ish key line (no value
 def _indent(s: str) -> int:
     return len(s) - len(s.lstrip(" "))
 
+CHUNK_SIZE = 1 << 16  # characters read (and bytes hashed) per step when streaming
+
 def _canonical_lines(text: str) -> list[str]:
     """
     Canonical view for hashing:
@@ -21,9 +24,10 @@ def _canonical_lines(text: str) -> list[str]:
     - Preserve everything else byte-for-byte (no rstrip!)
     """
     t = text.replace("\r\n", "\n").replace("\r", "\n")
-    lines = t.split("\n")
+    return list(_iter_canonical_lines(t.split("\n")))
 
-    out: list[str] = []
+def _iter_canonical_lines(lines: Iterable[str]) -> Iterator[str]:
+    """_canonical_lines over LF-split lines, one line at a time."""
     in_fence = False
     in_metadata = False
     meta_indent = 0
@@ -36,7 +40,7 @@ def _canonical_lines(text: str) -> list[str]:
         # Toggle fence state
         if ls.startswith(FENCE[0]) or ls.startswith(FENCE[1]):
             in_fence = not in_fence
-            out.append(line)  # preserve exactly
+            yield line  # preserve exactly
             continue
 
         # CRITICAL: Parse metadata.integrity EVEN inside fences (Rosetta Stone has YAML inside ```yaml fence!)
@@ -46,7 +50,7 @@ def _canonical_lines(text: str) -> list[str]:
         if not in_metadata and re.match(r'^\s*metadata:\s*$', line):
             in_metadata = True
             meta_indent = ci
-            out.append(line)
+            yield line
             continue
 
         if in_metadata:
@@ -54,7 +58,7 @@ def _canonical_lines(text: str) -> list[str]:
             if TOP_KV.match(ls) and ci <= meta_indent:
                 in_metadata = False
                 in_integrity = False
-                out.append(line)
+                yield line
                 continue
 
             # Enter integrity: under metadata
@@ -70,19 +74,17 @@ def _canonical_lines(text: str) -> list[str]:
             if in_integrity:
                 if TOP_KV.match(ls) and ci <= integ_indent:
                     in_integrity = False
-                    out.append(line)  # first sibling after integrity
+                    yield line  # first sibling after integrity
                     continue
                 # still inside integrity → skip
                 continue
 
             # Other metadata content
-            out.append(line)
+            yield line
             continue
 
         # Everything else (outside metadata, inside or outside fences)
-        out.append(line)
-
-    return out
+        yield line
 
 def canonical_hash_from_text(text: str) -> str:
     canon = "\n".join(_canonical_lines(text))
@@ -91,6 +93,66 @@ def canonical_hash_from_text(text: str) -> str:
         canon += "\n"
     return hashlib.sha256(canon.encode("utf-8")).hexdigest()
 
+def _iter_file_lines(path: Path, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """
+    Lines of a file as text.split("\n") would give them after LF normalization,
+    reading chunk_size characters at a time. The file is decoded like
+    read_text(encoding="utf-8", errors="ignore"), whose universal newlines
+    already turn CRLF and CR into LF.
+    """
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        tail = ""
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            parts = (tail + chunk).split("\n")
+            tail = parts.pop()
+            yield from parts
+        yield tail
+
+def canonical_hash_from_lines(lines: Iterable[str], chunk_size: int = CHUNK_SIZE) -> str:
+    """
+    canonical_hash_from_text for LF-split lines, feeding sha256 as canonical
+    lines are produced instead of joining them into one string.
+    """
+    h = hashlib.sha256()
+    buf: List[str] = []
+    size = 0
+    previous: Optional[str] = None
+    count = 0
+    for line in _iter_canonical_lines(lines):
+        if previous is not None:
+            buf.append(previous)
+            buf.append("\n")
+            size += len(previous) + 1
+            if size >= chunk_size:
+                h.update("".join(buf).encode("utf-8"))
+                buf.clear()
+                size = 0
+        previous = line
+        count += 1
+    # "\n".join(...) plus a single final LF: a trailing empty line only
+    # contributes the LF already written before it
+    if previous is None:
+        buf.append("\n")
+    elif previous != "" or count == 1:
+        buf.append(previous + "\n")
+    h.update("".join(buf).encode("utf-8"))
+    return h.hexdigest()
+
+def canonical_hash_from_file(path: Path, chunk_size: int = CHUNK_SIZE) -> str:
+    """canonical_hash_from_text(path.read_text(...)) in constant memory (per line)."""
+    return canonical_hash_from_lines(_iter_file_lines(path, chunk_size), chunk_size)
+
+def canonical_hashes(paths: Iterable[Path], workers: Optional[int] = None) -> Dict[str, str]:
+    """Streaming canonical hashes of many documents, computed in a process pool."""
+    paths = [str(p) for p in paths]
+    if workers == 1 or len(paths) <= 1:
+        return {p: canonical_hash_from_file(p) for p in paths}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return dict(zip(paths, pool.map(canonical_hash_from_file, paths)))
+
 _sha_rx = re.compile(r'^(\s*sha256:\s*)(["\']?)([0-9A-Fa-f]{64})(\2)\s*$')
 
 def find_sha_span(lines: list[str]) -> Optional[Tuple[int, int, re.Match]]:
@@ -143,9 +205,11 @@ def replace_sha(text: str, new_hex: str) -> str:
     return out
 
 # Convenience CLI so fixer/validator/tests all use the *same* code path
+# (several paths: one "<sha256>  <path>" line each, hashed in parallel)
 if __name__ == "__main__":
     import sys
-    p = Path(sys.argv[1])
-    text = p.read_text(encoding="utf-8", errors="ignore")
-    h = canonical_hash_from_text(text)
-    print(h)
+    if len(sys.argv) == 2:
+        print(canonical_hash_from_file(Path(sys.argv[1])))
+    else:
+        for path, h in canonical_hashes(sys.argv[1:]).items():
+            print(f"{h}  {path}")
@@ -1,10 +1,42 @@
-import json, time
+from __future__ import annotations
+import atexit
+from typing import List, Optional
+from .sinks import COUNCIL, GRAPH, MEMORY, EventDispatcher, PrintSink, Sink, format_event
+
+# Set by configure(); without it events are printed synchronously as before
+_dispatcher: Optional[EventDispatcher] = None
+
+def configure(sinks: Optional[List[Sink]] = None, **options) -> EventDispatcher:
+    """
+    Route hook events through a background EventDispatcher (batch_size,
+    flush_interval, max_queue, policy) writing to the given sinks
+    (default: PrintSink). Replaces any previously configured dispatcher.
+    """
+    global _dispatcher
+    shutdown()
+    _dispatcher = EventDispatcher(sinks or [PrintSink()], **options)
+    return _dispatcher
+
+def shutdown():
+    """Flush and close the configured dispatcher, returning to synchronous printing."""
+    global _dispatcher
+    if _dispatcher is not None:
+        _dispatcher.close()
+        _dispatcher = None
+
+atexit.register(shutdown)
+
+def _emit(kind: str, payload):
+    if _dispatcher is not None:
+        _dispatcher.emit(kind, payload)
+    else:
+        print(format_event(kind, payload))
 
 def store_memory(event: dict):
-    print("[CMP] store_memory:", json.dumps(event, ensure_ascii=False))
+    _emit(MEMORY, event)
 
 def update_graph(changes: dict):
-    print("[LKG] update_graph:", json.dumps(changes, ensure_ascii=False))
+    _emit(GRAPH, changes)
 
 def notify_council(msg: str):
-    print("[COUNCIL]", msg)
+    _emit(COUNCIL, msg)
@@ -1,9 +1,33 @@
 from __future__ import annotations
-import yaml, pathlib, time
-from typing import Dict, Any, List
+import ast, json, os, yaml, pathlib, time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 from .hooks import store_memory, update_graph, notify_council
 
 RITUAL_GLOB = "**/*.yaml"
+SAFE_TYPES = (int, float, str, bool)
+NO_BUILTINS = {"__builtins__": {}}
+CACHE_FILE = ".grimoire_cache.json"
+CACHE_VERSION = 1
+RACY_WINDOW_NS = 2_000_000_000  # files modified this recently are not cached (same-tick edits keep size and mtime)
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)  # libyaml when available
+
+def safe_locals(context: Dict[str, Any]) -> Dict[str, Any]:
+    return {k:v for k,v in context.items() if isinstance(v, SAFE_TYPES)}
+
+def first_name(node: ast.AST) -> Optional[str]:
+    """Name loaded first when evaluating an expression (its absence raises NameError), if any."""
+    while True:
+        if isinstance(node, ast.Expression): node = node.body
+        elif isinstance(node, ast.Name): return node.id
+        elif isinstance(node, ast.Compare): node = node.left
+        elif isinstance(node, ast.BoolOp): node = node.values[0]
+        elif isinstance(node, ast.BinOp): node = node.left
+        elif isinstance(node, ast.UnaryOp): node = node.operand
+        elif isinstance(node, ast.IfExp): node = node.test
+        elif isinstance(node, (ast.Attribute, ast.Subscript)): node = node.value
+        elif isinstance(node, ast.Call): node = node.func
+        else: return None
 
 class Ritual:
     def __init__(self, data: Dict[str, Any]):
@@ -13,17 +37,34 @@ class Ritual:
         self.trigger = data.get("trigger")
         self.effects = data.get("effects", [])
         self.lore = data.get("lore","")
+        self.compile_trigger()
+
+    def compile_trigger(self):
+        """Compile a string trigger once; a trigger that fails to compile only ever matches as a substring."""
+        trig = self.trigger or ""
+        self.needle = trig.lower() if isinstance(trig, str) else None
+        self.code = None
+        self.first_name = None
+        if isinstance(trig, str):
+            try:
+                tree = ast.parse(trig, mode="eval")
+                self.code = compile(tree, f"<trigger {self.id}>", "eval")
+                self.first_name = first_name(tree)
+            except (SyntaxError, ValueError):
+                pass
 
-    def matches(self, context: Dict[str, Any]) -> bool:
+    def matches(self, context: Dict[str, Any], safe: Optional[Dict[str, Any]] = None,
+                haystack: Optional[str] = None) -> bool:
         trig = self.trigger or ""
         if isinstance(trig, dict):
             return all(context.get(k)==v for k,v in trig.items())
         if isinstance(trig, str):
             try:
-                safe = {k:v for k,v in context.items() if isinstance(v,(int,float,str,bool))}
-                return bool(eval(trig, {"__builtins__": {}}, safe))
+                if self.code is None:
+                    raise SyntaxError(trig)
+                return bool(eval(self.code, NO_BUILTINS, safe_locals(context) if safe is None else safe))
             except Exception:
-                return trig.lower() in str(context).lower()
+                return self.needle in (str(context).lower() if haystack is None else haystack)
         return False
 
     def run_effects(self, context: Dict[str, Any]):
@@ -44,17 +85,149 @@ class Ritual:
                 if "graph" in eff:
                     update_graph(eff["graph"])
 
+def parse_ritual_file(path: pathlib.Path) -> Any:
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=YAML_LOADER)
+
+def json_safe(data: Any) -> bool:
+    """Whether data survives a JSON round trip unchanged (no dates, tuples, non-string keys...)."""
+    try:
+        return json.loads(json.dumps(data)) == data
+    except (TypeError, ValueError):
+        return False
+
 class Grimoire:
-    def __init__(self, root: str | pathlib.Path):
+    def __init__(self, root: str | pathlib.Path, cache_path: str | pathlib.Path | None = None,
+                 workers: Optional[int] = None):
         self.root = pathlib.Path(root)
+        self.cache_path = pathlib.Path(cache_path) if cache_path else self.root / CACHE_FILE
+        self.workers = workers or min(32, (os.cpu_count() or 1) + 4)
         self.rituals: List[Ritual] = []
+        self._indexed = -1  # len(self.rituals) when the trigger index was built
+        self.load_stats: Dict[str, Any] = {}
 
-    def load(self):
+    def load(self, use_cache: bool = True):
+        """
+        Load ritual manifests. Parsed manifests are kept in a JSON snapshot
+        keyed by file size and mtime, so an unchanged tree loads in one read;
+        changed files are re-parsed on a thread pool. Files modified within
+        RACY_WINDOW_NS of the load are not snapshotted.
+        """
+        start = time.perf_counter()
+        cached = self.read_cache() if use_cache else {}
+        files = []
         for p in self.root.glob(RITUAL_GLOB):
-            with open(p, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-                if isinstance(data, dict):
-                    self.rituals.append(Ritual(data))
+            st = p.stat()
+            files.append((str(p), p, st.st_size, st.st_mtime_ns))
+
+        manifests: Dict[str, Any] = {}
+        stale = []
+        for key, p, size, mtime_ns in files:
+            entry = cached.get(key)
+            if entry and entry["size"] == size and entry["mtime_ns"] == mtime_ns:
+                manifests[key] = entry["data"]
+            else:
+                stale.append((key, p))
+
+        if stale:
+            if len(stale) == 1 or self.workers == 1:
+                parsed = [parse_ritual_file(p) for _, p in stale]
+            else:
+                with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                    parsed = list(pool.map(parse_ritual_file, [p for _, p in stale]))
+            manifests.update(zip((key for key, _ in stale), parsed))
+            if use_cache:
+                self.write_cache({key: {"size": size, "mtime_ns": mtime_ns, "data": manifests[key]}
+                                  for key, _, size, mtime_ns in files}, stale)
+
+        for key, *_ in files:
+            if isinstance(manifests[key], dict):
+                self.rituals.append(Ritual(manifests[key]))
+        self.build_index()
+        self.load_stats = {"files": len(files), "parsed": len(stale), "cached": len(files) - len(stale),
+                           "seconds": time.perf_counter() - start}
+
+    def read_cache(self) -> Dict[str, Any]:
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(snapshot, dict) or snapshot.get("version") != CACHE_VERSION:
+            return {}
+        return snapshot.get("files", {})
+
+    def write_cache(self, entries: Dict[str, Any], parsed: List[Tuple[str, pathlib.Path]]):
+        # Manifests JSON would alter are left out and re-parsed on every load
+        for key, _ in parsed:
+            if not json_safe(entries[key]["data"]):
+                del entries[key]
+        # So are files modified within RACY_WINDOW_NS: a same-size edit in the
+        # same mtime tick would otherwise be served from the stale snapshot
+        now_ns = time.time_ns()
+        entries = {key: entry for key, entry in entries.items() if now_ns - entry["mtime_ns"] >= RACY_WINDOW_NS}
+        tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": CACHE_VERSION, "files": entries}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            pass  # read-only grimoire: load without a snapshot
+
+    def build_index(self):
+        """
+        Index triggers so scan_triggers only evaluates candidate rituals:
+        dict triggers by one (key, value) pair, string triggers by the name
+        they load first, and substring fallbacks by their exact lowercase text.
+        Anything that cannot be indexed is evaluated for every context.
+        """
+        self.by_pair: Dict[Tuple[Any, Any], List[int]] = {}
+        self.by_name: Dict[str, List[int]] = {}
+        self.by_needle: Dict[int, Dict[str, List[int]]] = {}  # needle length -> needle -> positions
+        self.always: List[int] = []
+        for i, r in enumerate(self.rituals):
+            trig = r.trigger or ""
+            if isinstance(trig, dict):
+                # context.get(k) == None matches a missing key, so only non-None values are indexable
+                pair = next(((k, v) for k, v in trig.items() if v is not None), None)
+                try:
+                    if pair:
+                        self.by_pair.setdefault(pair, []).append(i)
+                        continue
+                except TypeError:
+                    pass
+                self.always.append(i)
+            elif isinstance(trig, str):
+                if r.code is not None and (r.first_name is None or r.first_name in NO_BUILTINS):
+                    self.always.append(i)
+                    continue
+                if r.code is not None:
+                    self.by_name.setdefault(r.first_name, []).append(i)
+                # Without its first name the trigger raises NameError, leaving the substring fallback
+                self.by_needle.setdefault(len(r.needle), {}).setdefault(r.needle, []).append(i)
+        self._indexed = len(self.rituals)
+
+    def candidates(self, context: Dict[str, Any], safe: Dict[str, Any]) -> set:
+        """Ritual positions whose triggers must be evaluated in full."""
+        evaluate = set(self.always)
+        for k, v in context.items():
+            try:
+                evaluate.update(self.by_pair.get((k, v), ()))
+            except TypeError:
+                pass
+        for name in safe:
+            evaluate.update(self.by_name.get(name, ()))
+        return evaluate
+
+    def substring_matches(self, haystack: str) -> set:
+        """Ritual positions whose trigger text occurs in the lowercased context."""
+        found = set()
+        for size, needles in self.by_needle.items():
+            for start in range(len(haystack) - size + 1):
+                hits = needles.get(haystack[start:start + size])
+                if hits:
+                    found.update(hits)
+        return found
 
     def invoke_by_phrase(self, phrase: str, context: Dict[str, Any]):
         for r in self.rituals:
@@ -65,10 +238,18 @@ class Grimoire:
         return None
 
     def scan_triggers(self, context: Dict[str, Any]) -> list[str]:
+        if self._indexed != len(self.rituals):
+            self.build_index()
+        safe = safe_locals(context)
+        evaluate = self.candidates(context, safe)
+        haystack = str(context).lower() if self.by_needle else None
+        matched = [i for i in evaluate if self.rituals[i].matches(context, safe, haystack)]
+        if haystack is not None:
+            matched += self.substring_matches(haystack) - evaluate
         fired = []
-        for r in self.rituals:
-            if r.matches(context):
-                store_memory({"type":"trigger","ritual":r.id,"ts":time.time(),"context":context})
-                r.run_effects(context)
-                fired.append(r.id)
+        for i in sorted(matched):
+            r = self.rituals[i]
+            store_memory({"type":"trigger","ritual":r.id,"ts":time.time(),"context":context})
+            r.run_effects(context)
+            fired.append(r.id)
         return fired
@@ -0,0 +1,187 @@
+from __future__ import annotations
+import copy, json, queue, sqlite3, threading, time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Event kinds emitted by hooks.py
+MEMORY, GRAPH, COUNCIL = "memory", "graph", "council"
+POLICIES = ("block", "drop_newest", "drop_oldest")
+
+Event = Tuple[str, float, Any]  # (kind, timestamp, payload)
+
+def format_event(kind: str, payload: Any) -> str:
+    """The console line hooks.py has always printed for an event."""
+    if kind == MEMORY:
+        return "[CMP] store_memory: " + json.dumps(payload, ensure_ascii=False)
+    if kind == GRAPH:
+        return "[LKG] update_graph: " + json.dumps(payload, ensure_ascii=False)
+    return f"[COUNCIL] {payload}"
+
+def snapshot_payload(kind: str, payload: Any) -> Any:
+    """
+    Copy of payload as it is at emit time (callers pass live dicts such as a
+    ritual context). Memory and graph payloads go through JSON, so ones the
+    console format cannot encode fail in the caller, as synchronous printing did.
+    """
+    if kind in (MEMORY, GRAPH):
+        return json.loads(json.dumps(payload, ensure_ascii=False))
+    return copy.deepcopy(payload)
+
+class Sink:
+    """Destination for batches of hook events; write_batch runs on the dispatcher thread."""
+    def write_batch(self, events: List[Event]):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+class PrintSink(Sink):
+    def write_batch(self, events: List[Event]):
+        print("\n".join(format_event(kind, payload) for kind, _, payload in events), flush=True)
+
+class JsonlSink(Sink):
+    """Append events as JSON lines: {"kind": ..., "ts": ..., "payload": ...}"""
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.file = open(self.path, "a", encoding="utf-8")
+
+    def write_batch(self, events: List[Event]):
+        self.file.write("".join(
+            json.dumps({"kind": kind, "ts": ts, "payload": payload}, ensure_ascii=False, default=str) + "\n"
+            for kind, ts, payload in events))
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+class SQLiteSink(Sink):
+    """Store events in an `events` table, one transaction per batch."""
+    def __init__(self, path: str | Path):
+        self.conn = sqlite3.connect(str(path), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS events "
+                          "(id INTEGER PRIMARY KEY, kind TEXT NOT NULL, ts REAL NOT NULL, payload TEXT NOT NULL)")
+        self.conn.commit()
+
+    def write_batch(self, events: List[Event]):
+        with self.conn:
+            self.conn.executemany("INSERT INTO events (kind, ts, payload) VALUES (?, ?, ?)",
+                                  [(kind, ts, json.dumps(payload, ensure_ascii=False, default=str))
+                                   for kind, ts, payload in events])
+
+    def close(self):
+        self.conn.close()
+
+class EventDispatcher:
+    """
+    Background writer for hook events. emit() only enqueues; a daemon thread
+    drains the queue in batches of up to batch_size events (or whatever
+    arrived within flush_interval seconds) and hands each batch to every sink.
+
+    When the queue holds max_queue events the policy decides:
+    "block" retains every event and makes emit() wait (backpressure),
+    "drop_newest" discards the incoming event, "drop_oldest" evicts the
+    oldest queued one (never close()'s shutdown sentinel).
+
+    Payloads are snapshotted in emit(), so later mutations by the caller do
+    not change what is written.
+    """
+    def __init__(self, sinks: List[Sink], batch_size: int = 100, flush_interval: float = 0.5,
+                 max_queue: int = 10000, policy: str = "block"):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown queue policy: {policy} (expected one of {POLICIES})")
+        self.sinks = sinks
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.policy = policy
+        self.queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self.stats: Dict[str, int] = {"emitted": 0, "written": 0, "dropped": 0, "batches": 0, "sink_errors": 0}
+        self.stats_lock = threading.Lock()  # stats change on both the emitting and the writer thread
+        self.closed = False
+        self.thread = threading.Thread(target=self._run, name="grimoire-hook-sink", daemon=True)
+        self.thread.start()
+
+    def emit(self, kind: str, payload: Any):
+        if self.closed:
+            raise RuntimeError("EventDispatcher is closed")
+        event = (kind, time.time(), snapshot_payload(kind, payload))
+        self._count("emitted")
+        if self.policy == "block":
+            self.queue.put(event)
+            return
+        while True:
+            try:
+                self.queue.put_nowait(event)
+                return
+            except queue.Full:
+                if self.policy == "drop_newest":
+                    self._count("dropped")
+                    return
+            try:
+                evicted = self.queue.get_nowait()
+            except queue.Empty:
+                continue
+            self.queue.task_done()
+            self._count("dropped")
+            if evicted is None:
+                # Raced close(): put its sentinel back and drop this event instead
+                self.queue.put(None)
+                return
+
+    def _count(self, key: str, n: int = 1):
+        with self.stats_lock:
+            self.stats[key] += n
+
+    def _run(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                self.queue.task_done()
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.flush_interval
+            stop = False
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self.queue.get(timeout=remaining) if remaining > 0 else self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            self._write(batch)
+            for _ in range(len(batch) + stop):
+                self.queue.task_done()
+            if stop:
+                return
+
+    def _write(self, batch: List[Event]):
+        for sink in self.sinks:
+            try:
+                sink.write_batch(batch)
+            except Exception:
+                self._count("sink_errors")
+        with self.stats_lock:
+            self.stats["written"] += len(batch)
+            self.stats["batches"] += 1
+
+    def flush(self):
+        """Block until every event emitted so far has been written."""
+        self.queue.join()
+
+    def close(self):
+        """Write what is queued, stop the thread and close the sinks."""
+        if self.closed:
+            return
+        self.closed = True
+        self.queue.put(None)
+        self.thread.join()
+        for sink in self.sinks:
+            sink.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self.stats_lock:
+            stats = dict(self.stats)
+        return dict(stats, queued=self.queue.qsize(), policy=self.policy)
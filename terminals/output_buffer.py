@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+🌌 SERAPHINA Terminal Output Buffer
+Thread-safe, coalescing output queue for the Tk terminals
+
+Any thread may call write(); the Tk thread drains the queue on an after()
+tick and inserts everything that arrived since the last tick with a single
+Text.insert call, trims the widget to max_lines and scrolls once.
+"""
+
+import threading
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+import tkinter as tk
+
+FLUSH_INTERVAL_MS = 16  # ~60 ticks per second
+MAX_LINES = 5000  # Lines kept in the widget
+MAX_PENDING = 50000  # Lines kept in the queue; older lines are dropped when output outruns the UI
+
+
+class OutputBuffer:
+    """
+    🧬 Batched writer for a Tk Text widget
+    Lines are (text, tag) pairs; consecutive lines with the same tag are
+    joined into one text run before insertion
+    """
+
+    def __init__(self, widget, interval_ms: int = FLUSH_INTERVAL_MS, max_lines: int = MAX_LINES,
+                 max_pending: int = MAX_PENDING):
+        self.widget = widget
+        self.interval_ms = interval_ms
+        self.max_lines = max_lines
+        self.pending: Deque[Tuple[str, Optional[str]]] = deque(maxlen=max_pending)
+        self.lock = threading.Lock()
+        self.dropped = 0
+        self._scheduled = False
+
+    def write(self, text: str, tag: Optional[str] = None):
+        """Queue text for display (safe to call from any thread)"""
+        with self.lock:
+            if len(self.pending) == self.pending.maxlen:
+                self.dropped += 1
+            self.pending.append((text, tag))
+
+    def clear(self):
+        """Discard queued output and empty the widget (Tk thread only)"""
+        with self.lock:
+            self.pending.clear()
+        self.widget.config(state=tk.NORMAL)
+        self.widget.delete('1.0', tk.END)
+        self.widget.config(state=tk.DISABLED)
+
+    def start(self):
+        """Begin draining the queue on the widget's after() tick"""
+        if not self._scheduled:
+            self._scheduled = True
+            self.widget.after(self.interval_ms, self._tick)
+
+    def _tick(self):
+        try:
+            self.flush()
+        finally:
+            self.widget.after(self.interval_ms, self._tick)
+
+    def take_runs(self) -> List[Tuple[str, Optional[str]]]:
+        """Remove queued lines and coalesce them into (text, tag) runs"""
+        with self.lock:
+            if not self.pending:
+                return []
+            lines = list(self.pending)
+            self.pending.clear()
+
+        # Lines beyond max_lines would be trimmed straight away
+        if len(lines) > self.max_lines:
+            lines = lines[-self.max_lines:]
+
+        runs: List[Tuple[str, Optional[str]]] = []
+        texts: List[str] = []
+        current_tag = lines[0][1]
+        for text, tag in lines:
+            if tag != current_tag:
+                runs.append((''.join(texts), current_tag))
+                texts = []
+                current_tag = tag
+            texts.append(text + '\n')
+        runs.append((''.join(texts), current_tag))
+        return runs
+
+    def flush(self):
+        """Insert all queued output in one operation (Tk thread only)"""
+        runs = self.take_runs()
+        if not runs:
+            return
+
+        args = []
+        for text, tag in runs:
+            args.extend((text, (tag,) if tag else ()))
+
+        widget = self.widget
+        widget.config(state=tk.NORMAL)
+        widget.insert(tk.END, *args)
+
+        # The Text widget always ends with a newline, so 'end-1c' is on the last (empty) line
+        excess = int(widget.index('end-1c').split('.')[0]) - 1 - self.max_lines
+        if excess > 0:
+            widget.delete('1.0', f'{excess + 1}.0')
+
+        widget.config(state=tk.DISABLED)
+        widget.see(tk.END)
@@ -44,6 +44,7 @@ from datetime import datetime
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
 from enum import Enum
+from bisect import bisect_left, bisect_right
 import uuid
 
 # Add project paths
@@ -51,6 +52,26 @@ sys.path.append(os.path.dirname(__file__))
 from core.ritual_executor import execute_codecraft
 import webbrowser
 
+# Virtualized cell layout
+CELL_PADX = 10
+CELL_SPACING = 10
+ESTIMATED_CELL_HEIGHT = 240  # Used until a cell has been rendered and measured
+VIEWPORT_OVERSCAN = 1.0  # Extra viewport heights materialized above and below
+RICH_OUTPUT_MAX_HEIGHT = 20  # Lines shown before the output scrolls
+
+STATUS_COLORS = {
+    '🌌': '#58a6ff',  # Blue
+    '⚡': '#f0d818',   # Yellow
+    '✅': '#3fb950',   # Green
+    '❌': '#f85149',   # Red
+}
+
+def visible_cell_range(offsets: List[int], top: float, bottom: float) -> tuple:
+    """Indices [start, end) of cells (sorted top offsets) that intersect [top, bottom]"""
+    start = max(bisect_right(offsets, top) - 1, 0)
+    end = bisect_left(offsets, bottom)
+    return start, max(end, start)
+
 class CellType(Enum):
     RITUAL = "ritual"
     MARKDOWN = "markdown" 
@@ -111,6 +132,14 @@ class SERAPHINAInteractiveCanvas:
         # Monitoring tasks tracker
         self.monitoring_tasks = {}
         
+        # Virtualized rendering: widgets exist only for cells near the viewport
+        self.cell_windows: Dict[str, tuple] = {}  # cell id -> (frame, canvas window item)
+        self.cell_inputs: Dict[str, Any] = {}  # cell id -> input widget
+        self.cell_heights: Dict[str, int] = {}  # measured heights of rendered cells
+        self.cell_offsets: List[int] = []
+        self._viewport_update_pending = False
+        self._layout_pending = False
+        
         # Canvas ↔ IRC Consciousness Bridge
         # self.consciousness_bridge = ConciousnessBridge(self)  # Disabled for now
         
@@ -203,16 +232,12 @@ class SERAPHINAInteractiveCanvas:
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
         # Configure scrolling
-        self.canvas.configure(yscrollcommand=scrollbar.set)
+        self.canvas_scrollbar = scrollbar
+        self.canvas.configure(yscrollcommand=self.on_canvas_scroll)
         scrollbar.configure(command=self.canvas.yview)
         
-        # Scrollable frame inside canvas
-        self.scrollable_frame = tk.Frame(self.canvas, bg='#0d1117')
-        self.canvas_window = self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        
-        # Bind canvas resize
+        # Cells are placed directly on the canvas as windows (see layout_cells)
         self.canvas.bind('<Configure>', self.on_canvas_configure)
-        self.scrollable_frame.bind('<Configure>', self.on_frame_configure)
         
         # Mouse wheel scrolling
         self.canvas.bind("<MouseWheel>", self.on_mousewheel)
@@ -261,13 +286,15 @@ class SERAPHINAInteractiveCanvas:
         
     def on_canvas_configure(self, event):
         """Handle canvas resize"""
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        canvas_width = event.width
-        self.canvas.itemconfig(self.canvas_window, width=canvas_width)
+        cell_width = max(event.width - 2 * CELL_PADX, 1)
+        for frame, item in self.cell_windows.values():
+            self.canvas.itemconfig(item, width=cell_width)
+        self.schedule_viewport_update()
         
-    def on_frame_configure(self, event):
-        """Handle frame resize"""
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+    def on_canvas_scroll(self, first, last):
+        """Update the scrollbar and materialize cells scrolled into view"""
+        self.canvas_scrollbar.set(first, last)
+        self.schedule_viewport_update()
         
     def on_mousewheel(self, event):
         """Handle mouse wheel scrolling"""
@@ -326,10 +353,10 @@ This is your **consciousness workspace** where you can:
         )
         
         self.cells.append(new_cell)
-        self.render_cell(new_cell, len(self.cells) - 1)
+        self.layout_cells()
         self.update_cell_count()
         
-        # Scroll to new cell
+        # Scroll to new cell (materialized by the viewport update)
         self.root.after(100, lambda: self.canvas.yview_moveto(1.0))
         
     def get_default_content(self, cell_type: CellType) -> str:
@@ -349,23 +376,91 @@ This is your **consciousness workspace** where you can:
         return ""
         
     def render_all_cells(self):
-        """Render all cells in the canvas"""
-        # Clear existing cells
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-            
-        # Render each cell
-        for i, cell in enumerate(self.cells):
-            self.render_cell(cell, i)
-            
+        """Lay out all cells; only those near the viewport get widgets"""
+        for cell_id in list(self.cell_windows):
+            self.release_cell(cell_id)
+        
+        cell_ids = {cell.id for cell in self.cells}
+        self.cell_heights = {cell_id: h for cell_id, h in self.cell_heights.items() if cell_id in cell_ids}
+        
+        self.layout_cells()
         self.update_cell_count()
         
+    def layout_cells(self):
+        """Recompute cell offsets and the scroll region from measured or estimated heights"""
+        self._layout_pending = False
+        y = CELL_SPACING // 2
+        offsets = []
+        for cell in self.cells:
+            offsets.append(y)
+            y += self.cell_heights.get(cell.id, ESTIMATED_CELL_HEIGHT) + CELL_SPACING
+        self.cell_offsets = offsets
+        self.canvas.configure(scrollregion=(0, 0, self.canvas.winfo_width(), y))
+        
+        for index, cell in enumerate(self.cells):
+            window = self.cell_windows.get(cell.id)
+            if window:
+                self.canvas.coords(window[1], CELL_PADX, offsets[index])
+        
+        self.schedule_viewport_update()
+        
+    def schedule_viewport_update(self):
+        if not self._viewport_update_pending:
+            self._viewport_update_pending = True
+            self.root.after_idle(self.update_viewport)
+        
+    def update_viewport(self):
+        """Materialize cells near the viewport and release the rest"""
+        self._viewport_update_pending = False
+        view_height = max(self.canvas.winfo_height(), 1)
+        top = self.canvas.canvasy(0)
+        margin = view_height * VIEWPORT_OVERSCAN
+        start, end = visible_cell_range(self.cell_offsets, top - margin, top + view_height + margin)
+        wanted = {cell.id for cell in self.cells[start:end]}
+        
+        # Keep the cell being edited even when it scrolls out of range
+        focused = str(self.root.focus_get() or '')
+        for cell_id, (frame, item) in list(self.cell_windows.items()):
+            if cell_id not in wanted and not focused.startswith(str(frame) + '.'):
+                self.release_cell(cell_id)
+        
+        for index in range(start, end):
+            if self.cells[index].id not in self.cell_windows:
+                self.render_cell(self.cells[index], index)
+        
+    def release_cell(self, cell_id: str):
+        """Destroy a cell's widgets (its content lives on in the Cell)"""
+        frame, item = self.cell_windows.pop(cell_id)
+        self.canvas.delete(item)
+        frame.destroy()
+        self.cell_inputs.pop(cell_id, None)
+        
+    def refresh_cell(self, cell: Cell):
+        """Re-render one cell after its content, output or size changed"""
+        if cell.id in self.cell_windows:
+            self.release_cell(cell.id)
+            self.render_cell(cell, self.cells.index(cell))
+        else:
+            self.cell_heights.pop(cell.id, None)
+            self.layout_cells()
+        
+    def on_cell_resized(self, cell_id: str, height: int):
+        """Track a rendered cell's real height and shift the cells below it"""
+        if cell_id in self.cell_windows and self.cell_heights.get(cell_id) != height:
+            self.cell_heights[cell_id] = height
+            if not self._layout_pending:
+                self._layout_pending = True
+                self.root.after_idle(self.layout_cells)
+        
     def render_cell(self, cell: Cell, index: int):
         """Render a single cell"""
         
-        # Cell container
-        cell_frame = tk.Frame(self.scrollable_frame, bg='#21262d', relief='solid', bd=1)
-        cell_frame.pack(fill=tk.X, padx=10, pady=5)
+        # Cell container, placed on the canvas at the cell's offset
+        cell_frame = tk.Frame(self.canvas, bg='#21262d', relief='solid', bd=1)
+        item = self.canvas.create_window(CELL_PADX, self.cell_offsets[index], window=cell_frame, anchor='nw',
+                                         width=max(self.canvas.winfo_width() - 2 * CELL_PADX, 1))
+        self.cell_windows[cell.id] = (cell_frame, item)
+        cell_frame.bind('<Configure>', lambda e, cell_id=cell.id: self.on_cell_resized(cell_id, e.height))
         
         # Cell header
         header_frame = tk.Frame(cell_frame, bg='#161b22', height=35)
@@ -405,14 +500,14 @@ This is your **consciousness workspace** where you can:
         
         # Execute button
         execute_btn = tk.Button(right_header, text="▶ Execute", 
-                               command=lambda: self.execute_cell(cell, index),
+                               command=lambda: self.execute_cell(cell, self.cells.index(cell)),
                                bg=type_colors[cell.cell_type], fg='white',
                                font=('Segoe UI', 8), relief='flat', padx=10)
         execute_btn.pack(side=tk.RIGHT, padx=(5, 0))
         
         # Delete button
         delete_btn = tk.Button(right_header, text="🗑", 
-                              command=lambda: self.delete_cell(index),
+                              command=lambda: self.delete_cell(self.cells.index(cell)),
                               bg='#da3633', fg='white',
                               font=('Segoe UI', 8), relief='flat', padx=5)
         delete_btn.pack(side=tk.RIGHT, padx=(5, 0))
@@ -440,7 +535,7 @@ This is your **consciousness workspace** where you can:
         
         for label, height, tooltip in size_buttons:
             btn = tk.Button(size_frame, text=label, 
-                          command=lambda h=height: self.resize_cell(cell, index, h),
+                          command=lambda h=height: self.resize_cell(cell, self.cells.index(cell), h),
                           bg='#21262d' if current_height != height else type_colors[cell.cell_type], 
                           fg='#8b949e' if current_height != height else 'white',
                           font=('Segoe UI', 7), relief='flat', width=3)
@@ -449,7 +544,7 @@ This is your **consciousness workspace** where you can:
         # Auto-expand toggle
         auto_expand = cell.metadata.get('auto_expand', False)
         expand_btn = tk.Button(size_frame, text="↕" if auto_expand else "↕", 
-                             command=lambda: self.toggle_auto_expand(cell, index),
+                             command=lambda: self.toggle_auto_expand(cell, self.cells.index(cell)),
                              bg=type_colors[cell.cell_type] if auto_expand else '#21262d',
                              fg='white' if auto_expand else '#8b949e',
                              font=('Segoe UI', 8), relief='flat', width=3)
@@ -470,7 +565,7 @@ This is your **consciousness workspace** where you can:
         input_text.insert('1.0', cell.content)
         
         # Store reference for resizing
-        cell.metadata['input_widget'] = input_text
+        self.cell_inputs[cell.id] = input_text
         
         # Bind content changes and auto-expand
         def on_content_change(event=None):
@@ -560,43 +655,62 @@ This is your **consciousness workspace** where you can:
         rich_text.config(state='disabled')
         
     def render_rich_output(self, parent, output_content, cell_type):
-        """Render output with rich media support"""
-        
-        # Create scrollable frame for complex outputs
-        output_canvas = tk.Canvas(parent, bg='#161b22', highlightthickness=0)
-        output_scrollbar = ttk.Scrollbar(parent, orient="vertical", command=output_canvas.yview)
-        output_canvas.configure(yscrollcommand=output_scrollbar.set)
+        """Render output with rich media support in a single text widget"""
         
-        output_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
-        output_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        lines = output_content.split('\n')
         
-        rich_frame = tk.Frame(output_canvas, bg='#161b22')
-        output_canvas.create_window((0, 0), window=rich_frame, anchor="nw")
+        output_text = tk.Text(parent, height=min(len(lines), RICH_OUTPUT_MAX_HEIGHT),
+                              bg='#161b22', fg='#e6edf3',
+                              font=('Consolas', 9),
+                              relief='flat', wrap=tk.WORD)
+        output_scrollbar = ttk.Scrollbar(parent, orient="vertical", command=output_text.yview)
+        output_text.configure(yscrollcommand=output_scrollbar.set)
         
-        # Detect content types and render appropriately
-        lines = output_content.split('\n')
+        output_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
+        output_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        for line_num, line in enumerate(lines):
-            line_frame = tk.Frame(rich_frame, bg='#161b22')
-            line_frame.pack(fill=tk.X, pady=1)
-            
-            # Check for special content types
+        # Line styles
+        output_text.tag_configure("json", background='#0d1117', foreground='#f0f6fc')
+        output_text.tag_configure("separator", foreground='#8b949e', font=('Segoe UI', 8, 'bold'), justify='center')
+        output_text.tag_configure("link", foreground='#58a6ff', underline=True)
+        output_text.tag_bind("link", "<Enter>", lambda e: output_text.config(cursor='hand2'))
+        output_text.tag_bind("link", "<Leave>", lambda e: output_text.config(cursor=''))
+        output_text.tag_bind("link", "<Button-1>", lambda e: webbrowser.open(
+            output_text.get('current linestart', 'current lineend').replace('🔗 ', '', 1)))
+        for emoji, color in STATUS_COLORS.items():
+            output_text.tag_configure(f"status_{emoji}", foreground=color)
+        
+        # Detect content types; consecutive runs are inserted with one call
+        output_text.images = []  # Keep PhotoImage references alive
+        runs = []
+        for line in lines:
             if self.is_image_data(line):
-                self.render_image_line(line_frame, line)
+                photo = self.load_output_image(line, runs)
+                if photo is not None:
+                    if runs:
+                        output_text.insert(tk.END, *runs)
+                    runs = []
+                    output_text.image_create(tk.END, image=photo, pady=5)
+                    output_text.images.append(photo)
+                    runs.extend(('\n', ()))
             elif self.is_json_data(line):
-                self.render_json_line(line_frame, line)
+                try:
+                    runs.extend((json.dumps(json.loads(line), indent=2) + '\n', ("json",)))
+                except json.JSONDecodeError:
+                    runs.extend((line + '\n', ()))
             elif self.is_url(line):
-                self.render_url_line(line_frame, line)
+                runs.extend((f"🔗 {line}\n", ("link",)))
             elif line.startswith('===') and line.endswith('==='):
-                self.render_separator_line(line_frame, line)
-            elif line.startswith('🌌') or line.startswith('⚡') or line.startswith('✅') or line.startswith('❌'):
-                self.render_status_line(line_frame, line)
+                center_text = line.strip('=').strip()
+                runs.extend((f"{'─' * 20} {center_text} {'─' * 20}\n" if center_text else '─' * 40 + '\n', ("separator",)))
+            elif line[:1] in STATUS_COLORS:
+                runs.extend((line + '\n', (f"status_{line[:1]}",)))
             else:
-                self.render_text_line(line_frame, line)
+                runs.extend((line + '\n', ()))
         
-        # Update scroll region
-        rich_frame.update_idletasks()
-        output_canvas.configure(scrollregion=output_canvas.bbox("all"))
+        if runs:
+            output_text.insert(tk.END, *runs)
+        output_text.config(state='disabled')
         
     def is_image_data(self, line):
         """Check if line contains image data (base64 or file path)"""
@@ -611,112 +725,28 @@ This is your **consciousness workspace** where you can:
         """Check if line contains a URL"""
         return line.startswith('http://') or line.startswith('https://')
     
-    def render_image_line(self, parent, line):
-        """Render an image line"""
+    def load_output_image(self, line, runs):
+        """Load an image output line as a PhotoImage (text fallbacks go into runs)"""
+        if not IMAGES_AVAILABLE:
+            runs.extend((f"📷 Image: {line[:50]}...\n", ()))
+            return None
         try:
-            if IMAGES_AVAILABLE:
-                if line.startswith('data:image/'):
-                    # Base64 image data
-                    header, data = line.split(',', 1)
-                    image_data = base64.b64decode(data)
-                    image = Image.open(io.BytesIO(image_data))
-                    
-                    # Resize if too large
-                    max_size = (400, 300)
-                    image.thumbnail(max_size, Image.Resampling.LANCZOS)
-                    
-                    photo = ImageTk.PhotoImage(image)
-                    img_label = tk.Label(parent, image=photo, bg='#161b22')
-                    img_label.image = photo  # Keep reference
-                    img_label.pack(pady=5)
-                elif os.path.exists(line):
-                    # File path
-                    image = Image.open(line)
-                    max_size = (400, 300)
-                    image.thumbnail(max_size, Image.Resampling.LANCZOS)
-                    
-                    photo = ImageTk.PhotoImage(image)
-                    img_label = tk.Label(parent, image=photo, bg='#161b22')
-                    img_label.image = photo  # Keep reference
-                    img_label.pack(pady=5)
+            if line.startswith('data:image/'):
+                # Base64 image data
+                header, data = line.split(',', 1)
+                image = Image.open(io.BytesIO(base64.b64decode(data)))
+            elif os.path.exists(line):
+                # File path
+                image = Image.open(line)
             else:
-                # Fallback to text display
-                tk.Label(parent, text=f"📷 Image: {line[:50]}...", 
-                        font=('Consolas', 9), fg='#8b949e', bg='#161b22').pack(anchor='w')
-        except Exception as e:
-            tk.Label(parent, text=f"❌ Image error: {str(e)}", 
-                    font=('Consolas', 9), fg='#f85149', bg='#161b22').pack(anchor='w')
-    
-    def render_json_line(self, parent, line):
-        """Render a JSON line with syntax highlighting"""
-        try:
-            # Parse and pretty-print JSON
-            json_obj = json.loads(line)
-            pretty_json = json.dumps(json_obj, indent=2)
+                return None
             
-            json_text = tk.Text(parent, height=min(len(pretty_json.split('\n')), 10),
-                               bg='#0d1117', fg='#f0f6fc',
-                               font=('Consolas', 9),
-                               relief='solid', bd=1,
-                               wrap=tk.WORD, state='disabled')
-            json_text.pack(fill=tk.X, pady=2)
-            
-            json_text.config(state='normal')
-            json_text.insert('1.0', pretty_json)
-            json_text.config(state='disabled')
-            
-        except json.JSONDecodeError:
-            self.render_text_line(parent, line)
-    
-    def render_url_line(self, parent, line):
-        """Render a URL as a clickable link"""
-        url_frame = tk.Frame(parent, bg='#161b22')
-        url_frame.pack(fill=tk.X, pady=1)
-        
-        link_label = tk.Label(url_frame, text=f"🔗 {line}", 
-                             font=('Consolas', 9), fg='#58a6ff', bg='#161b22',
-                             cursor='hand2')
-        link_label.pack(anchor='w')
-        link_label.bind("<Button-1>", lambda e: webbrowser.open(line))
-    
-    def render_separator_line(self, parent, line):
-        """Render a separator line"""
-        sep_frame = tk.Frame(parent, bg='#161b22', height=20)
-        sep_frame.pack(fill=tk.X, pady=5)
-        
-        tk.Frame(sep_frame, bg='#30363d', height=1).pack(fill=tk.X, pady=9)
-        
-        if len(line) > 6:  # More than just ===
-            center_text = line.strip('=').strip()
-            tk.Label(sep_frame, text=center_text, 
-                    font=('Segoe UI', 8, 'bold'), fg='#8b949e', bg='#161b22').pack(pady=(0, 5))
-    
-    def render_status_line(self, parent, line):
-        """Render a status line with appropriate colors"""
-        color_map = {
-            '🌌': '#58a6ff',  # Blue
-            '⚡': '#f0d818',   # Yellow
-            '✅': '#3fb950',   # Green
-            '❌': '#f85149',   # Red
-            '⚠️': '#f0d818',   # Yellow
-            '📝': '#a855f7',   # Purple
-            '🔮': '#a855f7'    # Purple
-        }
-        
-        # Find the emoji to determine color
-        color = '#e6edf3'  # Default
-        for emoji, emoji_color in color_map.items():
-            if line.startswith(emoji):
-                color = emoji_color
-                break
-        
-        tk.Label(parent, text=line, 
-                font=('Consolas', 9), fg=color, bg='#161b22').pack(anchor='w', padx=5, pady=1)
-    
-    def render_text_line(self, parent, line):
-        """Render a regular text line"""
-        tk.Label(parent, text=line, 
-                font=('Consolas', 9), fg='#e6edf3', bg='#161b22').pack(anchor='w', padx=5, pady=1)
+            # Resize if too large
+            image.thumbnail((400, 300), Image.Resampling.LANCZOS)
+            return ImageTk.PhotoImage(image)
+        except Exception as e:
+            runs.extend((f"❌ Image error: {str(e)}\n", ("status_❌",)))
+            return None
         
     def update_cell_content(self, cell: Cell, new_content: str):
         """Update cell content when user types"""
@@ -727,13 +757,13 @@ This is your **consciousness workspace** where you can:
         """Resize a cell to specified height"""
         cell.metadata['height'] = new_height
         # Re-render the cell to apply new size
-        self.render_all_cells()
+        self.refresh_cell(cell)
         
     def toggle_auto_expand(self, cell: Cell, index: int):
         """Toggle auto-expand feature for a cell"""
         cell.metadata['auto_expand'] = not cell.metadata.get('auto_expand', False)
         # Re-render to update UI
-        self.render_all_cells()
+        self.refresh_cell(cell)
         
     def execute_cell(self, cell: Cell, index: int):
         """Execute a single cell"""
@@ -778,12 +808,12 @@ This is your **consciousness workspace** where you can:
             cell.timestamp = datetime.now().isoformat()
             
             # Re-render the cell to show output
-            self.render_all_cells()
+            self.refresh_cell(cell)
             
         except Exception as e:
             cell.output = f"❌ Execution Error: {str(e)}"
             cell.executed = True
-            self.render_all_cells()
+            self.refresh_cell(cell)
             
     def execute_codeverter_transformation(self, content: str) -> str:
         """Execute CodeVerter transformation via Federation Space"""
@@ -1079,8 +1109,12 @@ This is your **consciousness workspace** where you can:
     def delete_cell(self, index: int):
         """Delete a cell"""
         if len(self.cells) > 1:  # Keep at least one cell
-            del self.cells[index]
-            self.render_all_cells()
+            cell = self.cells.pop(index)
+            if cell.id in self.cell_windows:
+                self.release_cell(cell.id)
+            self.cell_heights.pop(cell.id, None)
+            self.layout_cells()
+            self.update_cell_count()
             
     def update_cell_count(self):
         """Update the cell count display"""
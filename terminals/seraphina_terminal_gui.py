@@ -12,6 +12,7 @@ import asyncio
 import threading
 from datetime import datetime
 from core.universal_executor import execute_ritual
+from terminals.output_buffer import OutputBuffer
 import platform
 
 class SERAPHINATerminalGUI:
@@ -26,6 +27,9 @@ class SERAPHINATerminalGUI:
         self.history_index = -1
         
         self.setup_ui()
+        # Output from any thread is queued and drawn in batches on the Tk thread
+        self.output_buffer = OutputBuffer(self.output_area)
+        self.output_buffer.start()
         self.print_welcome()
     
     def setup_ui(self):
@@ -92,11 +96,8 @@ class SERAPHINATerminalGUI:
         execute_btn.pack(side=tk.RIGHT)
     
     def print_to_terminal(self, text, color='#00ff88'):
-        """Print text to the terminal output"""
-        self.output_area.config(state=tk.NORMAL)
-        self.output_area.insert(tk.END, text + '\n')
-        self.output_area.config(state=tk.DISABLED)
-        self.output_area.see(tk.END)
+        """Queue text for the terminal output (thread-safe)"""
+        self.output_buffer.write(text)
     
     def print_welcome(self):
         """Display welcome message"""
@@ -226,9 +227,7 @@ Ready for commands! Type 'help' for more information.
     
     def clear_terminal(self):
         """Clear the terminal output"""
-        self.output_area.config(state=tk.NORMAL)
-        self.output_area.delete(1.0, tk.END)
-        self.output_area.config(state=tk.DISABLED)
+        self.output_buffer.clear()
         self.print_welcome()
     
     def history_up(self, event):
@@ -14,6 +14,7 @@ import threading
 from datetime import datetime
 from core.universal_executor import execute_ritual
 from agent_manager import AgentManager
+from terminals.output_buffer import OutputBuffer
 import platform
 import re
 
@@ -44,6 +45,9 @@ class SERAPHINAMultiAgentTerminal:
         self.in_agent_mode = False
         
         self.setup_ui()
+        # Output from any thread is queued and drawn in batches on the Tk thread
+        self.output_buffer = OutputBuffer(self.output_area)
+        self.output_buffer.start()
         self.print_welcome()
     
     def setup_ui(self):
@@ -132,9 +136,7 @@ class SERAPHINAMultiAgentTerminal:
         self.output_area.tag_configure('agent', foreground='#ff8800')
     
     def print_to_terminal(self, text, color='#00ff88'):
-        """Print text to the terminal output with color support"""
-        self.output_area.config(state=tk.NORMAL)
-        
+        """Queue text for the terminal output with color support (thread-safe)"""
         # Map colors to tags
         tag_map = {
             '#00ff88': 'success',
@@ -145,14 +147,7 @@ class SERAPHINAMultiAgentTerminal:
             '#ffffff': None
         }
         
-        tag = tag_map.get(color)
-        if tag:
-            self.output_area.insert(tk.END, text + '\n', tag)
-        else:
-            self.output_area.insert(tk.END, text + '\n')
-        
-        self.output_area.config(state=tk.DISABLED)
-        self.output_area.see(tk.END)
+        self.output_buffer.write(text, tag_map.get(color))
     
     def agent_output_callback(self, text: str, color: str):
         """Callback for agent output"""
@@ -387,9 +382,7 @@ Available Agents: {', '.join(self.agent_manager.list_available_agents())}"""
     
     def clear_terminal(self):
         """Clear the terminal output"""
-        self.output_area.config(state=tk.NORMAL)
-        self.output_area.delete(1.0, tk.END)
-        self.output_area.config(state=tk.DISABLED)
+        self.output_buffer.clear()
         self.print_welcome()
     
     def handle_exit(self):
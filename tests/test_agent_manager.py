@@ -0,0 +1,96 @@
+# tests/test_agent_manager.py
+from __future__ import annotations
+import asyncio
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from infrastructure.agent_manager import NEEDS_PIDFD_WATCHER, AgentManager, AgentSupervisor
+
+ECHO_AGENT = [sys.executable, "-u", "-c",
+              "import sys\nprint('ready')\nfor line in sys.stdin: print('echo: ' + line, end='')"]
+
+
+@pytest.mark.skipif(not (NEEDS_PIDFD_WATCHER or (sys.version_info >= (3, 12) and hasattr(os, "pidfd_open"))),
+                    reason="asyncio needs a waitpid thread per child without pidfd support")
+def test_supervisor_runs_many_agents_without_threads():
+    lines = []
+
+    async def run():
+        supervisor = AgentSupervisor(lambda name, stream, line: lines.append((name, line)), history_limit=50)
+        threads_before = threading.active_count()
+        started = await asyncio.gather(*(
+            supervisor.start_agent(f"agent{i}", {"command": ECHO_AGENT, "ready_pattern": "^ready$"})
+            for i in range(20)
+        ))
+        assert all(started)
+        # No reader or child-watcher threads per agent
+        assert threading.active_count() - threads_before <= 1
+
+        for i in range(20):
+            await supervisor.send(f"agent{i}", f"hello {i}")
+        for _ in range(200):
+            if sum(line.startswith("echo:") for _, line in lines) == 20:
+                break
+            await asyncio.sleep(0.01)
+
+        await supervisor.terminate_all()
+        return supervisor
+
+    supervisor = asyncio.run(run())
+    assert ("agent7", "echo: hello 7") in lines
+    assert supervisor.processes == {}
+    assert len(supervisor.conversation_history) == 50
+
+
+def test_manager_summons_without_fixed_delay_and_reports_exit():
+    output = []
+    manager = AgentManager(lambda text, color: output.append(text))
+    manager.agent_configs["echo"] = {"command": ECHO_AGENT, "display_name": "Echo",
+                                     "prompt_symbol": "(echo)", "color": "#ffffff"}
+    manager.agent_configs["dead"] = {"command": [sys.executable, "-c", "raise SystemExit(1)"],
+                                     "display_name": "Dead", "prompt_symbol": "(dead)", "color": "#ffffff"}
+    try:
+        start = time.perf_counter()
+        assert manager.summon_agent("echo")
+        assert manager.send_to_agent("ping")
+        for _ in range(200):
+            if "echo: ping" in output:
+                break
+            time.sleep(0.01)
+        assert "echo: ping" in output
+        assert time.perf_counter() - start < 2.0
+
+        assert not manager.summon_agent("dead")
+        assert "dead" not in manager.get_status()["running_agents"]
+    finally:
+        manager.terminate_all()
+    assert manager.get_status()["running_agents"] == []
+
+
+def test_lines_longer_than_the_stream_limit_are_delivered_whole():
+    from infrastructure.agent_manager import STREAM_LIMIT
+
+    lengths = [100_000, STREAM_LIMIT * 2 + 5]
+    agent = [sys.executable, "-u", "-c",
+             f"for n in {lengths!r}: print('x' * n)\nprint('after')\nimport sys; sys.stdin.read()"]
+    lines = []
+
+    async def run():
+        supervisor = AgentSupervisor(lambda name, stream, line: lines.append((stream, line)))
+        ok = await supervisor.start_agent("long", {"command": agent, "ready_pattern": "^after$",
+                                                   "ready_timeout": 10})
+        await supervisor.terminate_all()
+        return ok
+
+    assert asyncio.run(run())
+    assert [len(line) for stream, line in lines if stream == "stdout"][:3] == lengths + [5]
+    assert not any(stream == "error" for stream, _ in lines)
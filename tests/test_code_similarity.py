@@ -0,0 +1,104 @@
+# tests/test_code_similarity.py
+from __future__ import annotations
+import difflib
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from infrastructure.code_similarity import (
+    AutoSimilarity, MinHashSimilarity, SimilarityBackend, create_similarity_backend,
+)
+from infrastructure.consensus_engine import ConsensusEngine
+
+BASE = '''def load_config(path):
+    with open(path) as handle:
+        data = json.load(handle)
+    return validate(data)
+
+
+def validate(data):
+    if "name" not in data:
+        raise ValueError("missing name")
+    for key, value in data.items():
+        if value is None:
+            data[key] = DEFAULTS.get(key)
+    return data
+
+
+class ConfigStore:
+    def __init__(self, root):
+        self.root = root
+        self.cache = {}
+
+    def get(self, name):
+        if name not in self.cache:
+            self.cache[name] = load_config(self.root / name)
+        return self.cache[name]
+'''
+
+UNRELATED = '''import asyncio
+
+async def pump(queue, sink):
+    while True:
+        item = await queue.get()
+        try:
+            await sink.write(item)
+        finally:
+            queue.task_done()
+'''
+
+# Fixture corpus: (variant, description) pairs derived from BASE.
+# Unrelated code is checked separately: SequenceMatcher still scores ~0.3 on
+# shared characters there, while shingles correctly report almost nothing.
+CORPUS = [
+    (BASE, "identical"),
+    (BASE.replace("handle", "fh"), "renamed local"),
+    (BASE.replace('        raise ValueError("missing name")\n', '        return {}\n'), "changed branch"),
+    (BASE + '\n\ndef reset(store):\n    store.cache.clear()\n', "appended function"),
+    (BASE.replace("self.cache", "self._cache"), "renamed attribute"),
+]
+
+
+@pytest.mark.parametrize("variant,description", CORPUS)
+def test_minhash_tracks_sequence_matcher(variant, description):
+    exact = difflib.SequenceMatcher(None, BASE, variant).ratio()
+    approx = MinHashSimilarity(num_hashes=256).similarity(BASE, variant)
+    assert abs(exact - approx) <= 0.1, description
+
+
+def test_minhash_preserves_ranking():
+    backend = MinHashSimilarity(num_hashes=256)
+    related = backend.similarity(BASE, BASE.replace("handle", "fh"))
+    unrelated = backend.similarity(BASE, UNRELATED)
+    assert related > 0.7
+    assert unrelated < 0.2
+    assert unrelated < difflib.SequenceMatcher(None, BASE, UNRELATED).ratio()
+
+
+def test_signature_size_is_bounded_by_precision():
+    backend = MinHashSimilarity(num_hashes=16)
+    assert len(backend.signature(BASE * 10)) == 16
+    assert backend.similarity("", "") == 1.0
+    assert backend.similarity(BASE, "") == 0.0
+
+
+def test_backend_selection():
+    assert create_similarity_backend("minhash").backend == SimilarityBackend.MINHASH
+    auto = create_similarity_backend(SimilarityBackend.AUTO, size_threshold=10)
+    assert isinstance(auto, AutoSimilarity)
+    with pytest.raises(ValueError):
+        create_similarity_backend("levenshtein")
+
+
+def test_consensus_engine_uses_selected_backend():
+    engine = ConsensusEngine(similarity_backend="minhash", similarity_precision=64)
+    score = engine.code_analyzer.lexical_similarity(BASE, BASE.replace("handle", "fh"))
+    assert 0.7 < score < 1.0
+    engine.code_analyzer.lexical_similarity(BASE, UNRELATED)
+    # BASE sketch is reused from the cache on the second comparison
+    assert engine.code_analyzer.feature_cache.get_stats()["hits"] == 1
@@ -0,0 +1,95 @@
+# tests/test_comment_parser.py
+from __future__ import annotations
+import random
+import re
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.comment_parser import CommentParser, ConsciousnessLevel, ParserAttention
+
+SAMPLE = """
+💬 surface mechanics
+🛡️ NEVER remove this safety check
+🛡 guard written without the variation selector
+    //!? MUST NOT claim agency
+//! requires quorum
+#//-> chose sqlite
+x = compute()  // trailing comments are not sacred
+//*emergent without a space
+//~
+# naked python comment
+// practical note\r
+"""
+
+
+def test_parse_text_levels_and_line_numbers():
+    comments = CommentParser().parse_text(SAMPLE)
+    assert [(c.line_number, c.consciousness_level) for c in comments] == [
+        (2, ConsciousnessLevel.SURFACE),
+        (3, ConsciousnessLevel.ETHICS),
+        (4, ConsciousnessLevel.ETHICS),
+        (5, ConsciousnessLevel.ETHICS),
+        (6, ConsciousnessLevel.RITUAL),
+        (7, ConsciousnessLevel.STRATEGIC),
+        (9, ConsciousnessLevel.COSMIC),
+        (10, ConsciousnessLevel.SURFACE),  # '//~' without content is a '//' note reading '~'
+        (12, ConsciousnessLevel.SURFACE),
+    ]
+    guard = comments[1]
+    assert guard.emoji_prefix == '🛡️' and guard.text_prefix is None
+    assert guard.parser_attention == ParserAttention.HARD_BLOCK and guard.requires_review
+    assert comments[3].text_prefix == '//!?' and comments[3].content == 'MUST NOT claim agency'
+    assert comments[6].content == 'emergent without a space' and comments[6].track_evolution
+    assert comments[8].content == 'practical note'
+
+
+def test_whole_buffer_parse_matches_line_by_line():
+    rng = random.Random(42)
+    pieces = ['', '  ', '\t', '//', '///', '//!?', '//!', '#//<3', '#', '📜', '⚡️', 'code', ' text', '?']
+    lines = [''.join(rng.choice(pieces) for _ in range(rng.randint(0, 4))) for _ in range(3000)]
+    parser = CommentParser()
+    expected = [parser.parse_line(line, n) for n, line in enumerate(lines, start=1)]
+    expected = [c for c in expected if c]
+    assert parser.parse_text('\n'.join(lines)) == expected
+
+
+def test_queries_share_one_cached_parse():
+    parser = CommentParser()
+    result = parser.parse(SAMPLE)
+    assert parser.parse(SAMPLE) is result
+    assert [c.line_number for c in parser.find_ethics_gates(SAMPLE)] == [3, 4, 5]
+    assert [c.line_number for c in parser.find_evolution_markers(SAMPLE)] == [9]
+    assert parser.find_lore_exports(SAMPLE) == []
+    assert parser.parse(SAMPLE) is result
+
+    report = parser.validate_discipline(SAMPLE)
+    assert parser.parse(SAMPLE) is result
+    assert report["sacred_count"] == 9
+    assert [n["line_number"] for n in report["naked_comments"]] == [11]
+
+    assert parser.parse(SAMPLE + "/// more") is not result
+
+
+def reference_naked(text: str, parser: CommentParser):
+    """validate_discipline's naked-comment scan before the sacred line set"""
+    sacred = parser.parse_text(text)
+    naked_pattern = re.compile(r'^\s*(?:#|//)\s+\w+')
+    return [
+        (line_num, line.strip())
+        for line_num, line in enumerate(text.split('\n'), start=1)
+        if naked_pattern.match(line) and not any(c.line_number == line_num for c in sacred)
+    ]
+
+
+def test_validate_discipline_matches_reference():
+    rng = random.Random(43)
+    pieces = ['', ' ', '\t', '#', '//', '# ', '// ', '//! ', '#//* ', '🔮 ', 'word', '\r', '-']
+    text = '\n'.join(''.join(rng.choice(pieces) for _ in range(rng.randint(0, 4))) for _ in range(2000))
+    parser = CommentParser()
+    report = parser.validate_discipline(text)
+    assert [(n["line_number"], n["text"]) for n in report["naked_comments"]] == reference_naked(text, parser)
+    assert report["sacred_count"] == len(parser.parse_text(text))
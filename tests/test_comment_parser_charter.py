@@ -0,0 +1,79 @@
+# tests/test_comment_parser_charter.py
+from __future__ import annotations
+import random
+import re
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.comment_parser_charter import (
+    COMMENT_TYPES, HASH_COMMENT_TYPES, PREFIX_ORDER, CommentParser, CommentRecord,
+)
+
+# The regex alternations parse_line used before the prefix trie
+COMMENT_REGEX = re.compile(r'^\s*(' + '|'.join(map(re.escape, PREFIX_ORDER)) + r')\s?(.*)')
+HASH_REGEX = re.compile(r'^\s*(' + '|'.join(re.escape('#' + p) for p in PREFIX_ORDER) + r')\s?(.*)')
+
+
+def reference_parse(line: str):
+    match = COMMENT_REGEX.match(line) or HASH_REGEX.match(line)
+    if not match:
+        return None
+    prefix = match.group(1).strip()
+    return prefix, match.group(2).strip()
+
+
+def random_line(rng: random.Random) -> str:
+    pieces = list(COMMENT_TYPES) + list(HASH_COMMENT_TYPES) + ['/', '#', '!', '?', '<', '3', '-', '>', '*', '~', '+']
+    parts = [rng.choice(['', ' ', '\t', '   '])]
+    parts += [rng.choice(pieces) for _ in range(rng.randint(0, 3))]
+    parts.append(rng.choice(['', ' ', 'x = 1', ' note ', '\tvalue\n', '\nnext line', ' 🛡️ guard ']))
+    return ''.join(parts)
+
+
+def test_parse_line_matches_regex_semantics():
+    rng = random.Random(41)
+    parser = CommentParser()
+    for _ in range(20000):
+        line = random_line(rng)
+        expected = reference_parse(line)
+        parsed = parser.parse_line(line)
+        if expected is None:
+            assert parsed is None, line
+        else:
+            assert (parsed.prefix, parsed.content) == expected, line
+
+
+def test_longest_prefix_and_spec():
+    parser = CommentParser()
+    guardrail = parser.parse_line("    //!? MUST NOT claim agency")
+    assert guardrail.prefix == '//!?' and guardrail.name == 'GUARDRAIL' and guardrail.council_oversight
+    assert parser.parse_line("#//<3 keep this").name == 'HEART_IMPRINT'
+    assert parser.parse_line("///sacred").content == 'sacred'
+    assert parser.parse_line("// plain").name == 'PRACTICAL_NOTE'
+    assert parser.parse_line("# plain python comment") is None
+    assert parser.parse_line("x = 1  // trailing") is None
+    assert parser.get_stats() == {
+        "total_comments_parsed": 4, "law_comments_found": 3,
+        "lore_comments_found": 1, "guardrails_detected": 1,
+    }
+
+
+def test_parse_lines_records_and_stats():
+    lines = ["int x;", "//! prereq", "  #//-> chose sqlite", "", "//!? guard", "print()"]
+    bulk = CommentParser()
+    records = bulk.parse_lines(lines)
+    assert records == [
+        CommentRecord(2, '//!', 'prereq'),
+        CommentRecord(3, '#//->', 'chose sqlite'),
+        CommentRecord(5, '//!?', 'guard'),
+    ]
+    assert bulk.parse_lines(["/// truth"], start=10) == [CommentRecord(10, '///', 'truth')]
+
+    single = CommentParser()
+    for line in lines + ["/// truth"]:
+        single.parse_line(line)
+    assert bulk.get_stats() == single.get_stats()
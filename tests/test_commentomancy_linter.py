@@ -0,0 +1,179 @@
+# tests/test_commentomancy_linter.py
+from __future__ import annotations
+import os
+import random
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import yaml
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.commentomancy_linter import (
+    analyze_ritual, analyze_text, build_comment, canon_hash, find_invocations, fix_lines, fix_text,
+    lint_rituals, load_canon,
+)
+
+SCHOOL_NAMES = ["Thaumaturgy", "Apotheosis", "Mythogenesis"] + [f"School{i}" for i in range(4, 20)]
+OLD_MTIME_NS = 1_600_000_000 * 10**9  # well outside the racy window
+
+
+def write_schools(path: Path):
+    schools = {i + 1: {"name": name} for i, name in enumerate(SCHOOL_NAMES)}
+    mapping = {name.lower(): name for name in SCHOOL_NAMES}
+    path.write_text(yaml.safe_dump({"schools": schools, "token_to_school_mapping": mapping}), encoding="utf-8")
+
+
+def write_rituals(root: Path, count: int, mtime_ns: int = OLD_MTIME_NS):
+    root.mkdir(exist_ok=True)
+    for i in range(count):
+        guarded = "//!? approved by the Architect\n" if i % 2 else ""
+        path = root / f"r{i}.ccraft"
+        path.write_text(
+            f"{guarded}::thaumaturgy: ignite\n\n::apotheosis: ascend\n::school5: plain\n", encoding="utf-8")
+        if mtime_ns is not None:
+            os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_cached_results_match_fresh_analysis(tmp_path):
+    schools = tmp_path / "schools.canonical.yaml"
+    write_schools(schools)
+    write_rituals(tmp_path / "rituals", 6)
+    paths = sorted((tmp_path / "rituals").glob("*.ccraft"))
+    canon = load_canon(None, schools)
+    loads = []
+
+    def load():
+        loads.append(1)
+        return canon
+
+    key = canon_hash(None, schools)
+    cache = {}
+    first, analyzed = lint_rituals(paths, key, load, cache=cache, jobs=2)
+    assert analyzed == 6 and len(loads) == 1
+    assert first == {str(p): analyze_ritual(p, *canon) for p in paths}
+    assert [v["missing"] for v in first[str(paths[0])]] == [["guardrail"], ["prereq"]]
+
+    second, analyzed = lint_rituals(paths, key, load, cache=cache)
+    assert second == first and analyzed == 0 and len(loads) == 1
+
+    paths[0].write_text("//!? ok\n::thaumaturgy: ignite\n", encoding="utf-8")
+    third, analyzed = lint_rituals(paths, key, load, cache=cache, jobs=1)
+    assert analyzed == 1 and third[str(paths[0])] == []
+
+    _, analyzed = lint_rituals(paths, canon_hash(None, schools, strict=True), load, cache=cache, jobs=1)
+    assert analyzed == 6
+
+
+def test_changed_only_trusts_unchanged_mtimes(tmp_path):
+    schools = tmp_path / "schools.canonical.yaml"
+    write_schools(schools)
+    write_rituals(tmp_path / "rituals", 2)
+    paths = sorted((tmp_path / "rituals").glob("*.ccraft"))
+    canon = load_canon(None, schools)
+    key = canon_hash(None, schools)
+    cache = {}
+    lint_rituals(paths, key, lambda: canon, cache=cache, jobs=1)
+
+    # Same size and mtime: not re-read under --changed-only, re-hashed otherwise
+    stat = paths[0].stat()
+    paths[0].write_text("::thaumaturgy: ignite\n::apotheosis: ascend\n::school5: plain!\n", encoding="utf-8")
+    os.utime(paths[0], ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert paths[0].stat().st_size == stat.st_size
+    _, analyzed = lint_rituals(paths, key, lambda: canon, cache=cache, changed_only=True)
+    assert analyzed == 0
+    _, analyzed = lint_rituals(paths, key, lambda: canon, cache=cache)
+    assert analyzed == 1
+
+
+def test_recently_modified_rituals_are_not_cached(tmp_path):
+    schools = tmp_path / "schools.canonical.yaml"
+    write_schools(schools)
+    write_rituals(tmp_path / "rituals", 2, mtime_ns=None)
+    paths = sorted((tmp_path / "rituals").glob("*.ccraft"))
+    canon = load_canon(None, schools)
+    key = canon_hash(None, schools)
+    cache = {}
+    lint_rituals(paths, key, lambda: canon, cache=cache, jobs=1)
+    assert cache == {}
+
+    # A same-size edit in the same mtime tick is still seen under --changed-only
+    stat = paths[0].stat()
+    paths[0].write_text("::thaumaturgy: ignite\n::apotheosis: ascend\n::school5: plain!\n", encoding="utf-8")
+    os.utime(paths[0], ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    results, analyzed = lint_rituals(paths, key, lambda: canon, cache=cache, changed_only=True, jobs=1)
+    assert analyzed == 2
+    assert results[str(paths[0])] == analyze_ritual(paths[0], *canon)
+
+
+def test_cli_analyzes_directory_with_cache(tmp_path):
+    schools = tmp_path / "schools.canonical.yaml"
+    write_schools(schools)
+    write_rituals(tmp_path / "rituals", 3)
+    cmd = [sys.executable, str(ROOT / "scripts" / "commentomancy_linter.py"), "analyze", str(tmp_path / "rituals"),
+           "--schools", str(schools), "--cache", str(tmp_path / "cache.json"), "--jobs", "2"]
+    first = subprocess.run(cmd, text=True, capture_output=True)
+    assert first.returncode == 1, first.stderr
+    assert "3 analyzed, 0 from cache" in first.stdout
+    second = subprocess.run(cmd + ["--changed-only"], text=True, capture_output=True)
+    assert second.returncode == 1
+    assert "0 analyzed, 3 from cache" in second.stdout
+    assert second.stdout.split("\n", 1)[1] == first.stdout.split("\n", 1)[1]
+
+
+def reference_analyze(lines, by_token, rules, strict=False):
+    """analyze_ritual before the forward scan: walk back per invocation, one regex per kind"""
+    regexes = {
+        'guardrail': re.compile(r'^[ \t]*//!\?[ \t].*'),
+        'prereq': re.compile(r'^[ \t]*//![ \t].*'),
+        'heart': re.compile(r'^[ \t]*//<3[ \t].*'),
+    }
+    violations = []
+    for idx, token in find_invocations(lines, set(by_token)):
+        spec = rules.get(token, {})
+        required = list(spec.get('required', []))
+        if strict:
+            required += [a for a in spec.get('advisory', []) if a not in required]
+        prev, j = [], idx - 1
+        while j >= 0 and len(prev) < 3:
+            if lines[j].strip():
+                prev.append(lines[j])
+            j -= 1
+        missing = [k for k in required if k in regexes and not any(regexes[k].match(p) for p in prev)]
+        if missing:
+            violations.append({'line': idx + 1, 'token': token, 'school_id': by_token[token], 'missing': missing})
+    return violations
+
+
+def reference_fix(lines, violations):
+    lines = list(lines)
+    for v in sorted(violations, key=lambda x: x['line'], reverse=True):
+        idx0 = v['line'] - 1
+        for kind in v['missing']:
+            comment = build_comment(v['token'], v['school_id'], kind)
+            if idx0 - 1 >= 0 and comment.strip() == lines[idx0 - 1].strip():
+                continue
+            lines.insert(idx0, comment)
+    return lines
+
+
+def test_forward_scan_and_fix_match_reference(tmp_path):
+    schools = tmp_path / "schools.canonical.yaml"
+    write_schools(schools)
+    by_id, by_token, rules = load_canon(None, schools)
+    rules = dict(rules, school5={'required': ['prereq'], 'advisory': ['heart', 'mystery']})
+    rng = random.Random(46)
+    pieces = ["", "   ", "//!? ok", "//! ready", "//<3 care", "//!?x", "// note", "text",
+              "::thaumaturgy: go", "::apotheosis: up", "::mythogenesis: tale", "::school5: x", "::unknown: y",
+              "//! PREREQ: 'apotheosis' requires documented preconditions satisfied."]
+    for strict in (False, True):
+        lines = [rng.choice(pieces) for _ in range(3000)]
+        text = "\n".join(lines)
+        violations = analyze_text(text, by_id, by_token, rules, strict=strict)
+        assert violations == reference_analyze(lines, by_token, rules, strict=strict)
+        assert fix_lines(lines, violations) == reference_fix(lines, violations)
+        assert fix_text(text, violations) == "\n".join(reference_fix(lines, violations)) + "\n"
@@ -0,0 +1,56 @@
+# tests/test_consensus_engine.py
+from __future__ import annotations
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from infrastructure.consensus_engine import AdvancedCodeAnalyzer, ConsensusEngine, FeatureCache
+
+PY_A = "def add(a, b):\n    return a + b\n\nclass Calc:\n    pass\n"
+PY_B = "def add(x, y):\n    # sum\n    return x + y\n"
+
+
+def test_feature_cache_is_bounded_lru():
+    cache = FeatureCache(maxsize=2)
+    cache.get_or_compute("k", "a", "", lambda: 1)
+    cache.get_or_compute("k", "b", "", lambda: 2)
+    cache.get_or_compute("k", "a", "", lambda: 99)  # hit, refreshes "a"
+    cache.get_or_compute("k", "c", "", lambda: 3)   # evicts "b"
+    assert cache.get_or_compute("k", "a", "", lambda: 99) == 1
+    assert cache.get_or_compute("k", "b", "", lambda: 42) == 42
+    stats = cache.get_stats()
+    assert stats["size"] == 2
+    assert stats["hits"] == 2
+
+
+def test_features_are_parsed_once_per_code():
+    analyzer = AdvancedCodeAnalyzer()
+    first = analyzer.extract_code_features(PY_A, "python")
+    second = analyzer.extract_code_features(PY_A, "python")
+    assert first is second
+    assert first["functions"] == ["add"]
+    assert first["classes"] == ["Calc"]
+
+    analyzer.calculate_structural_similarity(PY_A, PY_B, "python")
+    analyzer.calculate_structural_similarity(PY_B, PY_A, "python")
+    assert analyzer.feature_cache.get_stats()["misses"] == 3  # features(A) + ast(A) + ast(B)
+
+
+def test_invalid_python_falls_back_to_string_similarity():
+    analyzer = AdvancedCodeAnalyzer()
+    broken = "def add(:\n"
+    assert analyzer.get_python_ast_elements(broken) is None
+    score = analyzer.calculate_structural_similarity(broken, PY_B, "python")
+    assert score == analyzer._fallback_similarity(broken, PY_B)
+
+
+def test_style_features_share_analyzer_cache():
+    engine = ConsensusEngine()
+    engine._calculate_style_similarity(PY_A, PY_B, "python")
+    engine._calculate_style_similarity(PY_A, PY_B, "python")
+    stats = engine.code_analyzer.feature_cache.get_stats()
+    assert stats["misses"] == 2
+    assert stats["hits"] == 2
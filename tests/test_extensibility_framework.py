@@ -0,0 +1,316 @@
+# tests/test_extensibility_framework.py
+from __future__ import annotations
+import asyncio
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from infrastructure.extensibility_framework import (
+    BaseIntegrationHook, ExtensionPoint, PluginConfiguration, PluginMetadata,
+    PluginRegistry, PluginType,
+)
+
+
+class SyntheticHook(BaseIntegrationHook):
+    """Integration hook with configurable name, dependencies and init delay"""
+
+    def __init__(self, name: str, dependencies: List[str] = None, init_delay: float = 0.0,
+                 extension_points: List[ExtensionPoint] = None, init_log: List[str] = None):
+        super().__init__()
+        self._metadata = PluginMetadata(
+            name=name, version="1.0.0", description="synthetic", author="tests",
+            plugin_type=PluginType.INTEGRATION_HOOK,
+            dependencies=dependencies or [],
+            extension_points=extension_points or [],
+        )
+        self.init_delay = init_delay
+        self.init_log = init_log if init_log is not None else []
+
+    @property
+    def metadata(self) -> PluginMetadata:
+        return self._metadata
+
+    async def _initialize_impl(self):
+        await asyncio.sleep(self.init_delay)
+        self.init_log.append(self._metadata.name)
+
+    async def handle_event(self, event_type: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        return {self._metadata.name: event_type}
+
+    def get_supported_events(self) -> List[str]:
+        return [ep.value for ep in ExtensionPoint]
+
+
+def test_initialization_runs_dependency_levels_concurrently():
+    log: List[str] = []
+    registry = PluginRegistry()
+    for name in ("a", "b", "c"):
+        registry.register_plugin(SyntheticHook(name, init_delay=0.05, init_log=log))
+    registry.register_plugin(SyntheticHook("d", ["a", "b"], init_delay=0.05, init_log=log))
+    registry.register_plugin(SyntheticHook("e", ["d"], init_log=log))
+    registry.register_plugin(SyntheticHook("off", init_log=log),
+                             PluginConfiguration(plugin_name="off", enabled=False))
+
+    results = asyncio.run(registry.initialize_plugins())
+
+    assert all(results.values())
+    assert "off" not in log
+    assert log.index("d") > max(log.index("a"), log.index("b"))
+    assert log.index("e") > log.index("d")
+
+    report = registry.get_startup_report()
+    assert report["dependency_levels"] == 3
+    assert set(registry.init_timings) == {"a", "b", "c", "d", "e"}
+    # Three independent 50 ms inits overlap, so wall time is well under the 200 ms sum
+    assert report["wall_time"] < report["sequential_time"] * 0.75
+
+
+PLUGIN_MODULE = '''
+from typing import Any, Dict, List
+from infrastructure.extensibility_framework import (
+    BaseIntegrationHook, ExtensionPoint, PluginMetadata, PluginType,
+)
+
+
+class {cls}(BaseIntegrationHook):
+    @property
+    def metadata(self) -> PluginMetadata:
+        return PluginMetadata(
+            name={name!r},
+            version="1.0.0",
+            description="lazy test plugin",
+            author="tests",
+            plugin_type=PluginType.INTEGRATION_HOOK,
+            extension_points=[ExtensionPoint.{ep}],
+        )
+
+    async def handle_event(self, event_type: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        return {{{name!r}: True}}
+
+    def get_supported_events(self) -> List[str]:
+        return []
+'''
+
+
+def _write_plugin(directory: Path, module: str, cls: str, name: str, ep: str) -> Path:
+    path = directory / f"{module}.py"
+    path.write_text(PLUGIN_MODULE.format(cls=cls, name=name, ep=ep), encoding="utf-8")
+    return path
+
+
+def test_plugins_are_imported_on_first_extension_point_request(tmp_path: Path):
+    from infrastructure.extensibility_framework import ExtensibilityManager
+
+    _write_plugin(tmp_path, "lazy_pre_hook", "PreHook", "pre_hook", "PRE_TRANSFORMATION")
+    _write_plugin(tmp_path, "lazy_post_hook", "PostHook", "post_hook", "POST_TRANSFORMATION")
+
+    manager = ExtensibilityManager(lazy_plugins=True)
+    asyncio.run(manager.initialize({"plugin_directories": [str(tmp_path)]}))
+
+    assert set(manager.plugin_registry.lazy_plugins) == {"pre_hook", "post_hook"}
+    assert "lazy_pre_hook" not in sys.modules and "lazy_post_hook" not in sys.modules
+
+    result = asyncio.run(manager.execute_hooks(ExtensionPoint.PRE_TRANSFORMATION, {}))
+
+    assert result == {"pre_hook": True}
+    assert "lazy_pre_hook" in sys.modules and "lazy_post_hook" not in sys.modules
+    assert manager.plugin_registry.get_plugin("pre_hook").is_initialized
+
+
+def test_manifest_only_rescans_changed_modules(tmp_path: Path):
+    from infrastructure.plugin_manifest import PluginManifest
+
+    _write_plugin(tmp_path, "manifest_one", "One", "one", "PRE_CONSENSUS")
+    two = _write_plugin(tmp_path, "manifest_two", "Two", "two", "POST_CONSENSUS")
+    (tmp_path / "dynamic_meta.py").write_text(
+        PLUGIN_MODULE.format(cls="Dyn", name="dyn", ep="PRE_CONSENSUS").replace("name='dyn'", "name='d' + 'yn'"),
+        encoding="utf-8",
+    )
+
+    manifest = PluginManifest()
+    modules = {m.module_name: m for m in manifest.scan_directory(tmp_path)}
+    assert manifest.parsed_modules == 3
+    assert modules["manifest_one"].entries[0].extension_points == ["PRE_CONSENSUS"]
+    assert not modules["dynamic_meta"].static
+
+    manifest = PluginManifest()
+    manifest.scan_directory(tmp_path)
+    assert (manifest.parsed_modules, manifest.cached_modules) == (0, 3)
+
+    two.write_text(two.read_text(encoding="utf-8").replace("'two'", "'two_v2'"), encoding="utf-8")
+    modules = {m.module_name: m for m in manifest.scan_directory(tmp_path)}
+    assert manifest.parsed_modules == 1
+    assert modules["manifest_two"].entries[0].plugin_name == "two_v2"
+
+
+class SlowPureHook(SyntheticHook):
+    """Side-effect-free hook that overwrites a shared key"""
+
+    def __init__(self, name: str, delay: float):
+        super().__init__(name, extension_points=[ExtensionPoint.POST_CONSENSUS])
+        self._metadata.side_effect_free = True
+        self.delay = delay
+
+    async def handle_event(self, event_type: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        await asyncio.sleep(self.delay)
+        return {"winner": self._metadata.name, self._metadata.name: True}
+
+
+def test_dispatch_list_is_cached_until_plugins_change():
+    registry = PluginRegistry()
+    registry.register_plugin(SyntheticHook("low", extension_points=[ExtensionPoint.PRE_CONSENSUS]),
+                             PluginConfiguration(plugin_name="low", priority=10))
+    registry.register_plugin(SyntheticHook("high", extension_points=[ExtensionPoint.PRE_CONSENSUS]),
+                             PluginConfiguration(plugin_name="high", priority=90))
+
+    first = registry.get_plugins_for_extension_point(ExtensionPoint.PRE_CONSENSUS)
+    assert [p.metadata.name for p in first] == ["high", "low"]
+    assert registry.get_plugins_for_extension_point(ExtensionPoint.PRE_CONSENSUS) is first
+
+    registry.set_plugin_priority("low", 99)
+    assert [p.metadata.name for p in registry.get_plugins_for_extension_point(ExtensionPoint.PRE_CONSENSUS)] == ["low", "high"]
+    registry.set_plugin_enabled("high", False)
+    assert [p.metadata.name for p in registry.get_plugins_for_extension_point(ExtensionPoint.PRE_CONSENSUS)] == ["low"]
+
+
+def test_concurrent_hooks_merge_like_sequential_execution():
+    from infrastructure.extensibility_framework import ExtensibilityManager
+
+    def build(concurrent: bool) -> ExtensibilityManager:
+        manager = ExtensibilityManager(concurrent_hooks=concurrent)
+        # Highest priority finishes last; sequential order still decides the merge
+        for name, priority, delay in (("first", 90, 0.05), ("second", 50, 0.03), ("third", 10, 0.01)):
+            manager.plugin_registry.register_plugin(
+                SlowPureHook(name, delay), PluginConfiguration(plugin_name=name, priority=priority)
+            )
+        return manager
+
+    sequential = asyncio.run(build(False).execute_hooks(ExtensionPoint.POST_CONSENSUS, {"x": 1}))
+
+    manager = build(True)
+    loop = asyncio.new_event_loop()
+    try:
+        start = loop.time()
+        concurrent = loop.run_until_complete(manager.execute_hooks(ExtensionPoint.POST_CONSENSUS, {"x": 1}))
+        elapsed = loop.time() - start
+    finally:
+        loop.close()
+
+    assert concurrent == sequential
+    assert concurrent["winner"] == "third"
+    assert elapsed < 0.08  # ~max(delays), not their 90 ms sum
+
+
+SHARED_BASE_MODULE = '''
+from infrastructure.extensibility_framework import BaseIntegrationHook
+
+
+class CommonHook(BaseIntegrationHook):
+    async def handle_event(self, event_type, data):
+        return {}
+
+    def get_supported_events(self):
+        return []
+'''
+
+SHARED_BASE_PLUGIN = '''
+from infrastructure.extensibility_framework import ExtensionPoint, PluginMetadata, PluginType
+from shared_base_hook import CommonHook
+
+
+class Real(CommonHook):
+    @property
+    def metadata(self) -> PluginMetadata:
+        return PluginMetadata(
+            name="real",
+            version="1.0.0",
+            description="plugin with a base class from a sibling module",
+            author="tests",
+            plugin_type=PluginType.INTEGRATION_HOOK,
+            extension_points=[ExtensionPoint.PRE_CONSENSUS],
+        )
+'''
+
+
+def test_plugins_with_bases_from_sibling_modules_are_imported_eagerly(tmp_path: Path):
+    from infrastructure.extensibility_framework import PluginLoader
+    from infrastructure.plugin_manifest import PluginManifest
+
+    (tmp_path / "shared_base_hook.py").write_text(SHARED_BASE_MODULE, encoding="utf-8")
+    (tmp_path / "shared_base_plugin.py").write_text(SHARED_BASE_PLUGIN, encoding="utf-8")
+
+    modules = {m.module_name: m for m in PluginManifest().scan_directory(tmp_path)}
+    assert not modules["shared_base_plugin"].static
+
+    registry = PluginRegistry()
+    results = asyncio.run(PluginLoader(registry, lazy=True).load_from_directory(str(tmp_path)))
+    assert results.get("shared_base_plugin.Real") is True
+    assert registry.get_plugin("real") is not None
+
+
+def test_async_getters_initialize_lazy_plugins_and_status_does_not_load_them(tmp_path: Path):
+    from infrastructure.extensibility_framework import ExtensibilityManager
+
+    _write_plugin(tmp_path, "getter_by_name", "ByName", "by_name", "ERROR_HANDLING")
+    _write_plugin(tmp_path, "getter_by_type", "ByType", "by_type", "RESULT_FORMATTING")
+    _write_plugin(tmp_path, "getter_by_ep", "ByEp", "by_ep", "METRICS_COLLECTION")
+
+    manager = ExtensibilityManager(lazy_plugins=True)
+    asyncio.run(manager.initialize({"plugin_directories": [str(tmp_path)]}))
+    registry = manager.plugin_registry
+
+    status = manager.get_plugin_status()
+    assert status["lazy_plugins"] == 3
+    assert status["plugins_by_type"]["integration_hook"] == 3
+    assert status["total_plugins"] == sum(status["plugins_by_type"].values())
+    assert set(registry.lazy_plugins) == {"by_name", "by_type", "by_ep"}
+    assert "getter_by_name" not in sys.modules
+
+    by_name = asyncio.run(registry.load_plugin("by_name"))
+    assert by_name.is_initialized
+
+    # The synchronous getters load without initializing; initialize_pending catches up
+    by_ep = registry.get_plugins_for_extension_point(ExtensionPoint.METRICS_COLLECTION)
+    assert [p.metadata.name for p in by_ep] == ["by_ep"] and not by_ep[0].is_initialized
+
+    hooks = asyncio.run(manager.load_plugins_by_type(PluginType.INTEGRATION_HOOK))
+    assert {"by_name", "by_type", "by_ep"} <= {p.metadata.name for p in hooks}
+    assert all(p.is_initialized for p in hooks if p.metadata.name.startswith("by_"))
+    assert registry.pending_initialization == []
+    assert manager.get_plugin_status()["total_plugins"] == status["total_plugins"]
+
+
+def test_directory_plugins_load_eagerly_by_default(tmp_path: Path):
+    from infrastructure.extensibility_framework import ExtensibilityManager
+
+    _write_plugin(tmp_path, "eager_default_hook", "EagerHook", "eager_hook", "ERROR_HANDLING")
+    manager = ExtensibilityManager()
+    asyncio.run(manager.initialize({"plugin_directories": [str(tmp_path)]}))
+
+    assert manager.plugin_registry.lazy_plugins == {}
+    assert manager.plugin_registry.get_plugin("eager_hook").is_initialized
+    assert all(p.is_initialized for p in manager.get_integration_hooks())
+
+def test_shared_manifest_cache_keeps_every_directory(tmp_path: Path):
+    from infrastructure.plugin_manifest import PluginManifest
+
+    first, second = tmp_path / "first", tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    _write_plugin(first, "shared_cache_one", "One", "one", "PRE_CONSENSUS")
+    _write_plugin(second, "shared_cache_two", "Two", "two", "POST_CONSENSUS")
+    cache = tmp_path / "manifest.json"
+
+    manifest = PluginManifest(cache)
+    manifest.scan_directory(first)
+    manifest.scan_directory(second)
+
+    manifest = PluginManifest(cache)
+    for directory in (first, second):
+        manifest.scan_directory(directory)
+        assert (manifest.parsed_modules, manifest.cached_modules) == (0, 1)
+    assert not cache.with_name(cache.name + ".tmp").exists()
@@ -0,0 +1,100 @@
+# tests/test_federation_batching.py
+from __future__ import annotations
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from infrastructure.federation_batching import FrameBatcher, decode_frame, encode_frame
+
+
+def test_frame_round_trip():
+    single = {"request_id": "a", "payload": {"x": 1}}
+    assert decode_frame(encode_frame([single])) == [single]
+    many = [{"request_id": str(i)} for i in range(3)]
+    assert decode_frame(encode_frame(many)) == many
+
+
+def test_requests_in_window_share_one_frame():
+    frames = []
+
+    async def send(frame):
+        frames.append(frame)
+
+    async def run():
+        batcher = FrameBatcher(send, window=0.01, max_batch_size=100)
+        await asyncio.gather(*(batcher.submit({"request_id": str(i)}) for i in range(25)))
+        return batcher.get_stats()
+
+    stats = asyncio.run(run())
+    assert len(frames) == 1
+    assert [m["request_id"] for m in decode_frame(frames[0])] == [str(i) for i in range(25)]
+    assert stats["avg_batch_size"] == 25
+
+
+def test_full_batch_is_sent_immediately():
+    frames = []
+
+    async def send(frame):
+        frames.append(decode_frame(frame))
+
+    async def run():
+        batcher = FrameBatcher(send, window=10.0, max_batch_size=4)
+        await asyncio.gather(*(batcher.submit({"request_id": str(i)}) for i in range(8)))
+
+    asyncio.run(asyncio.wait_for(run(), timeout=1.0))
+    assert [len(f) for f in frames] == [4, 4]
+
+
+def test_send_errors_reach_every_submitter():
+    async def send(frame):
+        raise ConnectionError("socket closed")
+
+    async def run():
+        batcher = FrameBatcher(send, window=0.001)
+        return await asyncio.gather(
+            batcher.submit({"request_id": "a"}), batcher.submit({"request_id": "b"}),
+            return_exceptions=True
+        )
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, ConnectionError) for r in results)
+
+
+def test_router_batches_over_websocket_stub():
+    websockets = pytest.importorskip("websockets")
+    pytest.importorskip("aiohttp")
+    from infrastructure.federation_integration import FederationRequest, FederationRouter
+
+    received_frames = []
+
+    async def stub_server(ws, *args):
+        async for frame in ws:
+            received_frames.append(frame)
+            replies = [{"request_id": m["request_id"], "success": True, "data": {"echo": m["payload"]}}
+                       for m in decode_frame(frame)]
+            await ws.send(encode_frame(replies))
+
+    async def run():
+        async with websockets.serve(stub_server, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            router = FederationRouter(f"ws://127.0.0.1:{port}", batch_window=0.005)
+            router.connection = await websockets.connect(f"ws://127.0.0.1:{port}")
+            router.connection_status = "connected"
+            router.batcher = FrameBatcher(router.connection.send, window=router.batch_window)
+            handler = asyncio.create_task(router._message_handler())
+            requests = [FederationRequest(payload={"n": i}, timeout=5) for i in range(50)]
+            responses = await asyncio.gather(*(router._send_request(r) for r in requests))
+            handler.cancel()
+            await router.disconnect()
+            return responses
+
+    responses = asyncio.run(run())
+    assert all(r.success for r in responses)
+    assert [r.data["echo"]["n"] for r in responses] == list(range(50))
+    assert len(received_frames) < 50
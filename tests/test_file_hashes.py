@@ -0,0 +1,77 @@
+# tests/test_file_hashes.py
+from __future__ import annotations
+import hashlib
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.file_hashes import FileHashCache
+
+OLD_MTIME_NS = 1_600_000_000 * 10**9
+
+
+def write(path: Path, data: bytes):
+    path.write_bytes(data)
+    os.utime(path, ns=(OLD_MTIME_NS, OLD_MTIME_NS))
+
+
+def test_hash_many_matches_hashlib_and_persists(tmp_path):
+    files = []
+    for i in range(20):
+        path = tmp_path / f"f{i}.md"
+        write(path, f"school {i}\n".encode() * (i * 5000 + 1))
+        files.append(path)
+
+    cache = FileHashCache(tmp_path / "cache.json")
+    digests = cache.hash_many(files, workers=4)
+    assert list(digests) == [str(p) for p in files]
+    assert all(digests[str(p)] == hashlib.sha256(p.read_bytes()).hexdigest() for p in files)
+    assert cache.hashed == 20
+    cache.save()
+
+    reloaded = FileHashCache(tmp_path / "cache.json")
+    assert reloaded.hash_many(files) == digests
+    assert reloaded.sha256(files[3]) == digests[str(files[3])]
+    assert reloaded.hashed == 0
+
+
+def test_changed_stat_rehashes(tmp_path):
+    path = tmp_path / "school.md"
+    write(path, b"before\n")
+    cache = FileHashCache(None)
+    before = cache.sha256(path)
+
+    write(path, b"after!\n")  # same size; the mtime moves by one tick
+    os.utime(path, ns=(OLD_MTIME_NS, OLD_MTIME_NS + 1))
+    assert cache.sha256(path) == hashlib.sha256(b"after!\n").hexdigest() != before
+    assert cache.hashed == 2
+
+
+def test_recently_modified_files_are_not_cached(tmp_path):
+    path = tmp_path / "fresh.md"
+    path.write_bytes(b"just written\n")
+    cache = FileHashCache(None)
+    assert cache.sha256(path) == hashlib.sha256(b"just written\n").hexdigest()
+    cache.sha256(path)
+    assert cache.hashed == 2
+    assert not cache.entries
+
+
+def test_save_prunes_unseen_stale_entries(tmp_path):
+    kept, changed, deleted = (tmp_path / f"{name}.md" for name in ("kept", "changed", "deleted"))
+    for path in (kept, changed, deleted):
+        write(path, path.name.encode())
+    cache = FileHashCache(tmp_path / "cache.json")
+    cache.hash_many([kept, changed, deleted])
+    cache.save()
+
+    # Another run that looks up nothing keeps only entries still matching their file
+    write(changed, b"rewritten")
+    deleted.unlink()
+    other = FileHashCache(tmp_path / "cache.json")
+    other.save()
+    assert list(FileHashCache(tmp_path / "cache.json").entries) == [str(kept.resolve())]
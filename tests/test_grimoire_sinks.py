@@ -0,0 +1,112 @@
+# tests/test_grimoire_sinks.py
+from __future__ import annotations
+import json
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from seraphina_grimoire import hooks
+from seraphina_grimoire.sinks import EventDispatcher, JsonlSink, PrintSink, SQLiteSink, Sink
+
+
+class GatedSink(Sink):
+    """Records batches; blocks writing until the gate opens"""
+
+    def __init__(self):
+        self.batches = []
+        self.gate = threading.Event()
+
+    def write_batch(self, events):
+        self.gate.wait(5)
+        self.batches.append([payload for _, _, payload in events])
+
+
+def test_print_sink_keeps_console_format(capsys):
+    hooks.store_memory({"type": "sync"})
+    hooks.configure([PrintSink()], flush_interval=0.01)
+    try:
+        hooks.store_memory({"type": "invoke", "ritual": "R1"})
+        hooks.update_graph({"add_nodes": []})
+        hooks.notify_council("hello")
+    finally:
+        hooks.shutdown()
+
+    assert capsys.readouterr().out.splitlines() == [
+        '[CMP] store_memory: {"type": "sync"}',
+        '[CMP] store_memory: {"type": "invoke", "ritual": "R1"}',
+        '[LKG] update_graph: {"add_nodes": []}',
+        "[COUNCIL] hello",
+    ]
+
+
+def test_jsonl_and_sqlite_sinks_receive_batches(tmp_path):
+    dispatcher = EventDispatcher([JsonlSink(tmp_path / "events.jsonl"), SQLiteSink(tmp_path / "events.db")],
+                                 batch_size=50, flush_interval=0.05)
+    for i in range(120):
+        dispatcher.emit("memory", {"n": i})
+    dispatcher.flush()
+    assert dispatcher.get_stats()["written"] == 120
+    assert dispatcher.get_stats()["batches"] < 120
+    dispatcher.close()
+
+    lines = (tmp_path / "events.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["payload"]["n"] for line in lines] == list(range(120))
+    with sqlite3.connect(tmp_path / "events.db") as conn:
+        assert conn.execute("SELECT COUNT(*) FROM events WHERE kind = 'memory'").fetchone()[0] == 120
+
+
+def test_drop_policies_bound_the_queue():
+    for policy, kept in (("drop_newest", [0, 1, 2, 3]), ("drop_oldest", [0, 7, 8, 9])):
+        sink = GatedSink()
+        dispatcher = EventDispatcher([sink], batch_size=1, flush_interval=0, max_queue=3, policy=policy)
+        dispatcher.emit("memory", 0)
+        while dispatcher.queue.qsize():  # wait for the writer to pick up event 0 and block on the gate
+            pass
+        for i in range(1, 10):
+            dispatcher.emit("memory", i)
+        sink.gate.set()
+        dispatcher.close()
+
+        assert [batch[0] for batch in sink.batches] == kept
+        assert dispatcher.get_stats()["dropped"] == 6
+
+
+def test_emit_snapshots_payloads():
+    sink = GatedSink()
+    dispatcher = EventDispatcher([sink], flush_interval=0)
+    context = {"step": 1, "tags": ["a"]}
+    dispatcher.emit("memory", {"type": "invoke", "context": context})
+    context["step"] = 2
+    context["tags"].append("b")
+    try:
+        dispatcher.emit("memory", {"bad": object()})
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("unserializable payload was accepted")
+    sink.gate.set()
+    dispatcher.close()
+
+    assert sink.batches == [[{"type": "invoke", "context": {"step": 1, "tags": ["a"]}}]]
+    assert dispatcher.get_stats()["emitted"] == 1
+
+
+def test_drop_oldest_never_evicts_the_shutdown_sentinel():
+    sink = GatedSink()
+    dispatcher = EventDispatcher([sink], batch_size=1, flush_interval=0, max_queue=1, policy="drop_oldest")
+    dispatcher.emit("memory", 0)
+    while dispatcher.queue.qsize():  # writer holds event 0 at the gate
+        pass
+    dispatcher.queue.put(None)  # what close() enqueues
+    dispatcher.emit("memory", 1)  # races close(): the queue is full with the sentinel
+    sink.gate.set()
+    dispatcher.thread.join(5)
+
+    assert not dispatcher.thread.is_alive()
+    assert sink.batches == [[0]]
+    assert dispatcher.get_stats()["dropped"] == 1
@@ -0,0 +1,101 @@
+# tests/test_lost_check.py
+from __future__ import annotations
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.law_lore_lint import lint_file
+from scripts.lost_check import check_document, run_checks
+from scripts.lost_document import LostDocument
+from scripts.lost_validate import validate_document
+
+GOOD = """# Doc {i}
+
+```yaml
+document_type: charter
+title: Doc {i}
+```
+"""
+
+
+def write_docs(root: Path, count: int) -> list[Path]:
+    paths = []
+    for i in range(count):
+        path = root / f"doc{i}.md"
+        path.write_text(GOOD.format(i=i) if i % 3 else f"# Bare {i}\n", encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def test_results_match_both_validators(tmp_path):
+    paths = write_docs(tmp_path, 6)
+    (tmp_path / "doc1.yaml").write_text("document_type: lore\n", encoding="utf-8")
+
+    results, checked = run_checks(paths, jobs=1)
+
+    assert checked == len(paths)
+    for path in paths:
+        assert results[str(path)] == {"lost": validate_document(path), "lint": lint_file(path)}
+    assert any(results[str(p)]["lost"] for p in paths)
+
+
+def test_cache_skips_unchanged_documents(tmp_path):
+    paths = write_docs(tmp_path, 5)
+    cache = {}
+    first, checked = run_checks(paths, cache, jobs=1)
+    assert checked == 5
+
+    second, checked = run_checks(paths, cache, jobs=1)
+    assert checked == 0
+    assert second == first
+
+    paths[1].write_text("# Rewritten\n", encoding="utf-8")
+    (tmp_path / "doc2.yaml").write_text("document_type: lore\n", encoding="utf-8")
+    third, checked = run_checks(paths, cache, jobs=1)
+    assert checked == 2
+    assert third[str(paths[1])]["lost"] != first[str(paths[1])]["lost"]
+    assert third[str(paths[2])] == {"lost": validate_document(paths[2]), "lint": lint_file(paths[2])}
+
+
+def test_parallel_matches_serial(tmp_path):
+    paths = write_docs(tmp_path, 12)
+    serial, _ = run_checks(paths, jobs=1)
+    parallel, checked = run_checks(paths, jobs=2)
+    assert checked == len(paths)
+    assert parallel == serial
+
+
+def test_paired_yaml_is_parsed_once(tmp_path, monkeypatch):
+
+    path = tmp_path / "paired.md"
+    path.write_text("# Paired\n", encoding="utf-8")
+    path.with_suffix(".yaml").write_text("document_type: charter\ntitle: Paired\n", encoding="utf-8")
+    expected = {"lost": validate_document(path), "lint": lint_file(path)}
+
+    calls = []
+    for name in ("safe_load", "safe_load_all"):
+        real = getattr(yaml, name)
+        monkeypatch.setattr(yaml, name, lambda source, real=real, name=name: calls.append(name) or real(source))
+
+    assert check_document(LostDocument.load(path)) == expected
+    assert calls == ["safe_load_all"]
+
+
+def test_load_paired_matches_safe_load(tmp_path):
+    path = tmp_path / "doc.md"
+    path.write_text("# Doc\n", encoding="utf-8")
+    for source in ("a: 1\n", "", "a: 1\n---\nb: 2\n", "a: [1\n"):
+        doc = LostDocument(path, b"# Doc\n", source.encode("utf-8"))
+        try:
+            expected = yaml.safe_load(source)
+        except yaml.YAMLError as e:
+            with pytest.raises(type(e)):
+                doc.load_paired()
+        else:
+            assert doc.load_paired() == expected
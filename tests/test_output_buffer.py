@@ -0,0 +1,71 @@
+# tests/test_output_buffer.py
+from __future__ import annotations
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+tk = pytest.importorskip("tkinter")
+
+from terminals.output_buffer import OutputBuffer
+
+
+def make_text_widget():
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        pytest.skip(f"no display: {e}")
+    root.withdraw()
+    return root, tk.Text(root, state=tk.DISABLED)
+
+
+def test_take_runs_coalesces_consecutive_tags():
+    buffer = OutputBuffer(widget=None, max_lines=100)
+    for text, tag in [("a", None), ("b", None), ("c", "error"), ("d", "error"), ("e", None)]:
+        buffer.write(text, tag)
+
+    assert buffer.take_runs() == [("a\nb\n", None), ("c\nd\n", "error"), ("e\n", None)]
+    assert buffer.take_runs() == []
+
+
+def test_backlog_is_bounded():
+    buffer = OutputBuffer(widget=None, max_lines=10, max_pending=100)
+    for i in range(250):
+        buffer.write(str(i))
+
+    assert buffer.dropped == 150
+    runs = buffer.take_runs()
+    # Only what would survive trimming is inserted
+    assert runs == [("".join(f"{i}\n" for i in range(240, 250)), None)]
+
+
+def test_flush_inserts_trims_and_sustains_agent_output_rate():
+    root, widget = make_text_widget()
+    try:
+        buffer = OutputBuffer(widget, max_lines=1000)
+
+        def agent(n):
+            for i in range(5000):
+                buffer.write(f"agent{n} line {i}", "error" if i % 100 == 0 else None)
+
+        start = time.perf_counter()
+        threads = [threading.Thread(target=agent, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        while any(thread.is_alive() for thread in threads) or buffer.pending:
+            buffer.flush()
+            root.update()
+        elapsed = time.perf_counter() - start
+
+        lines = widget.get("1.0", "end-1c").splitlines()
+        assert len(lines) == 1000
+        assert widget.cget("state") == tk.DISABLED
+        assert 20000 / elapsed > 10000
+    finally:
+        root.destroy()
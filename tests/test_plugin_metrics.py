@@ -0,0 +1,98 @@
+# tests/test_plugin_metrics.py
+from __future__ import annotations
+import asyncio
+import json
+import random
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from infrastructure.plugin_metrics import LatencyHistogram, PluginMetrics, metrics_to_prometheus
+
+
+def test_histogram_percentiles_within_bucket_precision():
+    rng = random.Random(3)
+    values = sorted(rng.uniform(0.0005, 0.5) for _ in range(10000))
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+
+    assert histogram.count == 10000
+    assert len(histogram.counts) < 400
+    for percent in (50, 95, 99):
+        exact = values[int(percent / 100 * len(values)) - 1]
+        assert abs(histogram.percentile(percent) - exact) / exact < 0.04
+    assert histogram.percentile(100) <= histogram.max
+
+
+def test_bucket_bounds_contain_recorded_value():
+    for micros in (0, 1, 31, 63, 64, 65, 1000, 123456, 10 ** 9):
+        lower, upper = LatencyHistogram.bucket_bounds(LatencyHistogram.bucket_index(micros / 1e6))
+        assert lower <= micros / 1e6 <= upper
+
+
+def test_plugin_metrics_ring_buffers_are_bounded():
+    metrics = PluginMetrics(recent_calls=8, recent_errors=4)
+    for i in range(50):
+        metrics.record(i % 2 == 0, 0.001 * i, error=f"boom {i}", extension_point="post_consensus")
+
+    snapshot = metrics.snapshot()
+    assert snapshot["total_calls"] == 50
+    assert snapshot["error_count"] == 25
+    assert len(metrics.recent) == 8
+    assert len(metrics.errors) == 4
+    assert snapshot["last_errors"][-1]["error"] == "boom 49"
+    assert snapshot["recent_error_rate"] == 0.5
+    assert snapshot["extension_points"]["post_consensus"]["count"] == 50
+    assert 0 < snapshot["latency"]["p50"] < snapshot["latency"]["p99"] <= 0.049
+
+
+def test_execute_hooks_records_latency_and_exports():
+    from infrastructure.extensibility_framework import (
+        BaseIntegrationHook, ExtensibilityManager, ExtensionPoint, PluginMetadata, PluginType,
+    )
+
+    class SleepyHook(BaseIntegrationHook):
+        @property
+        def metadata(self) -> PluginMetadata:
+            return PluginMetadata(name="sleepy", version="1.0.0", description="", author="tests",
+                                  plugin_type=PluginType.INTEGRATION_HOOK,
+                                  extension_points=[ExtensionPoint.PRE_CONSENSUS])
+
+        async def handle_event(self, event_type, data):
+            await asyncio.sleep(0.002)
+            return {}
+
+        def get_supported_events(self):
+            return [ExtensionPoint.PRE_CONSENSUS.value]
+
+    manager = ExtensibilityManager()
+    manager.plugin_registry.register_plugin(SleepyHook())
+
+    async def run():
+        for _ in range(5):
+            await manager.execute_hooks(ExtensionPoint.PRE_CONSENSUS, {})
+
+    asyncio.run(run())
+
+    performance = manager.get_plugin_performance()[0]
+    assert performance["plugin_name"] == "sleepy"
+    assert performance["extension_points"]["pre_consensus"]["count"] == 5
+    assert performance["latency"]["p95"] >= 0.002
+
+    exported = json.loads(manager.export_plugin_metrics("json"))
+    assert exported["plugins"][0]["total_calls"] == 5
+
+    text = manager.export_plugin_metrics("prometheus")
+    assert 'codeverter_plugin_calls_total{plugin="sleepy"} 5' in text
+    assert 'extension_point="pre_consensus",quantile="0.99"' in text
+
+
+def test_prometheus_labels_are_escaped():
+    metrics = PluginMetrics()
+    metrics.record(True, 0.01)
+    text = metrics_to_prometheus([('we"ird', metrics)])
+    assert 'plugin="we\\"ird"' in text
@@ -0,0 +1,47 @@
+# tests/test_reality_canvas.py
+from __future__ import annotations
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+tk = pytest.importorskip("tkinter")
+
+from terminals.seraphina_reality_canvas import Cell, CellType, SERAPHINAInteractiveCanvas, visible_cell_range
+
+
+def test_visible_cell_range():
+    offsets = [5, 255, 505, 755, 1005]
+    assert visible_cell_range(offsets, 0, 100) == (0, 1)
+    assert visible_cell_range(offsets, 300, 600) == (1, 3)
+    assert visible_cell_range(offsets, 2000, 2500) == (4, 5)
+    assert visible_cell_range([], 0, 100) == (0, 0)
+
+
+def test_only_cells_near_viewport_are_materialized(monkeypatch):
+    monkeypatch.setattr(SERAPHINAInteractiveCanvas, "check_federation_health", lambda self: None)
+    try:
+        canvas = SERAPHINAInteractiveCanvas()
+    except tk.TclError as e:
+        pytest.skip(f"no display: {e}")
+    try:
+        canvas.cells = [Cell(id=str(i), cell_type=CellType.MARKDOWN, content=f"# cell {i}",
+                             output="\n".join(f"line {j}" for j in range(2000)))
+                        for i in range(2000)]
+        canvas.render_all_cells()
+        canvas.root.update()
+        assert 0 < len(canvas.cell_windows) < 50
+
+        canvas.canvas.yview_moveto(0.5)
+        canvas.root.update()
+        assert "0" not in canvas.cell_windows
+        assert any(1000 - 50 < int(cell_id) < 1000 + 50 for cell_id in canvas.cell_windows)
+
+        canvas.delete_cell(1500)
+        assert len(canvas.cells) == 1999 and len(canvas.cell_offsets) == 1999
+    finally:
+        canvas.root.destroy()
@@ -0,0 +1,137 @@
+# tests/test_ritual_engine.py
+from __future__ import annotations
+import os
+import random
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from seraphina_grimoire.ritual_engine import Grimoire, Ritual
+
+
+def reference_matches(trigger, context) -> bool:
+    """Trigger semantics before compilation and indexing"""
+    trig = trigger or ""
+    if isinstance(trig, dict):
+        return all(context.get(k) == v for k, v in trig.items())
+    if isinstance(trig, str):
+        try:
+            safe = {k: v for k, v in context.items() if isinstance(v, (int, float, str, bool))}
+            return bool(eval(trig, {"__builtins__": {}}, safe))
+        except Exception:
+            return trig.lower() in str(context).lower()
+    return False
+
+
+TRIGGERS = [
+    None, "", "score >= 1.0", "flag == True", "not flag", "flag and score > 2", "1 or missing",
+    "score >", "'calm'", "mood", "calm", "mood == 'calm'", "len(mood) > 2", "-score < 0",
+    {"flag": True}, {"mood": "calm", "score": 3}, {"missing": None}, {"tags": ["a"]}, {}, 42,
+]
+
+
+def random_context(rng: random.Random) -> dict:
+    context = {}
+    if rng.random() < 0.7:
+        context["score"] = rng.choice([0, 1, 1.0, 2.5, 3, True])
+    if rng.random() < 0.6:
+        context["flag"] = rng.choice([True, False, 1, 0])
+    if rng.random() < 0.5:
+        context["mood"] = rng.choice(["calm", "wild", "score >= 1.0"])
+    if rng.random() < 0.3:
+        context["tags"] = rng.choice([["a"], ["b"]])
+    return context
+
+
+def make_grimoire(triggers) -> Grimoire:
+    grimoire = Grimoire(ROOT)
+    grimoire.rituals = [Ritual({"id": f"r{i}", "trigger": t}) for i, t in enumerate(triggers)]
+    grimoire.build_index()
+    return grimoire
+
+
+def test_indexed_scan_matches_reference_semantics(capsys):
+    rng = random.Random(5)
+    grimoire = make_grimoire(TRIGGERS * 3)
+
+    for _ in range(300):
+        context = random_context(rng)
+        expected = [r.id for r in grimoire.rituals if reference_matches(r.trigger, context)]
+        assert grimoire.scan_triggers(context) == expected
+        assert [r.id for r in grimoire.rituals if r.matches(context)] == expected
+
+
+def test_scan_evaluates_only_candidate_rituals(capsys):
+    triggers = [{"event": f"e{i}"} for i in range(1000)] + [f"counter_{i} > 0" for i in range(1000)]
+    grimoire = make_grimoire(triggers)
+
+    evaluate = grimoire.candidates({"event": "e7", "counter_3": 1}, {"event": "e7", "counter_3": 1})
+    assert len(evaluate) == 2
+    assert grimoire.scan_triggers({"event": "e7", "counter_3": 1}) == ["r7", "r1003"]
+
+
+def test_index_rebuilds_when_rituals_are_added(capsys):
+    grimoire = make_grimoire(["flag == True"])
+    grimoire.rituals.append(Ritual({"id": "late", "trigger": {"mood": "calm"}}))
+    assert grimoire.scan_triggers({"flag": True, "mood": "calm"}) == ["r0", "late"]
+
+
+OLD_MTIME_NS = 1_600_000_000 * 10**9
+
+
+def write_ritual(path: Path, ritual_id: str, trigger: str, extra: str = "", mtime_ns: int = OLD_MTIME_NS):
+    path.write_text(f"id: {ritual_id}\ntrigger: {trigger}\neffects: []\n{extra}", encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_load_uses_snapshot_and_reparses_only_changed_files(tmp_path):
+    for i in range(20):
+        write_ritual(tmp_path / f"r{i:02d}.yaml", f"R{i}", f"score >= {i}")
+    write_ritual(tmp_path / "dated.yaml", "DATED", "flag == True", "created: 2024-01-01\n")
+
+    first = Grimoire(tmp_path, workers=4)
+    first.load()
+    assert first.load_stats["parsed"] == 21
+    assert (tmp_path / ".grimoire_cache.json").exists()
+
+    second = Grimoire(tmp_path)
+    second.load()
+    # The dated manifest does not survive JSON and is always re-parsed
+    assert second.load_stats["parsed"] == 1
+    assert [r.data for r in second.rituals] == [r.data for r in first.rituals]
+
+    write_ritual(tmp_path / "r05.yaml", "R5", "score >= 100", "# edited\n", OLD_MTIME_NS + 10**9)
+    third = Grimoire(tmp_path)
+    third.load()
+    assert third.load_stats["parsed"] == 2
+    assert next(r for r in third.rituals if r.id == "R5").trigger == "score >= 100"
+
+
+def test_corrupt_snapshot_falls_back_to_parsing(tmp_path):
+    write_ritual(tmp_path / "a.yaml", "A", "flag == True")
+    (tmp_path / ".grimoire_cache.json").write_text("{not json", encoding="utf-8")
+
+    grimoire = Grimoire(tmp_path)
+    grimoire.load()
+    assert [r.id for r in grimoire.rituals] == ["A"]
+    assert grimoire.load_stats["parsed"] == 1
+
+
+def test_recently_modified_files_are_not_snapshotted(tmp_path):
+    path = tmp_path / "fresh.yaml"
+    write_ritual(path, "A", "flag == True", mtime_ns=None)
+    first = Grimoire(tmp_path)
+    first.load()
+
+    # Same size, same mtime: only a re-parse can see the edit
+    mtime_ns = path.stat().st_mtime_ns
+    write_ritual(path, "B", "flag == True", mtime_ns=mtime_ns)
+    second = Grimoire(tmp_path)
+    second.load()
+    assert second.load_stats["parsed"] == 1
+    assert [r.id for r in second.rituals] == ["B"]
+    assert not (tmp_path / ".grimoire_cache.json.tmp").exists()
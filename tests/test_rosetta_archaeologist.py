@@ -0,0 +1,84 @@
+# tests/test_rosetta_archaeologist.py
+from __future__ import annotations
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+for path in (ROOT, ROOT / "tools"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+import rosetta_archaeologist as ra
+from scripts.file_hashes import FileHashCache
+
+SCHOOL = """---
+law:
+  safety_tier: {i}
+lore:
+  heart_imprints: ["seed {i}"]
+---
+# School {i}
+
+## Operations
+- ✅ conjure {i}
+- ✅ banish
+
+## Constraints
+- ❌ never at dawn
+
+## Examples
+```codecraft
+::school{i}: invoke
+```
+
+💖 //<3 kindness {i}
+"""
+
+
+def write_schools(root: Path, count: int) -> list[Path]:
+    paths = []
+    for i in range(count):
+        path = root / f"school{i}.md"
+        path.write_text(SCHOOL.format(i=i), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def test_cached_extraction_matches_and_skips_unchanged(tmp_path, monkeypatch):
+    paths = write_schools(tmp_path, 6)
+    cache = tmp_path / "extract.json"
+    hashes = FileHashCache(None)  # keep the repo's shared hash cache out of tests
+    expected = {p: ra.extract_school_file(str(p)) for p in paths}
+
+    extracted = []
+    real = ra.extract_school_file
+    monkeypatch.setattr(ra, "extract_school_file", lambda p: extracted.append(p) or real(p))
+
+    assert ra.extract_school_files(paths, cache, jobs=1, hashes=hashes) == expected
+    assert len(extracted) == 6
+
+    extracted.clear()
+    assert ra.extract_school_files(paths, cache, jobs=1, hashes=hashes) == expected
+    assert extracted == []
+
+    paths[2].write_text(SCHOOL.format(i=99), encoding="utf-8")
+    result = ra.extract_school_files(paths, cache, jobs=1, hashes=hashes)
+    assert extracted == [str(paths[2])]
+    assert result[paths[2]]["operations"] == ["conjure 99", "banish"]
+    assert result[paths[0]] == expected[paths[0]]
+
+
+def test_identical_files_are_not_aliased(tmp_path):
+    a, b = tmp_path / "a.md", tmp_path / "b.md"
+    a.write_text(SCHOOL.format(i=1), encoding="utf-8")
+    b.write_text(SCHOOL.format(i=1), encoding="utf-8")
+    result = ra.extract_school_files([a, b], None, jobs=1, hashes=FileHashCache(None))
+    assert result[a] == result[b]
+    assert result[a]["front_matter"] is not result[b]["front_matter"]
+
+
+def test_parallel_extraction_matches_serial(tmp_path):
+    paths = write_schools(tmp_path, 8)
+    hashes = FileHashCache(None)
+    assert (ra.extract_school_files(paths, None, jobs=2, hashes=hashes)
+            == ra.extract_school_files(paths, None, jobs=1, hashes=hashes))
@@ -82,3 +82,26 @@ def test_only_one_real_integrity_block_under_metadata(tmp_path: Path):
     # If fixer ever appended, it would be the last lines of file; catch that:
     tail = "\n".join(lines[-10:])
     assert not re.search(r"^\s*integrity:\s*$", tail, re.M), "Duplicate integrity block detected near EOF"
+
+def test_streaming_hash_matches_text_hash(tmp_path: Path):
+    from scripts.rosetta_integrity import canonical_hash_from_file, canonical_hashes
+    samples = [
+        "", "\n", "\n\n", "a", "a\n", "a\n\n", "a\r\nb\rc\r\n", "\r",
+        "metadata:\n  integrity:\n    sha256: " + "0" * 64 + "\n",
+        "metadata:\n  integrity:\n    sha256: x\n",
+        "```yaml\nmetadata:\n  title: x\n  integrity:\n    sha256: x\n  status: ok\n```\ntail",
+        "é ✓ 🌌\n" * 5000 + "metadata:\n  integrity:\n    algo: sha256\n",
+    ]
+    paths = []
+    for i, text in enumerate(samples):
+        path = tmp_path / f"doc{i}.md"
+        path.write_bytes(text.encode("utf-8"))
+        expected = canonical_hash_from_text(_read(path))
+        for chunk_size in (1, 7, 1 << 16):
+            assert canonical_hash_from_file(path, chunk_size) == expected, (text[:40], chunk_size)
+        paths.append(path)
+    paths.append(ROSETTA)
+
+    expected = {str(p): canonical_hash_from_text(_read(p)) for p in paths}
+    assert canonical_hashes(paths, workers=2) == expected
+    assert canonical_hashes(paths, workers=1) == expected
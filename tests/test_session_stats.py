@@ -0,0 +1,49 @@
+# tests/test_session_stats.py
+from __future__ import annotations
+import random
+import statistics
+import sys
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from infrastructure.session_stats import RunningStats, SessionAggregates
+
+
+def test_running_stats_matches_population_variance():
+    values = [random.Random(3).uniform(0, 10) for _ in range(200)]
+    stats = RunningStats.from_values(values)
+    assert abs(stats.mean - statistics.fmean(values)) < 1e-9
+    assert abs(stats.variance - statistics.pvariance(values)) < 1e-9
+
+
+def test_running_stats_sliding_window():
+    rng = random.Random(5)
+    window, stats = [], RunningStats()
+    for _ in range(500):
+        value = rng.randint(1, 10)
+        window.append(value)
+        stats.add(value)
+        if len(window) > 50:
+            stats.remove(window.pop(0))
+    assert stats.count == 50
+    assert abs(stats.mean - statistics.fmean(window)) < 1e-9
+    assert abs(stats.variance - statistics.pvariance(window)) < 1e-6
+
+
+def test_recent_patterns_keep_last_ten_interactions():
+    aggregates = SessionAggregates()
+    timestamp = datetime(2025, 1, 1, 14, 30).isoformat()
+    for i in range(25):
+        aggregates.record_interaction({
+            "timestamp": timestamp,
+            "data": {"type": "transform" if i % 2 else "review", "quality_level": i}
+        })
+    patterns = aggregates.recent_patterns()
+    assert patterns["most_active_hour"] == 14
+    assert sorted(patterns["common_request_types"]) == ["review", "transform"]
+    assert patterns["avg_quality_level"] == statistics.fmean(range(15, 25))
+    assert SessionAggregates().recent_patterns() == {}
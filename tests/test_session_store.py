@@ -0,0 +1,71 @@
+# tests/test_session_store.py
+from __future__ import annotations
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from infrastructure.session_store import SQLiteSessionStore
+
+
+def _session(session_id: str, last_updated: datetime) -> dict:
+    return {
+        "session_id": session_id,
+        "user_id": "architect",
+        "preferences": {"quality_level": 7},
+        "learned_patterns": {"model_preferences": {"claude_sonnet": 2}},
+        "performance_metrics": {},
+        "created_at": last_updated.isoformat(),
+        "last_updated": last_updated.isoformat(),
+    }
+
+
+def test_session_survives_reopen(tmp_path: Path):
+    db = tmp_path / "sessions.db"
+    store = SQLiteSessionStore(db, batch_size=1000, flush_interval=3600)
+    store.save_session(_session("s1", datetime.now()))
+    for i in range(5):
+        store.append_interaction("s1", {"type": "interaction", "data": {"n": i}})
+    assert store.get_stats()["pending_interactions"] == 5  # write-behind, nothing flushed yet
+    store.close()
+
+    reopened = SQLiteSessionStore(db)
+    loaded = reopened.load_session("s1")
+    assert loaded["preferences"] == {"quality_level": 7}
+    assert [e["data"]["n"] for e in loaded["interaction_history"]] == [0, 1, 2, 3, 4]
+    assert reopened.load_session("missing") is None
+    reopened.close()
+
+
+def test_batch_size_triggers_single_transaction_flush():
+    store = SQLiteSessionStore(":memory:", batch_size=10, flush_interval=3600)
+    store.save_session(_session("s1", datetime.now()))
+    for i in range(25):
+        store.append_interaction("s1", {"n": i})
+    stats = store.get_stats()
+    assert stats["flush_count"] == 2
+    assert stats["pending_interactions"] == 5
+
+
+def test_history_is_trimmed_to_max_items():
+    store = SQLiteSessionStore(":memory:", batch_size=7, max_history_items=10)
+    store.save_session(_session("s1", datetime.now()))
+    for i in range(30):
+        store.append_interaction("s1", {"n": i})
+    history = store.load_session("s1")["interaction_history"]
+    assert [e["n"] for e in history] == list(range(20, 30))
+
+
+def test_expiry_uses_last_updated():
+    store = SQLiteSessionStore(":memory:")
+    now = datetime.now()
+    store.save_session(_session("old", now - timedelta(days=40)))
+    store.save_session(_session("new", now))
+    store.append_interaction("old", {"n": 1})
+    expired = store.delete_sessions_before(now - timedelta(days=30))
+    assert expired == ["old"]
+    assert store.count_sessions() == 1
+    assert store.load_session("old") is None
@@ -0,0 +1,65 @@
+# tests/test_vibe_scanner.py
+from __future__ import annotations
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.comment_parser_charter import CommentParser
+from core.vibe_scanner import aggregate_stats, iter_source_files, scan_file, scan_files
+
+
+def make_tree(root: Path):
+    (root / "src" / "nested").mkdir(parents=True)
+    (root / "src" / "node_modules").mkdir()
+    (root / "src" / "main.cc").write_text("//!? MUST NOT claim agency\nint x;\n//-> chose stdout\n", encoding="utf-8")
+    (root / "src" / "nested" / "tool.py").write_text("#/// canonical\nimport os\n#//<3 proud of this\n", encoding="utf-8")
+    (root / "src" / "notes.txt").write_text("//! not a source suffix\n", encoding="utf-8")
+    (root / "src" / "node_modules" / "dep.js").write_text("//! skipped\n", encoding="utf-8")
+
+
+def test_iter_source_files(tmp_path):
+    make_tree(tmp_path)
+    src = tmp_path / "src"
+    assert iter_source_files([str(src)]) == [str(src / "main.cc"), str(src / "nested" / "tool.py")]
+    assert iter_source_files([str(src / "notes.txt")]) == [str(src / "notes.txt")]
+    assert iter_source_files([str(src / "**" / "*.py")]) == [str(src / "nested" / "tool.py")]
+    assert iter_source_files([str(tmp_path / "missing")]) == []
+
+
+def test_scan_file_matches_parser(tmp_path):
+    make_tree(tmp_path)
+    path = tmp_path / "src" / "main.cc"
+    result = scan_file(str(path))
+    assert [(c["line"], c["name"]) for c in result.comments] == [(1, "GUARDRAIL"), (3, "STRATEGIC_DECISION")]
+    assert result.comments[0]["council_oversight"] and result.comments[1]["export_to"] == "CMP_ADR"
+
+    parser = CommentParser()
+    for line in path.read_text(encoding="utf-8").splitlines():
+        parser.parse_line(line)
+    assert result.stats == parser.get_stats()
+
+    missing = scan_file(str(tmp_path / "missing.cc"))
+    assert missing.error and missing.comments == []
+
+
+def test_pool_scan_preserves_order_and_totals(tmp_path):
+    make_tree(tmp_path)
+    files = iter_source_files([str(tmp_path / "src")]) * 20
+    serial = [r.to_dict() for r in scan_files(files, workers=1)]
+    pooled = [r.to_dict() for r in scan_files(files, workers=2)]
+    assert pooled == serial
+
+    totals = aggregate_stats(scan_files(files, workers=1))
+    assert totals == {
+        "files_scanned": 40, "files_failed": 0, "total_comments_parsed": 80,
+        "law_comments_found": 40, "lore_comments_found": 40, "guardrails_detected": 20,
+    }
+
+
+def test_line_numbers_only_count_newlines(tmp_path):
+    path = tmp_path / "feed.c"
+    path.write_text("int a;\f\n//! x\nint b;\x0b \n//! y\n", encoding="utf-8")
+    assert [c["line"] for c in scan_file(str(path)).comments] == [2, 4]
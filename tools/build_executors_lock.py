@@ -23,6 +23,14 @@ from pathlib import Path
 from datetime import datetime, timezone
 from typing import Dict, Any, List
 
+# --- path bootstrap (shared hashing lives in scripts/) ---
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+# ---------------------------------------------------------
+
+from scripts import file_hashes
+
 try:
     import yaml
 except ImportError:
@@ -34,12 +42,8 @@ except ImportError:
 # ═══════════════════════════════════════════════════════════════════════════
 
 def sha256_file(path: Path) -> str:
-    """Compute SHA-256 hash of file contents."""
-    h = hashlib.sha256()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(65536), b""):
-            h.update(chunk)
-    return h.hexdigest()
+    """Compute SHA-256 hash of file contents (shared stat-keyed cache)."""
+    return file_hashes.sha256_file(path)
 
 def sha256_text(text: str) -> str:
     """Compute SHA-256 hash of text string."""
@@ -17,11 +17,18 @@ Output:
 import sys
 import os
 import re
-import hashlib
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Dict, Any, List
 
+# --- path bootstrap (shared hashing lives in scripts/) ---
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+# ---------------------------------------------------------
+
+from scripts import file_hashes
+
 try:
     import yaml
 except ImportError:
@@ -46,12 +53,8 @@ PARTITION_MAP = {
 # ═══════════════════════════════════════════════════════════════════════════
 
 def sha256_file(path: Path) -> str:
-    """Compute SHA-256 hash of file contents."""
-    h = hashlib.sha256()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(65536), b""):
-            h.update(chunk)
-    return h.hexdigest()
+    """Compute SHA-256 hash of file contents (shared stat-keyed cache)."""
+    return file_hashes.sha256_file(path)
 
 FRONT_MATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n?', re.DOTALL)
 
@@ -169,6 +172,14 @@ def build_partitions_lock(lexicon_root: Path, output_path: Path):
         "migrations": [],
     }
     
+    # Hash every partition file up front (cached files skip the read; misses hash in parallel)
+    file_hashes.hash_many(
+        md_file
+        for folder_name in PARTITION_MAP
+        for md_file in (lexicon_root / folder_name).rglob("*.md")
+        if md_file.name.upper() != "README.MD"
+    )
+    
     # Scan each partition folder
     for folder_name, partition_name in PARTITION_MAP.items():
         folder_path = lexicon_root / folder_name
@@ -18,19 +18,24 @@ Key Principles:
 - Front-matter YAML in school files = first-class machine metadata
 - Drift detection: 21 tokens → 19 schools, all files present
 - Provenance: sha256 + mtime for every source file
+- Incremental: school extraction is cached by file hash; only changed files are re-read
 
 Usage:
   python scripts/rosetta_archaeologist.py --root . --out canon.lock.yaml
   python scripts/rosetta_archaeologist.py --root . --out canon.lock.yaml --render_rosetta
+  python scripts/rosetta_archaeologist.py extract --out canon.lock.yaml --jobs 4 --no_cache  # cold parallel build
 """
 from __future__ import annotations
 import argparse
+import copy
 import hashlib
+import json
 import os
 import re
 import sys
 import time
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, List, Tuple, Optional
 
@@ -40,6 +45,14 @@ except ImportError:
     print("ERROR: PyYAML required: pip install pyyaml", file=sys.stderr)
     sys.exit(2)
 
+# --- path bootstrap (shared hashing lives in scripts/) ---
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+# ---------------------------------------------------------
+
+from scripts import file_hashes
+
 # ---------- Tiny Markdown Helpers (Stable & Deterministic) ----------
 H1 = re.compile(r'^\s*#\s+(?P<text>.+?)\s*$')
 H2 = re.compile(r'^\s*##\s+(?P<text>.+?)\s*$')
@@ -131,12 +144,8 @@ def extract_fences(lines: List[str], langs=("codecraft", "ccraft")) -> List[str]
     return out
 
 def sha256_path(p: Path) -> str:
-    """Compute sha256 hash of file."""
-    h = hashlib.sha256()
-    with p.open('rb') as f:
-        for chunk in iter(lambda: f.read(65536), b''):
-            h.update(chunk)
-    return h.hexdigest()
+    """Compute sha256 hash of file (shared stat-keyed cache)."""
+    return file_hashes.sha256_file(p)
 
 def git_head(root: Path) -> Optional[str]:
     """Get current git HEAD sha, None if not in git repo."""
@@ -291,6 +300,83 @@ def extract_commentomancy_schema(law_md: str, extra: List[Path]) -> Dict[str, An
     schema["observed_lines"] = list(dict.fromkeys(schema["observed_lines"]))
     return schema
 
+# ---------- Incremental School Extraction ----------
+EXTRACT_CACHE = ".rosetta_extract_cache.json"  # {school file sha256: extract_school_file result}
+
+def extract_school_file(path: str) -> Dict[str, Any]:
+    """Everything build_canon derives from one school markdown file (runs in worker processes)."""
+    fm, body = parse_front_matter(read_text(Path(path)))
+    ops, cons, exs = detect_ops_cons_examples(parse_sections(body))
+    return {
+        "front_matter": fm,
+        "operations": ops,
+        "constraints": cons,
+        "examples": exs,
+        "prose_lore": extract_commentomancy_lore(body),
+    }
+
+def extractor_hash() -> str:
+    """Hash of this module; cached extractions are dropped whenever the extractors change."""
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+def load_extract_cache(cache_path: Path, extractor: str) -> Dict[str, Any]:
+    try:
+        data = json.loads(cache_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("extractor") != extractor:
+        return {}
+    return data.get("files", {})
+
+def save_extract_cache(cache_path: Path, extractor: str, entries: Dict[str, Any]):
+    tmp = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        tmp.write_text(json.dumps({"extractor": extractor, "files": entries}, ensure_ascii=False), encoding='utf-8')
+        os.replace(tmp, cache_path)
+    except OSError:
+        pass  # read-only checkout: extract without a cache
+
+def _json_exact(result: Dict[str, Any]) -> bool:
+    """True if result survives a JSON round trip unchanged (front-matter dates or int keys would not)."""
+    try:
+        return json.loads(json.dumps(result)) == result
+    except (TypeError, ValueError):
+        return False
+
+def extract_school_files(paths: List[Path], cache_path: Optional[Path] = None,
+                         jobs: Optional[int] = None,
+                         hashes: Optional[file_hashes.FileHashCache] = None) -> Dict[Path, Dict[str, Any]]:
+    """
+    extract_school_file for every path, re-extracting only files whose content
+    hash is not in the cache at cache_path (None = no cache). Uncached files
+    are extracted in a process pool unless jobs == 1. Content hashes come from
+    hashes (default: the shared file_hashes cache).
+    """
+    hashes = file_hashes.default_cache() if hashes is None else hashes
+    digests = hashes.hash_many(paths)
+    extractor = extractor_hash()
+    cached = load_extract_cache(cache_path, extractor) if cache_path is not None else {}
+    
+    dirty: Dict[str, str] = {}  # sha256 -> path (identical files are extracted once)
+    for p in paths:
+        digest = digests[str(p)]
+        if digest not in cached:
+            dirty.setdefault(digest, str(p))
+    
+    if jobs == 1 or len(dirty) <= 1:
+        fresh = list(map(extract_school_file, dirty.values()))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            fresh = list(pool.map(extract_school_file, dirty.values()))
+    results = {**cached, **dict(zip(dirty, fresh))}
+    
+    if cache_path is not None and (dirty or len(cached) != len(set(digests.values()))):
+        used = {d: results[d] for d in digests.values()}
+        save_extract_cache(cache_path, extractor, {d: r for d, r in used.items() if _json_exact(r)})
+    
+    # Each school gets its own copy so the canon never aliases objects between schools
+    return {p: copy.deepcopy(results[digests[str(p)]]) for p in paths}
+
 # ---------- Build Canon ----------
 def build_canon(root: Path, args) -> Dict[str, Any]:
     """
@@ -302,6 +388,15 @@ def build_canon(root: Path, args) -> Dict[str, Any]:
     mapping_md = read_text(root / args.grammar_map)
     law_md = read_text(root / args.law)
     comment_dir = root / args.commentomancy
+    comment_files = sorted(comment_dir.glob("*.md")) if comment_dir.exists() else []
+    
+    # Hash every source file up front (cached files skip the read; misses hash in parallel)
+    school_files = [schools_dir / spec["file"] for spec in schools_map.get("schools", {}).values() if spec.get("file")]
+    file_hashes.hash_many(
+        [p for p in school_files if p.exists()]
+        + [root / args.ebnf, root / args.grammar_map, root / args.law]
+        + comment_files
+    )
     
     # Provenance (track every source file)
     prov = {
@@ -330,6 +425,10 @@ def build_canon(root: Path, args) -> Dict[str, Any]:
         ],
     }
     
+    # Extract school markdown (unchanged files come from the extraction cache)
+    cache_path = None if getattr(args, 'no_cache', False) else root / getattr(args, 'extract_cache', EXTRACT_CACHE)
+    extracted = extract_school_files([p for p in school_files if p.exists()], cache_path, getattr(args, 'jobs', None))
+    
     # Build schools (walk each markdown file)
     schools: Dict[str, Any] = {}
     for sid, spec in schools_map.get("schools", {}).items():
@@ -353,15 +452,13 @@ def build_canon(root: Path, args) -> Dict[str, Any]:
         
         if md_path and md_path.exists():
             track(md_path)
-            full = read_text(md_path)
-            fm, body = parse_front_matter(full)
-            sections = parse_sections(body)
-            ops, cons, exs = detect_ops_cons_examples(sections)
+            result = extracted[md_path]
+            fm = result["front_matter"]
             
             # Legacy fields (for backwards compatibility)
-            entry["operations"] = ops
-            entry["constraints"] = cons
-            entry["examples"] = exs
+            entry["operations"] = result["operations"]
+            entry["constraints"] = result["constraints"]
+            entry["examples"] = result["examples"]
             
             # Extract Law from front-matter YAML
             if fm.get("law"):
@@ -377,7 +474,7 @@ def build_canon(root: Path, args) -> Dict[str, Any]:
                 lore_combined = fm["lore"].copy()
             
             # Prose commentomancy Lore (append to structured)
-            prose_lore = extract_commentomancy_lore(body)
+            prose_lore = result["prose_lore"]
             for key, values in prose_lore.items():
                 if values:  # Only include non-empty lists
                     if key in lore_combined:
@@ -417,7 +514,6 @@ def build_canon(root: Path, args) -> Dict[str, Any]:
     track(root / args.ebnf)
     track(root / args.grammar_map)
     
-    comment_files = sorted(comment_dir.glob("*.md")) if comment_dir.exists() else []
     for p in comment_files:
         track(p)
     
@@ -668,6 +764,9 @@ def main():
         legacy_parser.add_argument('--out', default='canon.lock.yaml')
         legacy_parser.add_argument('--render_rosetta', action='store_true')
         legacy_parser.add_argument('--rosetta_path', default='CODECRAFT_ROSETTA_STONE.md')
+        legacy_parser.add_argument('--jobs', type=int, default=None)
+        legacy_parser.add_argument('--no_cache', action='store_true')
+        legacy_parser.add_argument('--extract_cache', default=EXTRACT_CACHE)
         args = legacy_parser.parse_args()
         
         sys.exit(cmd_extract(args))
@@ -689,6 +788,9 @@ def main():
     p_ext.add_argument('--spec', default='2.2', help="Canon spec version")
     p_ext.add_argument('--render_rosetta', action='store_true', help="Render Rosetta Stone")
     p_ext.add_argument('--rosetta_path', default='CODECRAFT_ROSETTA_STONE.md', help="Rosetta output")
+    p_ext.add_argument('--jobs', type=int, default=None, help="Worker processes for re-extracting changed school files (default: CPU count)")
+    p_ext.add_argument('--no_cache', action='store_true', help="Re-extract every school file without the extraction cache")
+    p_ext.add_argument('--extract_cache', default=EXTRACT_CACHE, help="Per-file extraction cache (relative to --root)")
     
     # verify subcommand
     p_ver = sub.add_parser("verify", help="Verify canon.lock schema and integrity")
@@ -14,10 +14,17 @@ Requirements:
     pip install pyyaml
 """
 import sys
-import hashlib
 from pathlib import Path
 from typing import Dict, Any, List, Set
 
+# --- path bootstrap (shared hashing lives in scripts/) ---
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+# ---------------------------------------------------------
+
+from scripts import file_hashes
+
 try:
     import yaml
 except ImportError:
@@ -44,12 +51,8 @@ REQUIRED_FIELDS = ["id", "title", "kind", "version", "status", "provenance", "ha
 # ═══════════════════════════════════════════════════════════════════════════
 
 def sha256_file(path: Path) -> str:
-    """Compute SHA-256 hash of file contents."""
-    h = hashlib.sha256()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(65536), b""):
-            h.update(chunk)
-    return h.hexdigest()
+    """Compute SHA-256 hash of file contents (shared stat-keyed cache)."""
+    return file_hashes.sha256_file(path)
 
 # ═══════════════════════════════════════════════════════════════════════════
 # VALIDATORS
@@ -166,6 +169,15 @@ def validate_lock(lock_path: Path, lexicon_root: Path) -> bool:
     
     partitions = lock["partitions"]
     
+    # Hash every referenced file up front (cached files skip the read; misses hash in parallel)
+    referenced = [
+        lexicon_root / entry["provenance"]["path"]
+        for partition_name in REQUIRED_PARTITIONS
+        for entry in partitions.get(partition_name) or []
+        if isinstance(entry, dict) and entry.get("hash") and "path" in (entry.get("provenance") or {})
+    ]
+    file_hashes.hash_many(p for p in referenced if p.exists())
+    
     # Entry validation
     for partition_name in REQUIRED_PARTITIONS:
         if partition_name not in partitions: